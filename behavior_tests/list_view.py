@@ -0,0 +1,76 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+# the rows of a ListView are built by the rebuild, for the builder it was last given,
+# run from the project root: python -m behavior_tests.list_view
+
+from tg_gui.prelude import *
+from tg_gui import Text, ListView
+from tg_gui.core import rebuild
+from tg_gui.render import HeadlessRenderer
+
+
+def labels(screen: ListView) -> list[str]:
+    return [row.label for row in screen._visible_]
+
+
+# the first frame lays out the rows for the height it finds
+renderer = HeadlessRenderer(80, 48)
+screen = ListView(100, lambda index: Text(f"a{index}"), row_height=12)
+renderer.frame(screen)
+print("first frame:", labels(screen))
+assert labels(screen)[:4] == ["a0", "a1", "a2", "a3"], labels(screen)
+assert all(row._rect_ is not None for row in screen._visible_)
+
+
+# a parent passing a new builder with the same count
+class Page(Widget):
+    prefix: str = AttrDef("b", init=True)
+
+    body = Body[Self](
+        lambda self: ListView(100, lambda index: Text(f"{self.prefix}{index}"))
+    )
+
+
+page = Page()
+renderer.frame(page)
+listed = page._built_
+assert labels(listed)[0] == "b0", labels(listed)
+page.prefix = "c"
+renderer.frame(page)
+print("new builder:", page._built_ is listed, labels(listed)[:3])
+assert page._built_ is listed
+assert all(label.startswith("c") for label in labels(listed)), labels(listed)
+
+# no rows are built while laying out
+laying_out = [False]
+layout_list = ListView._layout_
+build_window = ListView._build_window
+
+
+def tracked_layout(self, *args):
+    laying_out[0] = True
+    try:
+        return layout_list(self, *args)
+    finally:
+        laying_out[0] = False
+
+
+def tracked_build(self):
+    assert not laying_out[0], "rows built during layout"
+    return build_window(self)
+
+
+ListView._layout_ = tracked_layout
+ListView._build_window = tracked_build
+screen.offset = 40 * 12
+renderer.frame(screen)
+# 2 rows of overscan above the viewport
+assert labels(screen)[0] == "a38", labels(screen)
+
+# refresh rebuilds the rows
+rows = screen._visible_
+screen.refresh()
+rebuild(screen)
+assert not set(rows) & set(screen._visible_)
+print("refreshed:", labels(screen)[:3])
@@ -0,0 +1,68 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+# a memoized body that reads another widget's State is re-evaluated on every write,
+# run from the project root: python -m behavior_tests.memo_state
+
+from tg_gui.prelude import *
+from tg_gui import Text
+from tg_gui.core import rebuild
+from tg_gui.core.memo import body_cache
+
+
+class Model(Widget):
+    count: int = State(0, init=True)
+
+    body = Body[Self](lambda self: self)
+
+
+model = Model()
+calls = []
+
+
+class Label(Widget):
+    model: Model = AttrDef(required=True)
+
+    @Body[Self].memoized
+    def body(self):
+        calls.append(self.model.count)
+        return Text(f"count {self.model.count}")
+
+
+label = Label(model)
+rebuild(label)
+print("built:", label._built_.label, calls)
+
+for value in (1, 2, 1):
+    model.count = value
+    rebuild(label)
+    print("count =", value, "->", label._built_.label, calls)
+    assert label._built_.label == f"count {value}", label._built_.label
+
+assert calls == [0, 1, 2, 1], calls
+print("body_cache:", body_cache.stats())
+
+
+# a memoized body reading its own States is cached, they are part of the key
+class Counter(Widget):
+    count: int = State(0, init=True)
+
+    @Body[Self].memoized
+    def body(self):
+        counts.append(self.count)
+        return Text(f"count {self.count}")
+
+
+counts = []
+counter = Counter()
+rebuild(counter)
+hits = body_cache.hits
+for value in (1, 0, 1, 2):
+    counter.count = value
+    rebuild(counter)
+    assert counter._built_.label == f"count {value}", counter._built_.label
+
+# 0 and 1 were cached, and 2 was still noticed after the hits
+print("own State:", counts, "hits:", body_cache.hits - hits)
+assert counts == [0, 1, 2], counts
+assert body_cache.hits - hits == 2
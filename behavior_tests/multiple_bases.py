@@ -0,0 +1,67 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+# a widget class with several widget base classes takes the arguments of all of them,
+# run from the project root: python -m behavior_tests.multiple_bases
+
+from tg_gui.prelude import *
+
+
+# a mixin base that only adds a body
+class Plain(Widget):
+    body = Body[Self](lambda self: self)
+
+
+class Sized(Widget):
+    x: int = AttrDef(required=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class Mixed(Plain, Sized):
+    y: int = AttrDef(required=True)
+
+
+print("Mixed args:", [spec.name for spec in Mixed._arg_specs_])
+assert [spec.name for spec in Mixed._arg_specs_] == ["x", "y"]
+mixed = Mixed(x=1, y=2)
+assert (mixed.x, mixed.y) == (1, 2)
+mixed = Mixed(1, 2)
+assert (mixed.x, mixed.y) == (1, 2)
+
+
+# a diamond, the shared base's attribute is an argument once
+class Root(Widget):
+    name: str = AttrDef(required=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class Left(Root):
+    left: int = AttrDef(0, init=True)
+
+
+class Right(Root):
+    right: int = AttrDef(required=True)
+
+
+class Diamond(Left, Right):
+    bottom: int = AttrDef(3, init=True)
+
+
+print("Diamond args:", [spec.name for spec in Diamond._arg_specs_])
+assert [spec.name for spec in Diamond._arg_specs_] == [
+    "name",
+    "left",
+    "right",
+    "bottom",
+]
+diamond = Diamond("d", right=2)
+assert (diamond.name, diamond.left, diamond.right, diamond.bottom) == ("d", 0, 2, 3)
+
+try:
+    Diamond("d")
+except TypeError as err:
+    print("missing argument:", err)
+else:
+    raise AssertionError("Diamond(...) without `right` should raise")
@@ -0,0 +1,79 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+# the widgets that leave the tree are dropped from the readers of the States they read,
+# run from the project root: python -m behavior_tests.state_readers
+
+from tg_gui.prelude import *
+from tg_gui import Text, ListView
+from tg_gui.core import rebuild
+from tg_gui.render import HeadlessRenderer
+
+import gc
+import weakref
+
+
+class Model(Widget):
+    unit: str = State("ms", init=True)
+
+    body = Body[Self](lambda self: self)
+
+
+model = Model()
+
+
+class Row(Widget):
+    index: int = AttrDef(required=True)
+
+    body = Body[Self](lambda self: Text(f"{self.index} {model.unit}"))
+
+
+def readers() -> int:
+    return sum(len(names) for names in (model._readers_ or {}).values())
+
+
+# rows scrolled out of a ListView
+built: list[weakref.ref] = []
+
+
+def row(index: int) -> Row:
+    widget = Row(index)
+    built.append(weakref.ref(widget))
+    return widget
+
+
+renderer = HeadlessRenderer(80, 48)
+screen = ListView(1000, row, row_height=12)
+for step in range(0, 200, 4):
+    screen.offset = step * 12
+    renderer.frame(screen)
+gc.collect()
+alive = sum(ref() is not None for ref in built)
+print("rows built:", len(built), "alive:", alive, "readers:", readers())
+assert alive == len(screen._visible_), alive
+assert readers() == alive, readers()
+
+model.unit = "s"
+renderer.frame(screen)
+assert screen._visible_[0]._built_.label.endswith(" s"), screen._visible_[
+    0
+]._built_.label
+
+
+# a subtree replaced by a re-evaluated body
+class Panel(Widget):
+    wide: bool = AttrDef(True, init=True)
+
+    body = Body[Self](lambda self: Row(1) if self.wide else Text(model.unit))
+
+
+panel = Panel()
+rebuild(panel)
+replaced = weakref.ref(panel._built_)
+assert replaced() in model._readers_["unit"]
+panel.wide = False
+rebuild(panel)
+gc.collect()
+print("replaced subtree alive:", replaced() is not None, "readers:", readers())
+assert replaced() is None
+assert readers() == len(screen._visible_) + 1  # and the panel
@@ -0,0 +1,5 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+# benchmarks are run from the project root as modules, ex:
+# `python -m benchmarks.widget_init`
@@ -0,0 +1,55 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Minimal timing and reporting helpers shared by the benchmarks. These only use
+`time.perf_counter` so the benchmarks run on plain CPython without extra packages.
+"""
+
+from __future__ import annotations
+
+# import the real time function before tg_gui patches the time module
+from time import perf_counter
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Sequence, Any
+
+
+def best_of(fn: Callable[[], Any], *, number: int = 1000, repeat: int = 5) -> float:
+    """
+    :returns: the best (lowest) mean time in seconds for one call of `fn` across
+    `repeat` runs of `number` calls each.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (perf_counter() - start) / number)
+    return best
+
+
+def timed(fn: Callable[[], Any]) -> tuple[float, Any]:
+    """:returns: (seconds, result) of a single call of `fn`"""
+    start = perf_counter()
+    result = fn()
+    return perf_counter() - start, result
+
+
+def table(title: str, headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """print a simple left-aligned text table"""
+    cells = [list(map(str, headers))] + [list(map(_fmt, row)) for row in rows]
+    widths = [max(len(row[col]) for row in cells) for col in range(len(headers))]
+    print(f"\n{title}")
+    for index, row in enumerate(cells):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
+
+
+def _fmt(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
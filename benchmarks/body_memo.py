@@ -0,0 +1,68 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares rebuilding a large, mostly static body (a settings page switching between a
+few tabs) with and without `Body[Self].memoized(...)`.
+"""
+
+from __future__ import annotations
+
+from ._harness import best_of, table
+
+from tg_gui.prelude import *
+from tg_gui import Group
+from tg_gui.core import rebuild
+from tg_gui.core.memo import body_cache
+
+
+class Label(Widget):
+    text: str = AttrDef(required=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class Setting(Widget):
+    name: str = AttrDef(required=True)
+
+    body = Body[Self](lambda self: Group((Label(self.name), Label("off"))))
+
+
+def _page(self: Widget) -> Widget:
+    tab: int = self.tab  # type: ignore
+    return Group(tuple(Setting(f"tab {tab} setting {index}") for index in range(100)))
+
+
+class SettingsPage(Widget):
+    tab: int = AttrDef(0, init=True)
+
+    body = Body[Self](_page)
+
+
+class MemoizedSettingsPage(SettingsPage):
+    body = Body[Self].memoized(_page)
+
+
+def main(tabs: int = 3, number: int = 50) -> None:
+    rows: list[tuple[object, ...]] = []
+    for cls in (SettingsPage, MemoizedSettingsPage):
+        page = cls()
+        rebuild(page)
+
+        def switch_tab() -> None:
+            page.tab = (page.tab + 1) % tabs  # type: ignore
+            rebuild(page)
+
+        rows.append((cls.__name__, best_of(switch_tab, number=number) * 1e3))
+
+    table("switching tabs (ms per switch)", ("page", "rebuild"), rows)
+    stats = body_cache.stats()
+    table(
+        "body cache",
+        tuple(stats.keys()) + ("hit rate",),
+        [tuple(stats.values()) + (body_cache.hit_rate(),)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures the cost of defining widget classes, as when importing a large widget library:
+N classes are defined in a hierarchy `depth` classes deep (each class subclasses the
+previous one in its chain), either only overriding `body` or also declaring a new
+attribute. Reports the time and the heap (traced allocations still alive) per class
+definition, and the time of each class's first instantiation, which compiles its
+specialized constructor.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from ._harness import table
+from tg_gui.platform_support import ticks_us, ticks_diff
+
+from tg_gui.core import Widget, Body, AttrDef
+
+
+def define(count: int, depth: int, new_attrs: bool) -> list[type]:
+    classes: list[type] = []
+    base: type = Widget
+    for index in range(count):
+        if index % depth == 0:
+            base = Widget
+        namespace = {"body": Body(lambda self: self)}
+        if new_attrs or base is Widget:
+            namespace[f"attr{index}"] = AttrDef(index, init=True)
+        base = type(f"Widget{index}", (base,), namespace)
+        classes.append(base)
+    return classes
+
+
+def run(count: int, depth: int, new_attrs: bool) -> tuple[object, ...]:
+    gc.collect()
+    start = ticks_us()
+    classes = define(count, depth, new_attrs)
+    defined = ticks_diff(ticks_us(), start)
+
+    # constructors are compiled when a class is first instantiated
+    start = ticks_us()
+    for cls in classes:
+        cls()
+    instantiated = ticks_diff(ticks_us(), start)
+    # the attribute declared by the first class in the last chain
+    first = (count - 1) // depth * depth
+    assert getattr(classes[-1](), f"attr{first}") == first
+
+    # the heap held by the class definitions alone
+    gc.collect()
+    tracemalloc.start()
+    kept = define(count, depth, new_attrs)
+    gc.collect()
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (
+        count,
+        depth,
+        "new attribute" if new_attrs else "body only",
+        defined / count,
+        heap / count,
+        instantiated / count,
+    )
+
+
+def main() -> None:
+    rows = [
+        run(count, depth, new_attrs)
+        for count, depth in ((200, 10), (200, 50))
+        for new_attrs in (False, True)
+    ]
+    table(
+        "widget class definition cost (per class)",
+        (
+            "classes",
+            "depth",
+            "subclasses add",
+            "define us",
+            "heap bytes",
+            "first instance us",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
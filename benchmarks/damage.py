@@ -0,0 +1,88 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Reports the bytes pushed to the display per frame for typical UI updates, pushing
+full frames versus only the damaged regions.
+"""
+
+from __future__ import annotations
+
+from ._harness import table
+from .headless_fps import Screen, Row
+
+from tg_gui.render import (
+    HeadlessRenderer,
+    HeadlessDisplay,
+    DamageTracker,
+    merge_overlapping,
+    merge_within,
+)
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+
+def _tick(screen: Screen) -> None:
+    screen.clock.ticks += 1
+
+
+def _edit_row(screen: Screen) -> None:
+    assert screen._built_ is not None
+    row: Row = screen._built_.subwidgets()[3]  # type: ignore
+    row.first += 1
+
+
+def _tick_and_edit(screen: Screen) -> None:
+    _tick(screen)
+    _edit_row(screen)
+
+
+def run(
+    update: Callable[[Screen], None],
+    damage: DamageTracker | None,
+    frames: int,
+) -> tuple[float, float]:
+    renderer = HeadlessRenderer(320, 240, damage=damage)
+    display = renderer.display = HeadlessDisplay(renderer.framebuffer)
+    screen = Screen(200)
+    renderer.frame(screen)
+    pushed = display.bytes_pushed
+    pushes = display.pushes
+
+    for _ in range(frames):
+        update(screen)
+        renderer.frame(screen)
+    return (
+        (display.bytes_pushed - pushed) / frames,
+        (display.pushes - pushes) / frames,
+    )
+
+
+def main(frames: int = 20) -> None:
+    updates = {
+        "counter label ticking": _tick,
+        "one list row edited": _edit_row,
+        "counter + row": _tick_and_edit,
+    }
+    trackers: dict[str, Callable[[], DamageTracker | None]] = {
+        "full frames": lambda: None,
+        "damage, merge overlapping": lambda: DamageTracker(merge_overlapping),
+        "damage, merge within 1.5x": lambda: DamageTracker(merge_within(1.5)),
+    }
+    rows = [
+        (update_name, tracker_name) + run(update, make_tracker(), frames)
+        for update_name, update in updates.items()
+        for tracker_name, make_tracker in trackers.items()
+    ]
+    table(
+        "display traffic, 320x240 RGB565",
+        ("update", "strategy", "bytes / frame", "pushes / frame"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares the enum shim used on circuitpython and micropython (platform_support/enum.py)
+against cpython's `enum`, both run here on cpython: comparing members (`is` and `==`,
+as AttrDef does with InitKind), using them as dict keys, looking members up by value,
+iterating a class's members and defining an Enum class.
+"""
+
+from __future__ import annotations
+
+import enum as std_enum
+
+from ._harness import best_of, table
+
+from tg_gui.platform_support import enum as shim_enum
+
+
+def define(module: object) -> type:
+    Enum = module.Enum  # type: ignore
+    auto = module.auto  # type: ignore
+
+    class InitKind(Enum):
+        required = auto()
+        default = auto()
+        default_factory = auto()
+
+    return InitKind
+
+
+def measure(module: object) -> list[float]:
+    kind = define(module)
+    member = kind.default_factory  # type: ignore
+    required = kind.required  # type: ignore
+    by_kind = {each: index for index, each in enumerate(kind)}  # type: ignore
+
+    cases = (
+        lambda: member is required,
+        lambda: member == required,
+        lambda: by_kind[member],
+        lambda: kind(2),
+        lambda: list(kind),  # type: ignore
+    )
+    results = [best_of(case, number=100_000) * 1e9 for case in cases]
+    results.append(best_of(lambda: define(module), number=1_000) * 1e6)
+    return results
+
+
+def main() -> None:
+    names = (
+        "a is b (ns)",
+        "a == b (ns)",
+        "dict[member] (ns)",
+        "Cls(value) (ns)",
+        "list(Cls) (ns)",
+        "define a class (us)",
+    )
+    shim = measure(shim_enum)
+    std = measure(std_enum)
+    table(
+        "enum members, 3 member InitKind",
+        ("", "shim", "cpython enum"),
+        [(name, a, b) for name, a, b in zip(names, shim, std)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares loading a large (CJK sized) bitmap font with a naive parser, which decodes
+every glyph of the BDF file into python objects, against memory mapping the .tgf file
+produced by tools/bdf2tgf.py. Each strategy runs in a fresh interpreter that loads the
+font and draws one line of text, reporting the load time and the growth of the
+resident set size (linux only), split into private memory and the file backed pages
+of the mapping (shared with the page cache and reclaimable).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import subprocess
+
+from ._harness import table
+
+# 16x16 ideographs from U+4E00, plus 8x16 ascii
+IDEOGRAPHS = 20_000
+TEXT = "tg_gui 你好世界 " * 3
+
+
+def write_bdf(path: str) -> None:
+    lines = [
+        "STARTFONT 2.1",
+        "FONT synthetic-16",
+        "SIZE 16 75 75",
+        "FONTBOUNDINGBOX 16 16 0 -2",
+        "STARTPROPERTIES 3",
+        "FONT_ASCENT 14",
+        "FONT_DESCENT 2",
+        "DEFAULT_CHAR 63",
+        "ENDPROPERTIES",
+        f"CHARS {IDEOGRAPHS + 95}",
+    ]
+    codepoints = list(range(0x20, 0x7F)) + list(range(0x4E00, 0x4E00 + IDEOGRAPHS))
+    for codepoint in codepoints:
+        width = 8 if codepoint < 0x80 else 16
+        digits = width // 4
+        state = codepoint * 2654435761 & 0xFFFFFFFF
+        lines += [
+            f"STARTCHAR U+{codepoint:04X}",
+            f"ENCODING {codepoint}",
+            f"DWIDTH {width} 0",
+            f"BBX {width} 16 0 -2",
+            "BITMAP",
+        ]
+        for _ in range(16):
+            state = (state * 1103515245 + 12345) & 0xFFFFFFFF
+            lines.append(f"{state >> (32 - width):0{digits}X}")
+        lines.append("ENDCHAR")
+    lines.append("ENDFONT")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def _rss_kib() -> tuple[int, int]:
+    # (private, file backed) resident KiB, mapped font pages are file backed and shared
+    fields = {}
+    with open("/proc/self/status") as file:
+        for line in file:
+            name, _, value = line.partition(":")
+            fields[name] = value
+    return (int(fields["RssAnon"].split()[0]), int(fields["RssFile"].split()[0]))
+
+
+def child(strategy: str, path: str) -> None:
+    # run as `python -m benchmarks.font_load <strategy> <path>` in a fresh interpreter,
+    # prints "<load ms> <private rss growth KiB> <file rss growth KiB> <draw ms>"
+    from tg_gui.platform_support import ticks_us, ticks_diff
+    from tg_gui.render import FrameBuffer, MappedFont
+    from tools.bdf2tgf import parse_bdf
+
+    framebuffer = FrameBuffer(320, 32)
+    rss = _rss_kib()
+    start = ticks_us()
+    if strategy == "naive":
+        glyphs = parse_bdf(path).glyphs
+        lookup = glyphs.__getitem__
+    else:
+        lookup = MappedFont(path).glyph
+    loaded = ticks_us()
+
+    pen = 0
+    for char in TEXT:
+        width, height, advance, bitmap = lookup(ord(char))
+        framebuffer.blit_mask(pen, 0, width, height, bitmap, 0xFFFFFF)
+        pen += advance
+    drawn = ticks_us()
+
+    anon, file = _rss_kib()
+    print(
+        ticks_diff(loaded, start) / 1000,
+        anon - rss[0],
+        file - rss[1],
+        ticks_diff(drawn, loaded) / 1000,
+    )
+
+
+def main() -> None:
+    from tools.bdf2tgf import convert, parse_bdf
+    from tg_gui.render import MappedFont
+
+    with tempfile.TemporaryDirectory() as directory:
+        bdf = os.path.join(directory, "synthetic.bdf")
+        tgf = os.path.join(directory, "synthetic.tgf")
+        write_bdf(bdf)
+        tgf_size = convert(bdf, tgf)
+
+        # the mapped glyphs must match the parsed ones
+        parsed = parse_bdf(bdf).glyphs
+        mapped = MappedFont(tgf)
+        for codepoint in (0x20, 0x41, 0x4E00, 0x4E00 + IDEOGRAPHS - 1):
+            width, height, advance, bitmap = mapped.glyph(codepoint)
+            assert (width, height, advance, bytes(bitmap)) == parsed[codepoint]
+        del bitmap, parsed
+        mapped.close()
+
+        rows = []
+        for strategy, path in (("naive", bdf), ("mmap", tgf)):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.font_load", strategy, path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            rows.append(
+                (
+                    "naive BDF parser" if strategy == "naive" else "mmap .tgf",
+                    os.path.getsize(path) // 1024,
+                    float(output[0]),
+                    int(output[1]),
+                    int(output[2]),
+                    float(output[3]),
+                )
+            )
+
+    table(
+        f"loading a {IDEOGRAPHS + 95} glyph 16 px font ({tgf_size // 1024} KiB .tgf)",
+        (
+            "font",
+            "file KiB",
+            "load ms",
+            "private rss KiB",
+            "file rss KiB",
+            f"draw {len(TEXT)} chars ms",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        child(sys.argv[1], sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,116 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares rendering whole frames against the budgeted FrameScheduler on an 800x480
+screen of 200 labels that scroll (every row is rebuilt and the frame redrawn in full)
+on each touch, next to a background task computing in 1 ms slices. Reports completed
+frames, missed deadlines, input-to-pixel latency of a 100 Hz synthetic touch stream,
+the time spent per frame in each phase and how many slices the background task ran.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+from ._harness import table
+from .headless_fps import Screen
+
+from tg_gui import sleep
+from tg_gui.platform_support import ticks_us
+from tg_gui._async_prep.loop import EventLoop, asyncio
+from tg_gui.render import HeadlessRenderer
+
+
+def run(budget_us: int | None, duration: float) -> tuple[object, ...]:
+    screen = Screen(200)
+    renderer = HeadlessRenderer(800, 480)
+    renderer.frame(screen)  # the initial build is not counted
+    rows = screen._built_.children[1:]  # type: ignore
+
+    interval_us = 10_000
+    next_touch = [0]
+
+    def poll() -> list[int]:
+        now = ticks_us()
+        touches: list[int] = []
+        while next_touch[0] <= now:
+            touches.append(next_touch[0])
+            next_touch[0] += interval_us
+        return touches
+
+    def handle(event: int) -> None:
+        for row in rows:
+            row.first += 1
+
+    loop = EventLoop(
+        screen,
+        renderer,
+        poll,
+        handle,
+        frame_interval=1 / 60,
+        input_interval=0.002,
+        event_time=lambda touched: touched,
+        budget_us=budget_us,
+    )
+
+    slices = [0]
+
+    async def background() -> None:
+        while True:
+            end = perf_counter() + 0.001
+            while perf_counter() < end:
+                pass
+            slices[0] += 1
+            await sleep(0)
+
+    async def main() -> None:
+        next_touch[0] = ticks_us() + interval_us
+        loop.spawn(background())
+        await loop.run(duration)
+
+    asyncio.run(main())
+
+    scheduler = loop.scheduler
+    if scheduler is None:
+        phase_us = dict(renderer.phase_us, input=0)
+        missed = "-"
+    else:
+        phase_us = scheduler.phase_us
+        missed = scheduler.missed
+    frames = max(loop.frames, 1)
+    latencies = sorted(loop.latencies_us) or [0]
+    return (
+        "whole frames" if budget_us is None else f"{budget_us // 1000} ms budget",
+        loop.frames / duration,
+        missed,
+        sum(latencies) / len(latencies) / 1000,
+        latencies[len(latencies) * 95 // 100] / 1000,
+        phase_us["build"] / frames / 1000,
+        phase_us["layout"] / frames / 1000,
+        phase_us["raster"] / frames / 1000,
+        slices[0] / duration,
+    )
+
+
+def main(duration: float = 2.0) -> None:
+    rows = [run(budget, duration) for budget in (None, 12_000, 8_000, 4_000)]
+    table(
+        "scrolling 200 labels at 60 Hz, with a background task",
+        (
+            "rendering",
+            "fps",
+            "missed",
+            "mean latency ms",
+            "p95 latency ms",
+            "build ms",
+            "layout ms",
+            "raster ms",
+            "bg slices/s",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
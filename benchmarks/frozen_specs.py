@@ -0,0 +1,168 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares booting an application with the widget spec tables resolved on import against
+reading them from a module made by `python -m tools.freeze_specs`. The application
+defines chains of widget classes, each adding attributes to its base, and the boot is
+measured through its first headless frame, every sample runs in a fresh interpreter.
+Then the cost of only the tables and of only the specialized constructor, per class, in
+this interpreter.
+"""
+
+from __future__ import annotations
+
+from ._harness import best_of, table
+
+from typing import Any
+
+import os
+import sys
+import tempfile
+import subprocess
+
+CHAINS = 40
+DEPTH = 5
+ATTRS = 3
+
+_CHILD = """
+import sys
+from time import perf_counter
+if {frozen!r}:
+    import types
+    module = types.ModuleType("tg_gui._frozen_specs")
+    exec(open({frozen!r}).read(), module.__dict__)
+    sys.modules["tg_gui._frozen_specs"] = module
+start = perf_counter()
+import tg_gui
+from tg_gui.render import HeadlessRenderer
+imported = perf_counter()
+import bench_app
+defined = perf_counter()
+HeadlessRenderer(320, 240).frame(bench_app.Screen())
+framed = perf_counter()
+print(imported - start, defined - imported, framed - defined, framed - start)
+"""
+
+
+def app_source() -> str:
+    lines = [
+        "from tg_gui.prelude import *",
+        "from tg_gui import Stack, Text",
+        "",
+    ]
+    for chain in range(CHAINS):
+        for depth in range(DEPTH):
+            base = f"W{chain}_{depth - 1}" if depth else "Widget"
+            lines.append(f"class W{chain}_{depth}({base}):")
+            for attr in range(ATTRS):
+                name = f"a{depth}_{attr}"
+                lines.append(f"    {name}: int = AttrDef({attr}, init=True)")
+            lines.append("    body = Body[Self](lambda self: Text(str(self.a0_0)))")
+            lines.append("")
+    leaves = ", ".join(f"W{chain}_{DEPTH - 1}()" for chain in range(CHAINS))
+    lines.append("class Screen(Widget):")
+    lines.append(f"    body = Body[Self](lambda self: Stack(({leaves},)))")
+    return "\n".join(lines) + "\n"
+
+
+def sample(folder: str, frozen: str) -> list[float]:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join((folder, root)))
+    out = subprocess.run(
+        (sys.executable, "-c", _CHILD.format(frozen=frozen)),
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    return [float(part) for part in out.split()]
+
+
+def main(runs: int = 15) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        with open(os.path.join(folder, "bench_app.py"), "w") as handle:
+            handle.write(app_source())
+        frozen = os.path.join(folder, "frozen_specs.py")
+        env = dict(os.environ, PYTHONPATH=folder)
+        subprocess.run(
+            (sys.executable, "-m", "tools.freeze_specs", frozen, "bench_app"),
+            check=True,
+            env=env,
+            capture_output=True,
+        )
+
+        steps = ("import tg_gui", "define app classes", "first frame", "boot total")
+        results = {}
+        for mode, path in (("resolved", ""), ("frozen", frozen)):
+            # interleaving would be fairer, but the runs are short and repeated
+            samples = [sample(folder, path) for _ in range(runs)]
+            results[mode] = [
+                sorted(times[index] for times in samples)[runs // 2] * 1e3
+                for index in range(len(steps))
+            ]
+        per_class = table_rows(folder, frozen)
+
+    table(
+        f"booting {CHAINS * DEPTH} widget classes ({DEPTH} deep, {ATTRS} attributes "
+        + f"each), median of {runs} fresh interpreters (ms)",
+        ("step", "resolved", "frozen"),
+        [
+            (step, results["resolved"][index], results["frozen"][index])
+            for index, step in enumerate(steps)
+        ],
+    )
+    table("one class (us)", ("", "resolved", "frozen"), per_class)
+
+
+def table_rows(folder: str, frozen: str) -> list[tuple[object, ...]]:
+    sys.path.insert(0, folder)
+    try:
+        import bench_app  # type: ignore
+    finally:
+        sys.path.remove(folder)
+    from tg_gui.core import widget, specialize
+    from tg_gui.core.attrdef import isattrdef
+
+    namespace: dict[str, Any] = {}
+    with open(frozen) as handle:
+        exec(handle.read(), namespace)
+
+    classes = [getattr(bench_app, f"W{chain}_{DEPTH - 1}") for chain in range(CHAINS)]
+    cases = [
+        (cls, {k: v for k, v in vars(cls).items() if isattrdef(v)}, [cls.__base__])
+        for cls in classes
+    ]
+
+    def resolve() -> None:
+        for cls, new_specs, bases in cases:
+            widget._resolve_specs(cls, new_specs, bases)
+
+    def thaw() -> None:
+        for cls, new_specs, bases in cases:
+            assert widget._thaw_specs(cls, new_specs, bases)
+
+    def construct() -> None:
+        for cls in classes:
+            specialize.specialized_init(cls)
+
+    def tables_row() -> tuple[object, ...]:
+        return (
+            f"tables ({DEPTH * ATTRS} attributes)",
+            best_of(resolve, number=200) / CHAINS * 1e6,
+            best_of(thaw, number=200) / CHAINS * 1e6,
+        )
+
+    compile_us = best_of(construct, number=20) / CHAINS * 1e6
+    widget.frozen_specs = namespace["specs"]
+    specialize.frozen_inits = namespace["inits"]
+    try:
+        frozen_us = best_of(construct, number=20) / CHAINS * 1e6
+        return [tables_row(), ("specialized __init__", compile_us, frozen_us)]
+    finally:
+        widget.frozen_specs = {}
+        specialize.frozen_inits = {}
+
+
+if __name__ == "__main__":
+    main()
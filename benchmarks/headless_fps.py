@@ -0,0 +1,87 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+End-to-end headless rendering harness: renders synthetic Group/Text trees of 10 to
+10,000 widgets into a 320x240 RGB565 frame buffer and reports frames per second and
+the time spent per phase (body build, layout, rasterize). One label changes per frame.
+"""
+
+from __future__ import annotations
+
+from ._harness import table
+
+from tg_gui.prelude import *
+from tg_gui import Text, Group
+from tg_gui.render import HeadlessRenderer, PixelFormat
+
+
+class Row(Widget):
+    first: int = AttrDef(required=True)
+    columns: int = AttrDef(10, init=True)
+
+    body = Body[Self](
+        lambda self: Group(
+            tuple(Text(f"item {self.first + col}") for col in range(self.columns))
+        )
+    )
+
+
+class Clock(Widget):
+    ticks: int = AttrDef(0, init=True)
+
+    body = Body[Self](lambda self: Text(f"tick {self.ticks}"))
+
+
+class Screen(Widget):
+    widgets: int = AttrDef(required=True)
+    clock: Clock = AttrDef(default_factory=Clock, init=True)
+
+    body = Body[Self](
+        lambda self: Group(
+            (self.clock,)
+            + tuple(
+                Row(first, min(10, self.widgets - first))
+                for first in range(0, self.widgets, 10)
+            )
+        )
+    )
+
+
+def run(widgets: int, frames: int, format: PixelFormat) -> tuple[object, ...]:
+    renderer = HeadlessRenderer(320, 240, format)
+    screen = Screen(widgets)
+    renderer.frame(screen)  # the initial build is not counted
+    renderer = HeadlessRenderer(320, 240, format)
+
+    for _ in range(frames):
+        screen.clock.ticks += 1
+        renderer.frame(screen)
+
+    phase_ms = {phase: us / frames / 1000 for phase, us in renderer.phase_us.items()}
+    total_ms = sum(phase_ms.values())
+    return (
+        widgets,
+        format.name,
+        1000 / total_ms,
+        phase_ms["build"],
+        phase_ms["layout"],
+        phase_ms["raster"],
+    )
+
+
+def main(frames: int = 20) -> None:
+    rows = [
+        run(widgets, frames, format)
+        for widgets in (10, 100, 1_000, 10_000)
+        for format in (PixelFormat.RGB565, PixelFormat.RGB888)
+    ]
+    table(
+        f"headless rendering, 320x240 ({frames} frames each)",
+        ("widgets", "format", "fps", "build ms", "layout ms", "raster ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures touch hit-test latency on trees of 100, 1,000 and 10,000 widgets (the headless
+harness's screens, laid out on a 320x240 display): walking every widget's bounds,
+walking only the subtrees containing the point, and a HitIndex. Also reports the time
+to index a tree and the frame time with and without keeping the index up to date.
+"""
+
+from __future__ import annotations
+
+import random
+
+from ._harness import best_of, table
+from .headless_fps import Screen
+
+from tg_gui.core import Widget
+from tg_gui.hit_test import HitIndex
+from tg_gui.render import HeadlessRenderer
+
+QUERIES = 200
+
+
+def contains(rect: tuple[int, int, int, int] | None, x: int, y: int) -> bool:
+    return (
+        rect is not None
+        and rect[0] <= x < rect[0] + rect[2]
+        and (rect[1] <= y < rect[1] + rect[3])
+    )
+
+
+def walk_all(widget: Widget, x: int, y: int, out: list[Widget]) -> None:
+    # checks the bounds of every widget
+    if contains(widget._rect_, x, y):
+        out.append(widget)
+    for child in widget.subwidgets():
+        walk_all(child, x, y, out)
+
+
+def walk_pruned(widget: Widget, x: int, y: int, out: list[Widget]) -> None:
+    # only descends into the widgets containing the point
+    if not contains(widget._rect_, x, y):
+        return
+    out.append(widget)
+    for child in widget.subwidgets():
+        walk_pruned(child, x, y, out)
+
+
+def run(widgets: int) -> tuple[object, ...]:
+    screen = Screen(widgets)
+    index = HitIndex(screen)
+    renderer = HeadlessRenderer(320, 240, hit_index=index)
+    renderer.frame(screen)
+    assert screen._rect_ is not None
+    height = screen._rect_[3]
+
+    rng = random.Random(widgets)
+    points = [(rng.randrange(320), rng.randrange(height)) for _ in range(QUERIES)]
+    for x, y in points:
+        expected: list[Widget] = []
+        walk_all(screen, x, y, expected)
+        assert index.at(x, y) == expected[::-1], "the index must find the same widgets"
+
+    def query(find: object) -> float:
+        def queries() -> None:
+            for x, y in points:
+                find(screen, x, y, [])  # type: ignore
+
+        return best_of(queries, number=1, repeat=3) / QUERIES * 1e6
+
+    def indexed() -> None:
+        for x, y in points:
+            index.at(x, y)
+
+    index_us = best_of(indexed, number=1, repeat=3) / QUERIES * 1e6
+    sync_ms = best_of(index.sync, number=1, repeat=3) * 1000
+
+    # one label changes per frame, the index follows the rebuild and layout
+    plain = HeadlessRenderer(320, 240)
+    plain.frame(screen)
+
+    def tick(renderer: HeadlessRenderer) -> None:
+        screen.clock.ticks += 1
+        renderer.frame(screen)
+
+    frame_ms = best_of(lambda: tick(plain), number=10, repeat=3) * 1000
+    tracked_ms = best_of(lambda: tick(renderer), number=10, repeat=3) * 1000
+    return (
+        widgets,
+        len(index),
+        query(walk_all),
+        query(walk_pruned),
+        index_us,
+        sync_ms,
+        frame_ms,
+        tracked_ms,
+    )
+
+
+def main() -> None:
+    table(
+        f"hit-test latency (mean of {QUERIES} random points)",
+        (
+            "labels",
+            "widgets",
+            "walk all us",
+            "walk pruned us",
+            "hit index us",
+            "index build ms",
+            "frame ms",
+            "indexed frame ms",
+        ),
+        [run(widgets) for widgets in (100, 1_000, 10_000)],
+    )
+
+
+if __name__ == "__main__":
+    main()
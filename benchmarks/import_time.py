@@ -0,0 +1,56 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures the cold-start cost of `import tg_gui` and of the first access of each lazy
+export. Every sample runs in a fresh interpreter so nothing is cached between runs.
+"""
+
+from __future__ import annotations
+
+from ._harness import table
+
+import sys
+import subprocess
+
+_CHILD = """
+from time import perf_counter
+start = perf_counter()
+import tg_gui
+imported = perf_counter()
+times = [imported - start]
+for name in ("Text", "Group", "sleep"):
+    before = perf_counter()
+    getattr(tg_gui, name)
+    times.append(perf_counter() - before)
+print(*times)
+"""
+
+
+def sample() -> list[float]:
+    out = subprocess.run(
+        (sys.executable, "-c", _CHILD), capture_output=True, text=True, check=True
+    ).stdout
+    return [float(part) for part in out.split()]
+
+
+def main(runs: int = 15) -> None:
+    samples = [sample() for _ in range(runs)]
+    steps = ("import tg_gui", "first .Text", "first .Group", "first .sleep")
+    rows = [
+        (
+            step,
+            min(times[index] for times in samples) * 1e3,
+            sorted(times[index] for times in samples)[runs // 2] * 1e3,
+        )
+        for index, step in enumerate(steps)
+    ]
+    table(
+        f"cold import ({runs} fresh interpreters)",
+        ("step", "min ms", "median ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures input-to-pixel latency on the tg_gui event loop: the time from a synthetic
+touch occurring (every 10 ms) to the end of the frame that shows it. Each case runs
+next to background tasks that either wait with `await sleep(...)`, block with
+time.sleep(...) like pre-async code, or compute in 2 ms slices.
+"""
+
+from __future__ import annotations
+
+# the real, blocking, sleep (tg_gui warns against it once imported)
+from time import sleep as blocking_sleep, perf_counter
+
+from ._harness import table
+from .headless_fps import Screen
+
+from tg_gui import sleep
+from tg_gui.platform_support import ticks_us
+from tg_gui._async_prep.loop import EventLoop, asyncio
+from tg_gui.render import HeadlessRenderer, DamageTracker
+
+
+async def awaiting_load() -> None:
+    while True:
+        await sleep(0.002)
+
+
+async def blocking_load() -> None:
+    while True:
+        blocking_sleep(0.002)
+        await sleep(0)
+
+
+async def compute_load() -> None:
+    while True:
+        end = perf_counter() + 0.002
+        while perf_counter() < end:
+            pass
+        await sleep(0)
+
+
+def run(tasks: int, load: object, duration: float) -> tuple[object, ...]:
+    screen = Screen(100)
+    renderer = HeadlessRenderer(320, 240, damage=DamageTracker())
+
+    # a touch occurs every 10 ms, it is only seen when the input task polls
+    interval_us = 10_000
+    next_touch = [ticks_us() + interval_us]
+
+    def poll() -> list[int]:
+        now = ticks_us()
+        touches: list[int] = []
+        while next_touch[0] <= now:
+            touches.append(next_touch[0])
+            next_touch[0] += interval_us
+        return touches
+
+    def handle(event: int) -> None:
+        screen.clock.ticks += 1
+
+    loop = EventLoop(
+        screen,
+        renderer,
+        poll,
+        handle,
+        frame_interval=1 / 60,
+        event_time=lambda touched: touched,
+    )
+
+    async def main() -> None:
+        next_touch[0] = ticks_us() + interval_us
+        for _ in range(tasks):
+            loop.spawn(load())  # type: ignore
+        await loop.run(duration)
+
+    asyncio.run(main())
+
+    latencies = sorted(loop.latencies_us) or [0]
+    return (
+        tasks,
+        len(latencies),
+        loop.frames / duration,
+        sum(latencies) / len(latencies) / 1000,
+        latencies[len(latencies) * 95 // 100] / 1000,
+        latencies[-1] / 1000,
+    )
+
+
+def main(duration: float = 1.0) -> None:
+    loads = (
+        ("await sleep(2 ms)", awaiting_load),
+        ("blocking time.sleep(2 ms)", blocking_load),
+        ("2 ms compute slices", compute_load),
+    )
+    for name, load in loads:
+        rows = [run(tasks, load, duration) for tasks in (0, 2, 8)]
+        table(
+            f"input-to-pixel latency, background tasks: {name}",
+            ("tasks", "events", "fps", "mean ms", "p95 ms", "max ms"),
+            rows,
+        )
+
+
+if __name__ == "__main__":
+    main()
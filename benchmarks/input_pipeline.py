@@ -0,0 +1,91 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Replays the same synthetic input stream (two fingers dragging, sampled at 400 Hz, and
+key presses) through the tg_gui event loop at 60 frames per second, handling every
+event as it is polled or queueing them in an InputPipeline that coalesces moves and
+dispatches once per frame. The handler hit-tests the event and updates the screen, as
+a drag handler would. Reports the events handled, the state changes, the time spent
+handling input and the input-to-pixel latency.
+"""
+
+from __future__ import annotations
+
+from ._harness import table
+from .headless_fps import Screen
+
+from tg_gui.platform_support import ticks_us, ticks_diff
+from tg_gui.hit_test import HitIndex
+from tg_gui._async_prep.loop import EventLoop, asyncio
+from tg_gui._async_prep.events import InputEvent, KEY, synthetic_drags
+from tg_gui.render import HeadlessRenderer, DamageTracker
+
+DURATION = 1.0
+RECORDING = synthetic_drags(DURATION, sample_hz=400, pointers=2)
+
+
+def run(coalesce: bool) -> tuple[object, ...]:
+    screen = Screen(100)
+    index = HitIndex(screen)
+    renderer = HeadlessRenderer(320, 240, damage=DamageTracker(), hit_index=index)
+    handled = [0, 0]  # events, microseconds
+
+    def handle(event: InputEvent) -> None:
+        start = ticks_us()
+        if event.kind != KEY:
+            index.top(event.x, event.y)
+        # the state change each event makes
+        screen.clock.ticks += 1
+        handled[0] += 1
+        handled[1] += ticks_diff(ticks_us(), start)
+
+    async def main() -> None:
+        loop.poll_input = RECORDING.play()
+        await loop.run(DURATION + 0.05)
+
+    loop = EventLoop(
+        screen,
+        renderer,
+        lambda: [],
+        handle,
+        frame_interval=1 / 60,
+        input_interval=0.001,
+        event_time=lambda event: event.time,
+        coalesce_input=coalesce,
+    )
+    asyncio.run(main())
+
+    latencies = sorted(loop.latencies_us) or [0]
+    raw = len(latencies)
+    return (
+        "pipeline" if coalesce else "per event",
+        raw,
+        handled[0],
+        handled[0] / max(1, loop.frames),
+        handled[1] / max(1, loop.frames) / 1000,
+        loop.frames / DURATION,
+        sum(latencies) / raw / 1000,
+        latencies[raw * 95 // 100] / 1000,
+    )
+
+
+def main() -> None:
+    table(
+        f"replaying {len(RECORDING)} events over {DURATION:.0f} s at 60 fps",
+        (
+            "dispatch",
+            "raw events",
+            "handled",
+            "per frame",
+            "input ms/frame",
+            "fps",
+            "mean latency ms",
+            "p95 latency ms",
+        ),
+        [run(False), run(True)],
+    )
+
+
+if __name__ == "__main__":
+    main()
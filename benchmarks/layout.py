@@ -0,0 +1,94 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures layout time as the depth and width of a tree grow. Trees alternate Stack and
+Row containers `depth` levels deep with `width` children each, ending in Text labels.
+Each tree is timed laid out from scratch (every measurement invalidated), laid out
+again with nothing changed, and after one label (near the top left, so most of the
+tree moves) changes size.
+"""
+
+from __future__ import annotations
+
+from ._harness import best_of, table
+
+from tg_gui import Text, Stack, Row
+from tg_gui.core import Widget, rebuild
+from tg_gui.layout import layout, invalidate_layout
+
+
+def tree(depth: int, width: int, leaves: list[Text], level: int = 0) -> Widget:
+    if level == depth:
+        label = Text(f"label {len(leaves)}")
+        leaves.append(label)
+        return label
+    children = tuple(tree(depth, width, leaves, level + 1) for _ in range(width))
+    return (Row if level % 2 else Stack)(children, spacing=1)
+
+
+def run(depth: int, width: int) -> tuple[object, ...]:
+    leaves: list[Text] = []
+    root = tree(depth, width, leaves)
+    rebuild(root)
+    layout(root, 0, 0, 320, 240)
+
+    def cold() -> None:
+        invalidate_layout(root)
+        layout(root, 0, 0, 320, 240)
+
+    def warm() -> None:
+        layout(root, 0, 0, 320, 240)
+
+    first = leaves[0]
+    short = first.label
+
+    def one_changed() -> None:
+        first.label = short + "!" if first.label == short else short
+        rebuild(root)
+        layout(root, 0, 0, 320, 240)
+
+    number = max(1, 10_000 // len(leaves))
+    cold_s = best_of(cold, number=number, repeat=3)
+    changed_s = best_of(one_changed, number=number, repeat=3)
+    return (
+        depth,
+        width,
+        len(leaves),
+        cold_s * 1000,
+        best_of(warm, number=number, repeat=3) * 1000,
+        changed_s * 1000,
+        cold_s / changed_s,
+    )
+
+
+def main() -> None:
+    rows = [
+        run(depth, width)
+        for depth, width in (
+            (2, 4),
+            (2, 16),
+            (2, 64),
+            (4, 4),
+            (4, 8),
+            (6, 4),
+            (8, 3),
+        )
+    ]
+    table(
+        "layout time, cached measurements",
+        (
+            "depth",
+            "width",
+            "labels",
+            "cold ms",
+            "unchanged ms",
+            "one label ms",
+            "speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
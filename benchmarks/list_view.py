@@ -0,0 +1,90 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares a ListView against a Stack holding every row, for lists of 100 to 100,000
+rows shown on a 320x240 headless display: the time of the first frame (building and
+laying out the list), the heap still allocated after it, the row widgets alive and the
+frame time while scrolling one row per frame. The Stack is skipped for the largest
+lists, it takes too long to build.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from ._harness import table
+from tg_gui.platform_support import ticks_us, ticks_diff
+
+from tg_gui.core import Widget
+from tg_gui import Text, Stack, ListView
+from tg_gui.render import HeadlessRenderer
+
+ROW_HEIGHT = 12
+SCROLL_FRAMES = 100
+# the largest list built eagerly
+STACK_LIMIT = 10_000
+
+
+def row(index: int) -> Text:
+    return Text(f"log entry {index:06}")
+
+
+def count_rows(widget: Widget) -> int:
+    if type(widget) is Text:
+        return 1
+    return sum(count_rows(child) for child in widget.subwidgets())
+
+
+def run(kind: str, rows: int) -> tuple[object, ...]:
+    renderer = HeadlessRenderer(320, 240)
+    gc.collect()
+    tracemalloc.start()
+    start = ticks_us()
+    if kind == "list view":
+        screen = ListView(rows, row, row_height=ROW_HEIGHT)
+    else:
+        screen = Stack(tuple(row(index) for index in range(rows)))
+    renderer.frame(screen)
+    first = ticks_diff(ticks_us(), start)
+    gc.collect()
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    alive = count_rows(screen)
+
+    # scroll one row per frame
+    start = ticks_us()
+    for step in range(1, SCROLL_FRAMES + 1):
+        if type(screen) is ListView:
+            screen.offset = step * ROW_HEIGHT
+        else:
+            # the closest a Stack gets, dropping the first row
+            screen.children = screen.children[1:]
+        renderer.frame(screen)
+    scroll = ticks_diff(ticks_us(), start) / SCROLL_FRAMES
+    return (kind, rows, first / 1000, heap / 1024, alive, scroll / 1000)
+
+
+def main() -> None:
+    results = []
+    for rows in (100, 1_000, 10_000, 100_000):
+        results.append(run("list view", rows))
+        if rows <= STACK_LIMIT:
+            results.append(run("stack", rows))
+    table(
+        "a list of rows on a 320x240 display",
+        (
+            "widget",
+            "rows",
+            "first frame ms",
+            "heap KiB",
+            "rows alive",
+            "scroll frame ms",
+        ),
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Shows that an incremental rebuild costs in proportion to the number of modified
+widgets rather than the size of the tree.
+"""
+
+from __future__ import annotations
+
+from ._harness import best_of, table
+
+from tg_gui.prelude import *
+from tg_gui import Group
+from tg_gui.core import rebuild
+
+
+class Label(Widget):
+    text: str = AttrDef(required=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class Counter(Widget):
+    count: int = AttrDef(0, init=True)
+
+    body = Body[Self](lambda self: Label(str(self.count)))
+
+
+class Screen(Widget):
+    rows: int = AttrDef(required=True)
+
+    body = Body[Self](
+        lambda self: Group(
+            tuple(
+                Group(tuple(Counter(row * 10 + col) for col in range(10)))
+                for row in range(self.rows // 10)
+            )
+        )
+    )
+
+
+def counters(screen: Screen) -> list[Counter]:
+    assert screen._built_ is not None
+    return [
+        counter  # type: ignore
+        for row in screen._built_.subwidgets()
+        for counter in row.subwidgets()
+    ]
+
+
+def main() -> None:
+    rows: list[tuple[object, ...]] = []
+    for size in (100, 1_000, 10_000):
+        screen = Screen(size)
+        full = best_of(lambda: rebuild(Screen(size)), number=1, repeat=3)
+        rebuild(screen)
+        widgets = counters(screen)
+
+        for changed in (1, 10, 100):
+            targets = widgets[:: len(widgets) // changed][:changed]
+
+            def change_and_rebuild() -> None:
+                for counter in targets:
+                    counter.count += 1
+                rebuild(screen)
+
+            incremental = best_of(change_and_rebuild, number=20)
+            rows.append((size, changed, full * 1e3, incremental * 1e3))
+
+    table(
+        "rebuild cost (ms)",
+        ("counters", "changed", "full build", "incremental"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures typical mutations of a 1,000 entry list whose body builds a Stack of entries:
+appending, prepending, removing and updating an entry and swapping two. Each mutation is
+rebuilt with the new widgets replacing the previous ones (no reconciliation), merged by
+position, and merged by key. Reports the bodies evaluated, the time of the rebuild and
+of the rest of the frame (layout and rasterization, headless) and the entries that kept
+their widget instance.
+"""
+
+from __future__ import annotations
+
+from ._harness import table
+from tg_gui.platform_support import ticks_us, ticks_diff
+
+from tg_gui.prelude import *
+from tg_gui import Text, Stack, Row
+from tg_gui.core import rebuild
+from tg_gui.render import HeadlessRenderer
+
+ENTRIES = 1_000
+REPEAT = 5
+
+Item = "tuple[int, str]"
+
+
+class Entry(Widget):
+    label: str = AttrDef(required=True)
+
+    body = Body[Self](lambda self: Row((Text(self.label), Text(" ok"))))
+
+
+class Log(Widget):
+    items: tuple[Item, ...] = AttrDef(required=True)
+    use_keys: bool = AttrDef(False, init=True)
+
+    def _body(self) -> Widget:
+        if self.use_keys:
+            entries = (Entry(label).keyed(id) for id, label in self.items)
+        else:
+            entries = (Entry(label) for _, label in self.items)
+        return Stack(tuple(entries))
+
+    body = Body[Self](_body)
+
+
+def swap(items: tuple[Item, ...]) -> tuple[Item, ...]:
+    listed = list(items)
+    listed[10], listed[-10] = listed[-10], listed[10]
+    return tuple(listed)
+
+
+MUTATIONS = (
+    ("append", lambda items: items + ((ENTRIES, "appended"),)),
+    ("prepend", lambda items: ((-1, "prepended"),) + items),
+    ("remove", lambda items: items[:500] + items[501:]),
+    ("update", lambda items: items[:500] + ((items[500][0], "updated"),) + items[501:]),
+    ("swap", swap),
+)
+
+
+def run(name: str, mutate: Any, mode: str) -> tuple[object, ...]:
+    Log._reconciles_ = mode != "replace"
+    best_rebuild = best_frame = 1 << 62
+    for _ in range(REPEAT):
+        items = tuple((id, f"entry {id:04}") for id in range(ENTRIES))
+        log = Log(items, mode == "by key")
+        renderer = HeadlessRenderer(320, 240)
+        renderer.frame(log)
+        before = {entry.uid for entry in log._built_.children}  # type: ignore
+
+        log.items = mutate(items)
+        start = ticks_us()
+        evaluated = rebuild(log)
+        rebuilt = ticks_diff(ticks_us(), start)
+        start = ticks_us()
+        renderer.frame(log)
+        frame = ticks_diff(ticks_us(), start)
+        best_rebuild = min(best_rebuild, rebuilt)
+        best_frame = min(best_frame, frame)
+
+    kept = sum(entry.uid in before for entry in log._built_.children)  # type: ignore
+    return (name, mode, evaluated, best_rebuild / 1000, best_frame / 1000, kept)
+
+
+def main() -> None:
+    rows = [
+        run(name, mutate, mode)
+        for name, mutate in MUTATIONS
+        for mode in ("replace", "by position", "by key")
+    ]
+    Log._reconciles_ = True
+    table(
+        f"mutating a {ENTRIES} entry list",
+        (
+            "mutation",
+            "children",
+            "bodies",
+            "rebuild ms",
+            "layout + raster ms",
+            "entries kept",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Checks `import tg_gui` against a time and heap budget on cpython, printing the
+per-module startup profile (see tg_gui/_startup_profile.py) for the slowest modules.
+Exits with a non-zero status when either budget is exceeded, ex:
+`python -m benchmarks.startup_budget --max-ms 60 --max-kb 1536`
+"""
+
+from __future__ import annotations
+
+from ._harness import table
+
+import os
+import sys
+import ast
+import argparse
+import subprocess
+
+_CHILD = """
+import tracemalloc
+tracemalloc.start()
+import tg_gui
+heap = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+print("HEAP", heap)
+print("RECORDS", repr(tg_gui._startup_profile.records()))
+"""
+
+_CHILD_UNTRACED = """
+import tg_gui
+print("RECORDS", repr(tg_gui._startup_profile.records()))
+"""
+
+
+def _run(source: str) -> dict[str, str]:
+    env = dict(os.environ, TG_GUI_PROFILE_STARTUP="1")
+    out = subprocess.run(
+        (sys.executable, "-c", source),
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    return dict(line.split(" ", 1) for line in out.splitlines() if line[:1].isupper())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-ms", type=float, default=60.0)
+    parser.add_argument("--max-kb", type=float, default=1536.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # time is measured without tracemalloc, which slows imports down considerably
+    runs = [
+        ast.literal_eval(_run(_CHILD_UNTRACED)["RECORDS"]) for _ in range(args.runs)
+    ]
+    best = min(runs, key=lambda records: records[-1][1])
+    total_ms = best[-1][1] / 1000
+
+    heap_kb = int(_run(_CHILD)["HEAP"]) / 1024
+
+    slowest = sorted(best[:-1], key=lambda record: record[2], reverse=True)[:8]
+    table(
+        "slowest tg_gui modules (best run)",
+        ("module", "total ms", "self ms"),
+        [
+            (module, total / 1000, self_us / 1000)
+            for module, total, self_us, _ in slowest
+        ],
+    )
+    table(
+        "import tg_gui budget",
+        ("measure", "value", "budget"),
+        [("time ms", total_ms, args.max_ms), ("heap KiB", heap_kb, args.max_kb)],
+    )
+
+    over = total_ms > args.max_ms or heap_kb > args.max_kb
+    print("\nFAIL: over budget" if over else "\nOK: within budget")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares State against a plain AttrDef. First the per access overhead: reading outside
+of a body, reading while a body is evaluated (which records the reader) and writing (a
+State queues its readers, flushed once per rebuild). Then updating shared state: 200
+labels each show one of 200 counter models that are not in the tree. With AttrDef
+values the screen has to be rebuilt as a whole, without reconciliation, to pick up a
+change, with States only the label that read the written counter is.
+"""
+
+from __future__ import annotations
+
+from ._harness import best_of, table
+from tg_gui.platform_support import ticks_us, ticks_diff
+
+from tg_gui.prelude import *
+from tg_gui import Text, Stack
+from tg_gui.core import rebuild, flush_state
+from tg_gui.core.state import reading
+from tg_gui.render import HeadlessRenderer
+
+LABELS = 200
+FRAMES = 50
+
+
+class PlainCounter(Widget):
+    value: int = AttrDef(0, init=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class StateCounter(Widget):
+    value: int = State(0, init=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class Label(Widget):
+    counter: Any = AttrDef(required=True)
+
+    body = Body[Self](lambda self: Text(f"count {self.counter.value}"))
+
+
+class Screen(Widget):
+    counters: tuple[Any, ...] = AttrDef(required=True)
+
+    body = Body[Self](
+        lambda self: Stack(tuple(Label(counter) for counter in self.counters))
+    )
+
+
+def access_rows() -> list[tuple[object, ...]]:
+    plain = PlainCounter()
+    state = StateCounter()
+    reader = Label(state)
+    rows = []
+
+    rows.append(
+        (
+            "read",
+            best_of(lambda: plain.value, number=100_000) * 1e9,
+            best_of(lambda: state.value, number=100_000) * 1e9,
+        )
+    )
+
+    def tracked(counter: Any) -> float:
+        reading[0] = reader
+        try:
+            return best_of(lambda: counter.value, number=100_000) * 1e9
+        finally:
+            reading[0] = None
+
+    rows.append(("read in a body", tracked(plain), tracked(state)))
+
+    # the plain widget is flagged by the write, clear it so each write flags it again
+    def write_plain() -> None:
+        plain.value = 1
+        plain.state_modified = False
+
+    def write_state() -> None:
+        reading[0] = reader
+        state.value  # records the reader again
+        reading[0] = None
+        state.value = 1
+        flush_state()
+        reader.state_modified = False
+
+    rows.append(
+        (
+            "write (and notify)",
+            best_of(write_plain, number=100_000) * 1e9,
+            best_of(write_state, number=100_000) * 1e9,
+        )
+    )
+    return rows
+
+
+def update_row(cls: type) -> tuple[object, ...]:
+    # the labels are not modified, merging the screen's new labels into them would keep
+    # the old text. rebuild them all
+    Screen._reconciles_ = cls is not PlainCounter
+    counters = tuple(cls() for _ in range(LABELS))
+    screen = Screen(counters)
+    renderer = HeadlessRenderer(320, 240)
+    renderer.frame(screen)
+
+    bodies = 0
+    start = ticks_us()
+    for frame in range(FRAMES):
+        counters[frame % LABELS].value = frame + 1
+        if cls is PlainCounter:
+            # nothing in the tree knows the model changed
+            screen.mark_modified()
+        bodies += rebuild(screen)
+        renderer.frame(screen)
+    elapsed = ticks_diff(ticks_us(), start)
+    Screen._reconciles_ = True
+    label = screen._built_.children[(FRAMES - 1) % LABELS]  # type: ignore
+    assert label._built_.label == f"count {FRAMES}"
+    return (cls.__name__, bodies / FRAMES, elapsed / FRAMES / 1000)
+
+
+def main() -> None:
+    table("per access (ns)", ("", "AttrDef", "State"), access_rows())
+    table(
+        f"updating one of {LABELS} shared counters per frame",
+        ("model", "bodies per frame", "frame ms"),
+        [update_row(PlainCounter), update_row(StateCounter)],
+    )
+
+
+if __name__ == "__main__":
+    main()
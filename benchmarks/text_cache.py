@@ -0,0 +1,88 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures the glyph atlas and shaping cache on a dashboard of sensor readouts where a
+few characters of a few labels change each frame. Compares whole frames rendered with
+the caches disabled (capacity 0, every glyph is rasterized and every string measured
+on each use) against the default caches, and reports their hit rates and memory use.
+"""
+
+from __future__ import annotations
+
+from ._harness import table
+
+from tg_gui.prelude import *
+from tg_gui import Text, Stack
+from tg_gui.platform_support import ticks_us, ticks_diff
+from tg_gui.render import HeadlessRenderer, glyph_atlas, shaping_cache
+
+
+class Readout(Widget):
+    name: str = AttrDef(required=True)
+    value: int = AttrDef(0, init=True)
+
+    body = Body[Self](
+        lambda self: Text(f"{self.name}: {self.value // 10}.{self.value % 10} C")
+    )
+
+
+class Dashboard(Widget):
+    readouts: tuple[Readout, ...] = AttrDef(required=True)
+
+    body = Body[Self](lambda self: Stack(self.readouts))
+
+
+def run(cached: bool, frames: int) -> tuple[tuple[object, ...], bytes]:
+    glyph_atlas.resize(8192 if cached else 0)
+    shaping_cache.resize(4096 if cached else 0)
+    shaping_cache.clear()
+    for cache in (glyph_atlas, shaping_cache):
+        cache.hits = cache.misses = cache.evictions = 0
+
+    readouts = tuple(Readout(f"sensor {index:02}", 200 + index) for index in range(28))
+    dashboard = Dashboard(readouts)
+    renderer = HeadlessRenderer(320, 240)
+    renderer.frame(dashboard)
+
+    start = ticks_us()
+    for frame in range(frames):
+        # a couple of readings change by a little each frame
+        for index in (frame % 28, (frame * 7) % 28):
+            readouts[index].value += 1 if frame % 3 else -1
+        renderer.frame(dashboard)
+    elapsed_ms = ticks_diff(ticks_us(), start) / 1000
+
+    row = (
+        "default caches" if cached else "no caches",
+        elapsed_ms / frames,
+        1000 * frames / elapsed_ms,
+        glyph_atlas.hit_rate(),
+        shaping_cache.hit_rate(),
+        glyph_atlas.weight,
+        len(glyph_atlas),
+    )
+    return row, bytes(renderer.framebuffer.buffer)
+
+
+def main(frames: int = 100) -> None:
+    uncached, expected = run(False, frames)
+    cached, pixels = run(True, frames)
+    assert pixels == expected, "the caches must not change the rendered pixels"
+    table(
+        f"dashboard of 28 readouts, full 320x240 frames ({frames} frames)",
+        (
+            "text",
+            "ms / frame",
+            "fps",
+            "glyph hit rate",
+            "shaping hit rate",
+            "atlas bytes",
+            "glyphs",
+        ),
+        [uncached, cached],
+    )
+
+
+if __name__ == "__main__":
+    main()
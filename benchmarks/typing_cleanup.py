@@ -0,0 +1,81 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares the cost of cleaning the typing artifacts out of a module scope on the device:
+the previous `cleanup_typing_artifacts`, which compared every name's value against
+every object in the typing shim, against the identity set lookup it uses now. Both run
+on the shim (platform_support/typing.py) imported here on cpython. Then reports what
+stripping the typing code before deploying (`python -m tools.strip_typing`) saves per
+module, in which case neither runs.
+"""
+
+from __future__ import annotations
+
+import os
+
+from ._harness import best_of, table
+
+from tg_gui.platform_support import typing as shim
+from tools.strip_typing import strip_tree, report
+
+
+def scan_cleanup(scope: dict[str, object]) -> frozenset[str]:
+    # the previous implementation, kept here for comparison
+    excluded_values = vars(shim).values()
+    return frozenset(
+        k
+        for k, v in scope.items()
+        if v in excluded_values and k not in ("TYPE_CHECKING", "Self")
+    )
+
+
+def id_cleanup(scope: dict[str, object]) -> frozenset[str]:
+    # cleanup_typing_artifacts without deleting the names, so it can be repeated
+    ids = shim._artifact_ids or shim._collect_artifact_ids()
+    return frozenset(
+        k
+        for k, v in scope.items()
+        if id(v) in ids and k != "TYPE_CHECKING" and k != "Self"
+    )
+
+
+def module_scope(names: int, artifacts: int) -> dict[str, object]:
+    # a module scope of classes, functions and constants with a few typing artifacts
+    # imported from the shim
+    scope: dict[str, object] = {"__name__": "bench", "TYPE_CHECKING": False}
+    shim_names = ("TypeVar", "Generic", "Self", "cleanup_typing_artifacts")
+    for name in shim_names[:artifacts]:
+        scope[name] = getattr(shim, name)
+    for index in range(names):
+        kind = index % 3
+        if kind == 0:
+            scope[f"Class{index}"] = type(f"Class{index}", (), {})
+        elif kind == 1:
+            scope[f"function{index}"] = lambda: index
+        else:
+            scope[f"CONSTANT{index}"] = index
+    return scope
+
+
+def main() -> None:
+    rows = []
+    for names, artifacts in ((10, 2), (40, 4), (120, 4)):
+        scope = module_scope(names, artifacts)
+        assert scan_cleanup(scope) == id_cleanup(scope)
+        scan = best_of(lambda: scan_cleanup(scope), number=2_000)
+        ids = best_of(lambda: id_cleanup(scope), number=2_000)
+        rows.append((len(scope), len(id_cleanup(scope)), scan * 1e6, ids * 1e6))
+    table(
+        "cleaning up one module scope (us)",
+        ("names", "removed", "value scan", "identity set"),
+        rows,
+    )
+
+    print("stripped before deploying (bytes):")
+    root = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tg_gui")
+    report(strip_tree(root, None))
+
+
+if __name__ == "__main__":
+    main()
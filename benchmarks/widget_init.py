@@ -0,0 +1,58 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Compares widget construction throughput of the per-class specialized `__init__`
+against the generic `Widget.__init__` spec loop.
+"""
+
+from __future__ import annotations
+
+from ._harness import best_of, table
+
+from tg_gui.prelude import *
+
+
+class Label(Widget):
+    label: str = AttrDef(required=True)
+    font: str = AttrDef(default="menlo", init=True)
+    tags: list[str] = AttrDef(default_factory=list, init=True)
+    size: int = AttrDef(default=12, init=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class GenericLabel(Label):
+    # declaring __init__ opts out of specialization
+    __init__ = Widget.__init__
+
+
+def main(number: int = 20_000) -> None:
+    cases = {
+        "positional": lambda cls: cls("hello"),
+        "keyword": lambda cls: cls(label="hello", size=10),
+        "all args": lambda cls: cls("hello", "comic sans", [], 14),
+    }
+
+    rows: list[tuple[object, ...]] = []
+    for name, make in cases.items():
+        generic = best_of(lambda: make(GenericLabel), number=number)
+        special = best_of(lambda: make(Label), number=number)
+        rows.append(
+            (
+                name,
+                1 / generic / 1000,
+                1 / special / 1000,
+                generic / special,
+            )
+        )
+
+    table(
+        "widget construction (thousands of widgets / second)",
+        ("case", "generic loop", "specialized", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
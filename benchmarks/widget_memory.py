@@ -0,0 +1,118 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Reports the bytes used per widget instance and the time to read an attribute, against
+the layout before the specialized constructors, where the attribute values were kept
+under ":name" keys and a widget had no other fields.
+
+The attribute values are kept in the instance __dict__ (see AttrDef), so the growth is
+the bookkeeping fields a widget has now (parent, built widget, rect, ...), these are
+also measured in the previous layout. Micropython ignores `__slots__`, every field is
+an entry in the instance's map, run this on the board (gc.mem_alloc is used when
+tracemalloc is missing) to compare.
+"""
+
+from __future__ import annotations
+
+from ._harness import best_of, table
+
+from tg_gui.prelude import *
+from tg_gui.core import uid
+
+import gc
+
+try:
+    import tracemalloc
+except ImportError:  # circuitpython / micropython
+    tracemalloc = None
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+
+class Label(Widget):
+    label: str = AttrDef(required=True)
+    font: str = AttrDef(default="menlo", init=True)
+    size: int = AttrDef(default=12, init=True)
+    color: int = AttrDef(default=0xFFFFFF, init=True)
+
+    body = Body[Self](lambda self: self)
+
+
+class _PrivateIdAttr:
+    """the AttrDef descriptor used before, reads only"""
+
+    def __init__(self, name: str) -> None:
+        self._private_id = f":{name}"
+
+    def __get__(self, inst: Any, owner: Any) -> Any:
+        return getattr(inst, self._private_id)
+
+
+class DictBackedLabel:
+    """the storage layout used before, for comparison"""
+
+    label = _PrivateIdAttr("label")
+
+    def __init__(self, label: str) -> None:
+        self.uid = uid()
+        self.state_modified = True
+        setattr(self, ":label", label)
+        setattr(self, ":font", "menlo")
+        setattr(self, ":size", 12)
+        setattr(self, ":color", 0xFFFFFF)
+
+
+class DictBackedFieldsLabel(DictBackedLabel):
+    """the previous layout with the bookkeeping fields Widget has now"""
+
+    def __init__(self, label: str) -> None:
+        super().__init__(label)
+        self._parent_ = self._built_ = self._rect_ = self._layout_key_ = None
+        self._key_ = self._readers_ = self._reads_ = None
+        self._child_modified_ = False
+
+
+def bytes_per_instance(make: Callable[[], Any], count: int) -> float:
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+        keep = [make() for _ in range(count)]
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    else:
+        before = gc.mem_alloc()  # type: ignore
+        keep = [make() for _ in range(count)]
+        used = gc.mem_alloc() - before  # type: ignore
+    # do not count the list holding the instances
+    used -= len(keep) * 8
+    return used / count
+
+
+def main(count: int = 10_000) -> None:
+    label = "hello"
+    rows = [
+        (name, bytes_per_instance(make, count))
+        for name, make in (
+            ("before", lambda: DictBackedLabel(label)),
+            ("before, with the fields now", lambda: DictBackedFieldsLabel(label)),
+            ("now", lambda: Label(label)),
+        )
+    ]
+    table(f"memory per widget ({count} widgets)", ("layout", "bytes"), rows)
+
+    reads = [
+        (name, best_of(lambda: inst.label, number=100_000) * 1e9)
+        for name, inst in (
+            ("before", DictBackedLabel(label)),
+            ("now", Label(label)),
+        )
+    ]
+    table("reading an attribute", ("layout", "ns"), reads)
+
+
+if __name__ == "__main__":
+    main()
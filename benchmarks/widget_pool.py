@@ -0,0 +1,134 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Measures garbage collection pauses while scrolling a 1,000 row list one row per frame,
+rendered headless. The list shows 20 rows, each scroll step rebuilds them: either by
+allocating new widgets and dropping the old ones, or by releasing the old subtree to a
+WidgetPool and creating the new rows from it. Pauses are timed with `gc.callbacks`
+(cpython only), on micropython compare `gc.mem_free()` between frames instead.
+"""
+
+from __future__ import annotations
+
+import gc
+from time import perf_counter
+
+from ._harness import table
+
+from tg_gui.prelude import *
+from tg_gui import Text, Stack
+from tg_gui.core import WidgetPool
+from tg_gui.render import HeadlessRenderer
+
+ROWS = 1_000
+VISIBLE = 20
+
+# set per run, None allocates new widgets
+pool: WidgetPool | None = None
+
+
+def make(cls: type, *args: object) -> Any:
+    return cls(*args) if pool is None else pool.create(cls, *args)
+
+
+class ListRow(Widget):
+    index: int = AttrDef(required=True)
+
+    body = Body[Self](lambda self: make(Text, f"row {self.index:04} of {ROWS}"))
+
+
+class ScrollList(Widget):
+    offset: int = AttrDef(0, init=True)
+
+    def _body(self) -> Widget:
+        # the rows scrolled past are dropped, release them for re-use
+        if pool is not None and self._built_ is not None:
+            pool.release(self._built_)
+        last = min(ROWS, self.offset + VISIBLE)
+        return make(
+            Stack, tuple(make(ListRow, index) for index in range(self.offset, last))
+        )
+
+    body = Body[Self](_body)
+
+
+def run(pooled: bool) -> tuple[tuple[object, ...], bytes]:
+    global pool
+    pool = WidgetPool() if pooled else None
+    if pool is not None:
+        for cls in (Stack, ListRow, Text):
+            pool.register(cls, capacity=VISIBLE + 1)
+
+    pauses: list[float] = []
+    started = [0.0]
+
+    def on_gc(phase: str, info: dict) -> None:
+        if phase == "start":
+            started[0] = perf_counter()
+        else:
+            pauses.append(perf_counter() - started[0])
+
+    screen = ScrollList()
+    renderer = HeadlessRenderer(320, 240)
+    renderer.frame(screen)
+
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    start = perf_counter()
+    try:
+        for offset in range(1, ROWS):
+            screen.offset = offset
+            renderer.frame(screen)
+    finally:
+        gc.callbacks.remove(on_gc)
+    elapsed = perf_counter() - start
+
+    frames = ROWS - 1
+    pause_ms = sorted(pause * 1000 for pause in pauses) or [0.0]
+    reused = 0 if pool is None else sum(s["reused"] for s in pool.stats().values())
+    row = (
+        "widget pool" if pooled else "allocate",
+        len(pauses),
+        len(pauses) / frames * 100,
+        sum(pause_ms),
+        pause_ms[len(pause_ms) // 2],
+        pause_ms[-1],
+        elapsed / frames * 1000,
+        reused,
+    )
+    return row, bytes(renderer.framebuffer.buffer)
+
+
+def main() -> None:
+    allocated, expected = run(False)
+    pooled, pixels = run(True)
+    assert pixels == expected, "recycled widgets must render the same"
+    table(
+        f"scrolling a {ROWS} row list ({VISIBLE} visible) one row per frame",
+        (
+            "widgets",
+            "gc pauses",
+            "per 100 frames",
+            "total ms",
+            "median ms",
+            "max ms",
+            "frame ms",
+            "reused",
+        ),
+        [allocated, pooled],
+    )
+    if pool is not None:
+        keys = ("created", "reused", "released", "dropped", "free")
+        table(
+            "pool stats",
+            ("class",) + keys,
+            [
+                (name, *(counts[key] for key in keys))
+                for name, counts in pool.stats().items()
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
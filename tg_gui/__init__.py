@@ -3,41 +3,48 @@
 
 # intentionally excluding `from __future__ import annotations`
 
-# --- cpython compat ---
-# in on circuitpython, importing this first will patch the runtime closer to cpython compatible, as needed
-from . import platform_support as _
+# --- startup profiling ---
+# opt-in (see TG_GUI_PROFILE_STARTUP), must be imported first to see the other imports
+from . import _startup_profile
 
-from .platform_support import runtime_typing as _runtime_typing
-import sys as _sys
+# every import below is profiled, the hook is removed even if one of them raises
+try:
+    # --- cpython compat ---
+    # in on circuitpython, importing this first will patch the runtime closer to cpython compatible, as needed
+    from . import platform_support as _
 
+    from .platform_support import runtime_typing as _runtime_typing
 
-# --- versioning and (runtime) linting ---
-# add some import warnings regarding future async compatiblity issues
-from . import _async_prep as _
+    # --- versioning and (runtime) linting ---
+    # add some import warnings regarding future async compatiblity issues
+    from . import _async_prep as _
 
+    # --- typing ---
+    from typing import TYPE_CHECKING
 
-# --- typing ---
-from typing import TYPE_CHECKING
-
+    if TYPE_CHECKING or _runtime_typing():
+        __all__ = ()
+        from .group import Group, Stack, Row
+        from .text import Text
+        from .list_view import ListView
+finally:
+    _startup_profile.finish()
 
 if TYPE_CHECKING:
     from typing import Any
 
 # --- lazy module evaluation ---
 
-__module_exports: dict[str, str | tuple["Any"]] = {
-    # unimported = "<the module name>"
-    # imported = (<the object to return>,) # in a tuple
+__module_exports: dict[str, str] = {
+    # "<the exported name>": "<the submodule it is imported from>"
     "Text": "text",
     "Group": "group",
+    "Stack": "group",
+    "Row": "group",
+    "ListView": "list_view",
     "sleep": "_async_prep",
 }
 
-if TYPE_CHECKING or _runtime_typing():
-    __all__ = ()
-    from .group import Group
-    from .text import Text
-
 
 def __getattr__(name: str) -> "Any":
     try:
@@ -46,20 +53,11 @@ def __getattr__(name: str) -> "Any":
         args = err.args
         raise AttributeError(*args)
 
-    if isinstance(pack, tuple):  # than it has already been imported
-        (obj,) = pack
-        return obj
-    else:  # import it and then cache it
-        # obj = getattr(__import__(f"{__name__}.{pack}"), name)
-        obj = None
-        if TYPE_CHECKING:
-            obj: Any = None
-
-        # a rule of thumb check that builtins have not been messed with
-        assert "builtin" not in _sys.modules
-
-        # due to incompatibility issues this is the best balance to import
-        exec(f"from .{pack} import {name}")
+    # a relative __import__ (level=1) is supported on all the ports and does not compile
+    # any code at runtime, unlike `exec("from . import ...")`
+    module = __import__(pack, globals(), None, (name,), 1)
 
-        __module_exports[name] = (locals()[name],)
-        return obj
+    # cache the export in the module globals so later lookups skip __getattr__
+    obj = globals()[name] = getattr(module, name)
+    del __module_exports[name]
+    return obj
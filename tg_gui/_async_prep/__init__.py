@@ -2,7 +2,6 @@
 # this file is licensed under the MIT License, see the project root.
 
 import sys as _sys
-from time import sleep
 from . import time
 
 
@@ -11,6 +10,18 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     __all__ = ("sleep",)
 
+
+async def sleep(seconds: float) -> None:
+    """
+    waits for `seconds` without blocking the tg_gui event loop (see loop.py), use
+    `await sleep(...)` in place of time.sleep(...).
+    """
+    # asyncio is slow to import, it is only loaded once something is awaited
+    from .loop import asyncio
+
+    await asyncio.sleep(seconds)
+
+
 # patch in a version of the time module that warns to use tg_gui.sleep
 _sys.modules.pop(time.__name__)
 _sys.modules["time"] = time
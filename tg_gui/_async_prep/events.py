@@ -0,0 +1,254 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Batched input dispatch. Touch controllers report moves far faster than frames are
+drawn, an InputPipeline queues the polled events instead of handling each one as it
+arrives: consecutive moves of the same pointer are coalesced into the latest one and
+the queue is dispatched in one pass per frame, before the rebuild (see EventLoop).
+
+`InputRecording` holds a replayable, timestamped stream of events, `synthetic_drags`
+generates one for benchmarks.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import (
+    cleanup_typing_artifacts,
+    runtime_typing,
+    ticks_us,
+    ticks_diff,
+)
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any, Callable, Iterable
+
+    __all__ = (
+        "PRESS",
+        "MOVE",
+        "RELEASE",
+        "KEY",
+        "InputEvent",
+        "InputPipeline",
+        "InputRecording",
+        "synthetic_drags",
+    )
+
+# event kinds
+PRESS = 0
+MOVE = 1
+RELEASE = 2
+KEY = 3
+
+_KIND_NAMES = ("press", "move", "release", "key")
+
+
+class InputEvent:
+    """
+    A pointer (touch) or key event. `pointer` tells touches apart on multi-touch
+    controllers, `key` is set for KEY events and `time` is when it occurred (ticks_us).
+    """
+
+    __slots__ = ("kind", "pointer", "x", "y", "key", "time")
+
+    def __init__(
+        self,
+        kind: int,
+        x: int = 0,
+        y: int = 0,
+        pointer: int = 0,
+        key: Any = None,
+        time: int | None = None,
+    ) -> None:
+        self.kind = kind
+        self.pointer = pointer
+        self.x = x
+        self.y = y
+        self.key = key
+        self.time = ticks_us() if time is None else time
+
+    def __repr__(self) -> str:
+        if self.kind == KEY:
+            return f"<InputEvent key {self.key!r}>"
+        return (
+            f"<InputEvent {_KIND_NAMES[self.kind]} {self.x},{self.y} "
+            + f"pointer {self.pointer}>"
+        )
+
+
+class InputPipeline:
+    """
+    Queues input events and dispatches them to `handle` once per frame (see the module
+    docstring). Events that are not InputEvents are queued and dispatched as they are.
+
+    Counters: `raw` events pushed, `coalesced` moves merged into a later one,
+    `dispatched` events handed to `handle` and `batches` non-empty dispatches.
+    """
+
+    def __init__(self, handle: Callable[[Any], None] | None = None) -> None:
+        self.handle = handle
+        self.raw = 0
+        self.coalesced = 0
+        self.dispatched = 0
+        self.batches = 0
+        self._queue: list[Any] = []
+        # the position in the queue of each pointer's trailing move, if any
+        self._moves: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def push(self, event: Any) -> None:
+        """queues `event`, replacing the queued move of the same pointer if it is one"""
+        self.raw += 1
+        queue = self._queue
+        if not isinstance(event, InputEvent):
+            queue.append(event)
+            return
+
+        moves = self._moves
+        pointer = event.pointer
+        if event.kind == MOVE:
+            at = moves.get(pointer)
+            if at is not None:
+                # keep when the first of the merged moves occurred, for latency
+                event.time = queue[at].time
+                queue[at] = event
+                self.coalesced += 1
+                return
+            moves[pointer] = len(queue)
+        elif event.kind != KEY:
+            # a press or release ends the run of moves it follows
+            moves.pop(pointer, None)
+        queue.append(event)
+
+    def extend(self, events: Iterable[Any]) -> None:
+        for event in events:
+            self.push(event)
+
+    def dispatch(self) -> int:
+        """
+        hands the queued events to `handle`, in order, and empties the queue.
+        :returns: the number of events dispatched
+        """
+        queue = self._queue
+        if not queue:
+            return 0
+        self._queue = []
+        self._moves = {}
+        self.batches += 1
+        self.dispatched += len(queue)
+        handle = self.handle
+        if handle is not None:
+            for event in queue:
+                handle(event)
+        return len(queue)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "raw": self.raw,
+            "coalesced": self.coalesced,
+            "dispatched": self.dispatched,
+            "batches": self.batches,
+            "queued": len(self._queue),
+        }
+
+
+class InputRecording:
+    """
+    A replayable stream of events, each stored with its offset in microseconds from the
+    start of the recording. `play()` starts a replay and returns a poll function that
+    returns the events that are due, re-timed to when they occur during the replay.
+    """
+
+    def __init__(self, events: Iterable[tuple[int, InputEvent]] = ()) -> None:
+        self.events: list[tuple[int, InputEvent]] = list(events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def record(self, offset_us: int, event: InputEvent) -> None:
+        self.events.append((offset_us, event))
+
+    @property
+    def duration_us(self) -> int:
+        return self.events[-1][0] if self.events else 0
+
+    def play(self, start: int | None = None) -> Callable[[], list[InputEvent]]:
+        events = self.events
+        begin = ticks_us() if start is None else start
+        position = [0]
+
+        def poll() -> list[InputEvent]:
+            now = ticks_diff(ticks_us(), begin)
+            index = position[0]
+            due: list[InputEvent] = []
+            while index < len(events) and events[index][0] <= now:
+                offset, event = events[index]
+                due.append(
+                    InputEvent(
+                        event.kind,
+                        event.x,
+                        event.y,
+                        event.pointer,
+                        event.key,
+                        begin + offset,
+                    )
+                )
+                index += 1
+            position[0] = index
+            return due
+
+        return poll
+
+
+def synthetic_drags(
+    duration: float,
+    sample_hz: int = 400,
+    pointers: int = 1,
+    width: int = 320,
+    height: int = 240,
+    keys_per_second: int = 4,
+    seed: int = 1,
+) -> InputRecording:
+    """
+    :returns: a recording of `pointers` fingers dragging across the screen, reporting
+    a move every 1 / `sample_hz` seconds, lifting and pressing again every ~200 ms, with
+    key presses in between.
+    """
+    # a small lcg, the same on every port
+    state = [seed]
+
+    def rand(limit: int) -> int:
+        state[0] = (state[0] * 1103515245 + 12345) & 0x7FFFFFFF
+        return state[0] % limit
+
+    recording = InputRecording()
+    period = 1_000_000 // sample_hz
+    end = int(duration * 1_000_000)
+    stroke = 200_000 // period
+    key_every = 1_000_000 // keys_per_second if keys_per_second else end + 1
+    positions = [[rand(width), rand(height)] for _ in range(pointers)]
+    for step, offset in enumerate(range(0, end, period)):
+        for pointer, position in enumerate(positions):
+            if step % stroke == 0:
+                if step:
+                    recording.record(
+                        offset, InputEvent(RELEASE, *position, pointer, time=0)
+                    )
+                position[0] = rand(width)
+                position[1] = rand(height)
+                kind = PRESS
+            else:
+                position[0] = min(width - 1, max(0, position[0] + rand(7) - 3))
+                position[1] = min(height - 1, max(0, position[1] + rand(7) - 3))
+                kind = MOVE
+            recording.record(offset, InputEvent(kind, *position, pointer, time=0))
+        if offset % key_every < period:
+            recording.record(offset, InputEvent(KEY, key=rand(26), time=0))
+    return recording
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,192 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+The cooperative event loop behind `tg_gui.sleep`. A single asyncio (uasyncio on
+micropython and circuitpython) loop runs the input polling, the state updates (rebuilds)
+and the rendering of a root widget as tasks, next to any user tasks that
+`await tg_gui.sleep(...)` instead of blocking.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import (
+    cleanup_typing_artifacts,
+    runtime_typing,
+    ticks_us,
+    ticks_diff,
+)
+
+from .scheduler import FrameScheduler
+from .events import InputPipeline
+
+try:
+    import asyncio
+except ImportError:  # micropython
+    import uasyncio as asyncio  # type: ignore
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any, Callable, Iterable, Coroutine
+
+    __all__ = ("EventLoop", "run")
+
+if TYPE_CHECKING:
+    from ..core.widget import Widget
+    from ..render.headless import HeadlessRenderer
+
+
+class EventLoop:
+    """
+    Drives a root widget. Every `input_interval` seconds the input task polls for events
+    and hands each one to `handle_input` (which applies the state changes), every
+    `frame_interval` seconds the frame task renders a frame with `renderer`, which also
+    rebuilds the modified widgets. Neither blocks the other or user tasks.
+
+    With `budget_us` frames are rendered by a FrameScheduler: each frame interval runs
+    at most that much rendering work, deferring the rest to the next interval, and input
+    is polled between the chunks of a frame as well.
+
+    With `coalesce_input` the polled events are queued in an InputPipeline (`pipeline`),
+    which coalesces the moves of each pointer, and handed to `handle_input` in one batch
+    at the start of each frame, before its rebuild.
+
+    `latencies_us` records, for each input event, the microseconds from when it occurred
+    (`event_time(event)`, by default when it was polled) to when the frame showing its
+    effects finished rendering.
+    """
+
+    def __init__(
+        self,
+        root: Widget,
+        renderer: HeadlessRenderer,
+        poll_input: Callable[[], Iterable[Any]] | None = None,
+        handle_input: Callable[[Any], None] | None = None,
+        frame_interval: float = 1 / 30,
+        input_interval: float = 0.005,
+        event_time: Callable[[Any], int] | None = None,
+        budget_us: int | None = None,
+        band_rows: int | None = 32,
+        coalesce_input: bool = False,
+    ) -> None:
+        self.root = root
+        self.renderer = renderer
+        self.poll_input = poll_input
+        self.handle_input = handle_input
+        self.frame_interval = frame_interval
+        self.input_interval = input_interval
+        self.event_time = event_time
+        self.scheduler = (
+            None
+            if budget_us is None
+            else FrameScheduler(renderer, budget_us, band_rows)
+        )
+        self.pipeline = InputPipeline(handle_input) if coalesce_input else None
+        self.frames = 0
+        self.latencies_us: list[int] = []
+        # the time of the input events not yet shown in a frame
+        self._unshown: list[int] = []
+        self._last_poll = ticks_us()
+        self._running = False
+        self._tasks: list[Any] = []
+        # the coroutines spawned while not running, started by run()
+        self._spawned: list[Coroutine[Any, Any, Any]] = []
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """
+        run a user coroutine on the loop, it is cancelled when the loop stops. Coroutines
+        spawned before `run()` are started by it.
+        """
+        if self._running:
+            self._tasks.append(asyncio.create_task(coro))
+        else:
+            self._spawned.append(coro)
+
+    def stop(self) -> None:
+        self._running = False
+
+    async def run(self, duration: float | None = None) -> None:
+        """runs until `stop()` is called, or for `duration` seconds"""
+        self._running = True
+        tasks = self._tasks
+        tasks.append(asyncio.create_task(self._frame_task()))
+        if self.poll_input is not None:
+            tasks.append(asyncio.create_task(self._input_task()))
+        spawned = self._spawned
+        for coro in spawned:
+            tasks.append(asyncio.create_task(coro))
+        spawned.clear()
+
+        try:
+            if duration is None:
+                while self._running:
+                    await asyncio.sleep(self.frame_interval)
+            else:
+                await asyncio.sleep(duration)
+        finally:
+            self._running = False
+            for task in tasks:
+                task.cancel()
+            tasks.clear()
+
+    def poll(self) -> None:
+        """polls for and handles input, at most once per `input_interval`"""
+        now = ticks_us()
+        if ticks_diff(now, self._last_poll) < self.input_interval * 1_000_000:
+            return
+        self._last_poll = now
+
+        poll = self.poll_input
+        pipeline = self.pipeline
+        handle = self.handle_input if pipeline is None else pipeline.push
+        event_time = self.event_time
+        assert poll is not None
+        for event in poll():
+            self._unshown.append(now if event_time is None else event_time(event))
+            if handle is not None:
+                handle(event)
+
+    async def _input_task(self) -> None:
+        while self._running:
+            self.poll()
+            await asyncio.sleep(self.input_interval)
+
+    async def _frame_task(self) -> None:
+        scheduler = self.scheduler
+        pipeline = self.pipeline
+        poll = None if self.poll_input is None else self.poll
+        shown: list[int] = []
+        while self._running:
+            start = ticks_us()
+            # inputs polled after a frame starts are shown by the next frame
+            if scheduler is None or not scheduler.in_frame:
+                shown = self._unshown
+                self._unshown = []
+                if pipeline is not None:
+                    pipeline.dispatch()
+
+            if scheduler is None:
+                self.renderer.frame(self.root)
+                done = True
+            else:
+                done = scheduler.tick(self.root, poll)
+
+            end = ticks_us()
+            if done:
+                self.frames += 1
+                self.latencies_us += [ticks_diff(end, polled) for polled in shown]
+
+            # sleep for the rest of the frame interval, but always yield
+            elapsed = ticks_diff(end, start) / 1_000_000
+            await asyncio.sleep(max(0, self.frame_interval - elapsed))
+
+
+def run(root: Widget, renderer: HeadlessRenderer, **kwargs: Any) -> EventLoop:
+    """creates an EventLoop for `root` and runs it until stopped"""
+    loop = EventLoop(root, renderer, **kwargs)
+    asyncio.run(loop.run())
+    return loop
+
+
+cleanup_typing_artifacts(locals())
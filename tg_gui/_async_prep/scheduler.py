@@ -0,0 +1,116 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Budgeted frame rendering. A frame's rebuild, layout and rasterization are run as
+resumable chunks (see HeadlessRenderer.steps), each tick of the scheduler runs chunks
+until the per-frame budget is spent and leaves the rest of the frame for the next tick.
+Input is polled between chunks so it is handled ahead of rendering.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import (
+    cleanup_typing_artifacts,
+    runtime_typing,
+    ticks_us,
+    ticks_diff,
+)
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Callable, Iterator
+
+    __all__ = ("FrameScheduler",)
+
+if TYPE_CHECKING:
+    from ..core.widget import Widget
+    from ..render.headless import HeadlessRenderer
+
+
+class FrameScheduler:
+    """
+    Renders frames of a root widget with at most `budget_us` microseconds of work per
+    tick (one tick per frame interval, see EventLoop). A frame that does not finish in
+    the tick it started in misses its deadline and is finished by the following ticks.
+
+    `phase_us` holds the time spent per phase ("input", "build", "layout", "raster")
+    across all ticks, `missed` the number of frames that missed their deadline.
+    """
+
+    def __init__(
+        self,
+        renderer: HeadlessRenderer,
+        budget_us: int = 20_000,
+        band_rows: int | None = 32,
+    ) -> None:
+        self.renderer = renderer
+        self.budget_us = budget_us
+        # the most rows rasterized per chunk
+        self.band_rows = band_rows
+        self.ticks = 0
+        self.frames = 0
+        self.missed = 0
+        self.phase_us = {"input": 0, "build": 0, "layout": 0, "raster": 0}
+        self._steps: Iterator[str] | None = None
+        # the phase of the chunk the current frame will run next
+        self._phase: str | None = None
+        self._frame_ticks = 0
+
+    @property
+    def in_frame(self) -> bool:
+        """if a frame was started and is not finished yet"""
+        return self._steps is not None
+
+    def tick(self, root: Widget, poll: Callable[[], object] | None = None) -> bool:
+        """
+        runs the current frame (starting a new one if needed) until it is done or the
+        budget is spent. `poll` is called before each chunk, its time is counted as
+        "input" and against the budget.
+        :returns: if a frame was finished
+        """
+        start = ticks_us()
+        budget_us = self.budget_us
+        phase_us = self.phase_us
+
+        steps = self._steps
+        if steps is None:
+            steps = self._steps = self.renderer.steps(root, self.band_rows)
+            self._phase = None
+            self._frame_ticks = 0
+        self.ticks += 1
+        self._frame_ticks += 1
+
+        last = start
+        while True:
+            if poll is not None:
+                poll()
+                now = ticks_us()
+                phase_us["input"] += ticks_diff(now, last)
+                last = now
+
+            # runs the chunk announced last, and announces the next one (if any)
+            try:
+                upcoming: str | None = next(steps)
+            except StopIteration:
+                upcoming = None
+            now = ticks_us()
+            if self._phase is not None:
+                phase_us[self._phase] += ticks_diff(now, last)
+            last = now
+            self._phase = upcoming
+            if upcoming is None:
+                break
+            # at least one chunk is run per tick so a frame always progresses
+            if ticks_diff(last, start) >= budget_us:
+                return False
+
+        self._steps = None
+        self.frames += 1
+        if self._frame_ticks > 1:
+            self.missed += 1
+        return True
+
+
+cleanup_typing_artifacts(locals())
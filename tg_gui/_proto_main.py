@@ -12,8 +12,12 @@ if TYPE_CHECKING:
     W = TypeVar("W")
 
 
+from .core.rebuild import rebuild
+
+
 def main(maincls: type[W]) -> type[W]:
     mainwid = maincls()
+    rebuild(mainwid)
 
     print("main(...):", mainwid)
 
@@ -0,0 +1,141 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+# intentionally excluding `from __future__ import annotations` and typing imports, this
+# module is imported before platform_support patches them in on circuitpython
+
+"""
+Opt-in instrumentation of tg_gui's own import. When the `TG_GUI_PROFILE_STARTUP`
+variable is set (an environment variable on cpython, `settings.toml` on circuitpython)
+each tg_gui submodule import is timed and its heap delta recorded, then a report is
+printed once `import tg_gui` finishes. On cpython, heap deltas are only available when
+tracemalloc is tracing (ex: `python -X tracemalloc`).
+
+The records stay available as `tg_gui._startup_profile.records()`, each entry is
+`(module, total_us, self_us, heap_bytes | None)` in the order the imports finished.
+"""
+
+import sys
+import gc
+
+# (the same timer as platform_support's ticks_us, which cannot be imported yet)
+try:  # micropython
+    from time import ticks_us as _ticks, ticks_diff as _ticks_diff  # type: ignore
+except ImportError:
+    try:  # cpython
+        from time import perf_counter_ns as _ticks_ns
+    except ImportError:  # circuitpython
+        from time import monotonic_ns as _ticks_ns  # type: ignore
+
+    _ticks = lambda: _ticks_ns() // 1000
+    _ticks_diff = lambda end, start: end - start
+
+
+def _setting() -> "str | None":
+    try:
+        from os import getenv  # type: ignore
+    except ImportError:  # micropython has no getenv
+        return None
+    return getenv("TG_GUI_PROFILE_STARTUP")
+
+
+def _heap_getter():
+    if hasattr(gc, "mem_alloc"):
+        return gc.mem_alloc  # type: ignore
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    if not tracemalloc.is_tracing():
+        return None
+    return lambda: tracemalloc.get_traced_memory()[0]
+
+
+enabled = _setting() not in (None, "", "0")
+
+_records: "list[tuple[str, int, int, int | None]]" = []
+_start = _ticks()
+
+
+def records() -> "list[tuple[str, int, int, int | None]]":
+    return list(_records)
+
+
+if enabled:
+    import builtins
+
+    _heap = _heap_getter()
+    _builtin_import = builtins.__import__
+    # the time spent in nested profiled imports, per level of the import stack
+    _child_us: "list[int]" = [0]
+    _seen: "set[str]" = set()
+
+    def _resolve(name: str, globals: "dict | None", level: int) -> str:
+        if level == 0 or globals is None:
+            return name
+        package = globals.get("__package__") or globals.get("__name__", "")
+        if level > 1:
+            package = package.rsplit(".", level - 1)[0]
+        return f"{package}.{name}" if name else package
+
+    def _profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+        target = _resolve(name, globals, level)
+        if not target.startswith("tg_gui"):
+            return _builtin_import(name, globals, locals, fromlist, level)
+
+        # the modules this import may load: the target, its parent packages and any
+        # `from . import x` submodules
+        parts = target.split(".")
+        candidates = [".".join(parts[:end]) for end in range(1, len(parts) + 1)]
+        candidates += [f"{target}.{item}" for item in fromlist or ()]
+        fresh = [mod for mod in candidates if mod not in sys.modules]
+
+        heap_before = _heap() if _heap is not None else None
+        _child_us.append(0)
+        start = _ticks()
+        try:
+            return _builtin_import(name, globals, locals, fromlist, level)
+        finally:
+            total = _ticks_diff(_ticks(), start)
+            children = _child_us.pop()
+            _child_us[-1] += total
+
+            # nested imports have already recorded the modules they loaded
+            loaded = [mod for mod in fresh if mod in sys.modules and mod not in _seen]
+            _seen.update(loaded)
+            if loaded:
+                heap = (
+                    _heap() - heap_before
+                    if _heap is not None and heap_before is not None
+                    else None
+                )
+                _records.append((", ".join(loaded), total, total - children, heap))
+
+    try:
+        builtins.__import__ = _profiled_import
+    except (AttributeError, TypeError):  # ports that cannot override builtins
+        pass
+
+
+def finish() -> None:
+    """
+    called at the end of tg_gui's __init__, stops recording and prints the report
+    """
+    global enabled
+    if not enabled:
+        return
+    enabled = False
+
+    import builtins
+
+    if builtins.__import__ is _profiled_import:
+        builtins.__import__ = _builtin_import
+
+    _records.append(("tg_gui (total)", _ticks_diff(_ticks(), _start), 0, None))
+    report()
+
+
+def report() -> None:
+    print("tg_gui startup profile (us total / us self / heap bytes):")
+    for module, total, self_us, heap in _records:
+        print(f"  {total:>8} {self_us:>8} {'?' if heap is None else heap:>8}  {module}")
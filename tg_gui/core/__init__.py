@@ -5,3 +5,6 @@
 from .shared import UID, uid, by_uid, Maybe, Missing, MissingType
 from .attrdef import AttrDef
 from .widget import Widget, Body
+from .rebuild import rebuild
+from .pool import WidgetPool
+from .state import State, flush_state, forget
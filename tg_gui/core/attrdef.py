@@ -41,55 +41,72 @@ def isattrdef(o: Any | AttrDef[Any]) -> TypeGuard[AttrDef[Any]]:
 
 
 class AttrDef(Generic[T]):
+    # the init kind (and how to fill a missing argument) is resolved once on creation
+    __slots__ = (
+        "uid",
+        "name",
+        "owning_type",
+        "init_kind",
+        "in_init",
+        "_default",
+        "_default_factory",
+        "_fill_missing",
+        "_private_id",
+    )
+
     uid: UID
     name: str
     owning_type: type[Widget]
-    _in_init: bool = False
-    _default: Maybe[T] = Missing
-    _default_factory: Maybe[Callable[[], T]] = Missing
+    init_kind: InitKind
+    in_init: bool
+    _default: Maybe[T]
+    _default_factory: Maybe[Callable[[], T]]
+    _fill_missing: Callable[[Widget], T]
+    # the instance attribute holding the value, the "__tg_" prefix is reserved (see
+    # specialize.py) so it cannot clash with another attribute
     _private_id: str
 
-    @property
-    def init_kind(self) -> InitKind:
-        if isnotmissing(self._default):
-            return InitKind.default
-        elif isnotmissing(self._default_factory):
-            return InitKind.default_factory
-        else:
-            return InitKind.required
-
-    @property
-    def in_init(self) -> bool:
-        return self._in_init
-
     def __set_name__(self, owner: type[Widget], name: str) -> None:
         self.name = name
         self.owning_type = owner
-        self._private_id = f":{self.name}"
-
-    def __get__(self, inst: Widget, iscls: type[Widget] | None) -> T:
-        return getattr(inst, self._private_id)
+        self._private_id = f"__tg_{name}"
+
+    def __get__(self, inst: Widget | None, iscls: type[Widget] | None) -> T:
+        if inst is None:
+            return self  # type: ignore
+        try:
+            return getattr(inst, self._private_id)
+        except AttributeError:
+            raise AttributeError(
+                f"{inst.__class__.__name__} widget has no value for {repr(self.name)}"
+            ) from None
 
     def __set__(self, inst: Widget, value: T) -> None:
         setattr(inst, self._private_id, value)
+        if not inst.state_modified:
+            inst.mark_modified()
 
     def init(self, inst: Widget, value: Maybe[T] = Missing) -> None:
-        if ismissing(value):
-            if self.init_kind == InitKind.required:
-                raise TypeError(
-                    f"{inst.__class__.__name__}(...) missing required argument "
-                    + repr(self.name)
-                )
-            elif self.init_kind == InitKind.default:
-                assert isnotmissing(self._default)
-                value = self._default
-            else:
-                assert self.init_kind == InitKind.default_factory
-                assert isnotmissing(self._default_factory)
-                value = self._default_factory()
+        if value is Missing:
+            value = self._fill_missing(inst)
         assert isnotmissing(value)
         self.__set__(inst, value)
 
+    # --- per init kind handling of missing arguments (see _fill_missing) ---
+    def _missing_required(self, inst: Widget) -> T:
+        raise TypeError(
+            f"{inst.__class__.__name__}(...) missing required argument "
+            + repr(self.name)
+        )
+
+    def _missing_default(self, inst: Widget) -> T:
+        assert isnotmissing(self._default)
+        return self._default
+
+    def _missing_default_factory(self, inst: Widget) -> T:
+        assert isnotmissing(self._default_factory)
+        return self._default_factory()
+
     if TYPE_CHECKING:
         # FUTURE: add __new__ overloads to specialize State into SequenceState and MappingState as needed
 
@@ -158,25 +175,31 @@ class AttrDef(Generic[T]):
             required: Maybe[Literal[True]] = Missing,
             init: Maybe[bool] = Missing,
         ) -> None:
+            self._default = default
+            self._default_factory = default_factory
+
             if isnotmissing(required):
                 assert ismissing(default)
                 assert ismissing(default_factory)
                 assert init is not False
                 init = True
-
-                self._init_kind = InitKind.required
             elif isnotmissing(default):
                 assert ismissing(required)
                 assert ismissing(default_factory)
-
-                self._default = default
             if isnotmissing(default_factory):
                 assert ismissing(required)
                 assert ismissing(default)
 
-                self._default_factory = default_factory
+            if isnotmissing(default):
+                self.init_kind = InitKind.default
+                self._fill_missing = self._missing_default
+            elif isnotmissing(default_factory):
+                self.init_kind = InitKind.default_factory
+                self._fill_missing = self._missing_default_factory
+            else:
+                self.init_kind = InitKind.required
+                self._fill_missing = self._missing_required
 
-            if init is True:
-                self._in_init = True
+            self.in_init = init is True
 
             self.uid = uid()
@@ -0,0 +1,105 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import runtime_typing
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+try:
+    from collections import OrderedDict
+except ImportError:  # micropython
+    from ucollections import OrderedDict  # type: ignore
+
+if TYPE_CHECKING or runtime_typing():
+    __all__ = ("LRUCache",)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A least recently used cache bounded by the total weight of its entries (ex: widget
+    count or bytes), with hit/miss counters. Only OrderedDict insertion order is used
+    so this works on the micro-controller ports.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        # re-insert to mark as the most recently used
+        self._entries[key] = entry
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: K, value: V, weight: int = 1) -> bool:
+        """
+        :returns: if the value was stored, values heavier than the capacity are not
+        """
+        entries = self._entries
+        old = entries.pop(key, None)
+        if old is not None:
+            self.weight -= old[1]
+        if weight > self.capacity:
+            return False
+        entries[key] = (value, weight)
+        self.weight += weight
+        self._evict()
+        return True
+
+    def pop(self, key: K) -> V | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.weight -= entry[1]
+        return entry[0]
+
+    def pop_oldest(self) -> tuple[K, V] | None:
+        """evicts the least recently used entry, :returns: it as (key, value)"""
+        entries = self._entries
+        if not entries:
+            return None
+        oldest = next(iter(entries))
+        value, weight = entries.pop(oldest)
+        self.weight -= weight
+        self.evictions += 1
+        return (oldest, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.weight = 0
+
+    def resize(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._evict()
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _evict(self) -> None:
+        while self.weight > self.capacity and self._entries:
+            self.pop_oldest()
+
+
+cleanup_typing_artifacts(locals())
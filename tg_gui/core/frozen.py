@@ -0,0 +1,42 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+The widget class tables and constructors precomputed by `python -m tools.freeze_specs`
+for a firmware image, read from `tg_gui/_frozen_specs.py` when it is deployed and empty
+otherwise. Entries are keyed by "module.Class" and only used when they still match the
+class (see Widget.__init_subclass__ and specialize.py).
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import runtime_typing
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Callable
+
+    __all__ = ("frozen_specs", "frozen_inits", "frozen_key")
+
+if TYPE_CHECKING:
+    from .widget import Widget
+
+frozen_specs: dict[str, tuple[tuple[str, ...], tuple[str, ...]]]
+frozen_inits: dict[str, tuple[str, Callable[..., Callable[..., None]]]]
+
+try:
+    from .._frozen_specs import specs as frozen_specs  # type: ignore
+    from .._frozen_specs import inits as frozen_inits  # type: ignore
+except ImportError:
+    frozen_specs = {}
+    frozen_inits = {}
+
+
+def frozen_key(cls: type[Widget]) -> str:
+    return f"{getattr(cls, '__module__', '')}.{cls.__name__}"
+
+
+cleanup_typing_artifacts(locals())
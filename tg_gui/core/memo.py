@@ -0,0 +1,123 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Opt-in memoization of `body`. Declare a body with
+`Body[Self].memoized(lambda self: ...)` and the subtrees it returns are kept in
+`body_cache`, keyed by the widget and its AttrDef values. Re-evaluating the body with
+values it has already been built with re-uses the stored subtree instead of calling the
+body again.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import runtime_typing, Missing
+from .cache import LRUCache
+from .state import State, record_read, tracked_reads
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any, Callable
+
+    from .shared import UID
+
+    __all__ = ("MemoizedBody", "BodyCache", "body_cache")
+
+if TYPE_CHECKING:
+    from .widget import Widget
+
+W = TypeVar("W", bound="Widget")
+
+
+class BodyCache(LRUCache["tuple[UID, tuple[Any, ...]]", "Widget"]):
+    """
+    The subtrees built by memoized bodies. The capacity is the number of widgets the
+    cached subtrees may hold in total.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        super().__init__(capacity)
+        # evaluations with an unhashable attribute value or that read another widget's
+        # State, these are never cached
+        self.uncacheable = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "uncacheable": self.uncacheable,
+            "entries": len(self),
+            "widgets": self.weight,
+        }
+
+
+body_cache = BodyCache()
+
+
+class MemoizedBody(Generic[W]):
+    """
+    wraps a body function, see `Body[Self].memoized(...)`
+    """
+
+    def __init__(
+        self, method: Callable[[W], Widget], cache: BodyCache | None = None
+    ) -> None:
+        self._method = method
+        self._cache = cache
+
+    def __get__(self, inst: W | None, owner: type[W]) -> Any:
+        if inst is None:
+            return self
+        return lambda: self.evaluate(inst)
+
+    def evaluate(self, inst: W) -> Widget:
+        cache = body_cache if self._cache is None else self._cache
+
+        key = (inst.uid, _values(inst))
+        try:
+            built = cache.get(key)  # type: ignore
+        except TypeError:  # unhashable attribute value
+            cache.uncacheable += 1
+            return self._method(inst)
+
+        if built is None:
+            reads = tracked_reads[0]
+            built = self._method(inst)
+            # the subtree depends on another widget's States, which are not in the key,
+            # and a hit would not record the widget as their reader again. such bodies
+            # are re-evaluated every time
+            if tracked_reads[0] != reads:
+                cache.uncacheable += 1
+            else:
+                cache.put(key, built, _tree_size(built))
+        else:
+            # the widget's own States are in the key, but a hit does not record it as
+            # their reader again for their next write
+            for spec in type(inst)._attr_specs_.values():
+                if isinstance(spec, State):
+                    record_read(inst, spec.name, inst)
+        return built
+
+
+def _values(inst: Widget) -> tuple[Any, ...]:
+    # the attribute values of `inst`, in `_attr_specs_` order
+    return tuple(
+        getattr(inst, spec._private_id, Missing)
+        for spec in type(inst)._attr_specs_.values()
+    )
+
+
+def _tree_size(widget: Widget) -> int:
+    # the subtree may not have been built yet, then count the declared children
+    if widget._built_ is None:
+        children = widget._children_()
+    else:
+        children = widget.subwidgets()
+    return 1 + sum(_tree_size(child) for child in children)
+
+
+cleanup_typing_artifacts(locals())
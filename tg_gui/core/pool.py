@@ -0,0 +1,118 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Recycling of widget instances for list-like UIs. Widgets of the classes registered with
+a WidgetPool are kept when their subtree is released and handed out again by `create`,
+re-initialized through the class's constructor (so every attribute is reset from its
+`_arg_specs_`), instead of allocating new ones. This keeps the allocation rate, and so
+the garbage collection pauses, down while scrolling.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import runtime_typing
+from .state import drop_reader
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any
+
+    __all__ = ("WidgetPool",)
+
+if TYPE_CHECKING:
+    from .widget import Widget
+
+W = TypeVar("W", bound="Widget")
+
+
+class WidgetPool:
+    """
+    Free lists of released widgets, one per registered class. Only the registered
+    classes are pooled, release a subtree only once nothing else references it (ex: it
+    is not held in an attribute or a memoized body's cache).
+    """
+
+    def __init__(self) -> None:
+        # the free instances, capacity and if uids are kept, by class
+        self._free: dict[type[Widget], list[Widget]] = {}
+        self._capacity: dict[type[Widget], int] = {}
+        self._keep_uid: dict[type[Widget], bool] = {}
+        self._stats: dict[type[Widget], list[int]] = {}
+
+    def register(
+        self, cls: type[Widget], capacity: int = 32, keep_uid: bool = False
+    ) -> None:
+        """
+        pools up to `capacity` released instances of `cls` (not its subclasses). With
+        `keep_uid` a recycled widget keeps the uid it had, otherwise it gets a new one.
+        """
+        self._free.setdefault(cls, [])
+        self._capacity[cls] = capacity
+        self._keep_uid[cls] = keep_uid
+        # created, reused, released, dropped (released while the pool was full)
+        self._stats.setdefault(cls, [0, 0, 0, 0])
+        del self._free[cls][capacity:]
+
+    def create(self, cls: type[W], *args: Any, **kwargs: Any) -> W:
+        """the same as `cls(*args, **kwargs)`, re-using a released instance if any"""
+        free = self._free.get(cls)
+        if not free:
+            stats = self._stats.get(cls)
+            if stats is not None:
+                stats[0] += 1
+            return cls(*args, **kwargs)
+
+        widget: Any = free.pop()
+        self._stats[cls][1] += 1
+        uid = widget.uid
+        cls.__init__(widget, *args, **kwargs)
+        if self._keep_uid[cls]:
+            widget.uid = uid
+        return widget
+
+    def release(self, widget: Widget) -> None:
+        """returns the pooled widgets in the subtree under `widget` to the pool"""
+        for child in widget.subwidgets():
+            self.release(child)
+        # released widgets are no longer notified of the States they read
+        drop_reader(widget)
+
+        cls = type(widget)
+        free = self._free.get(cls)
+        if free is None:
+            return
+        stats = self._stats[cls]
+        if len(free) >= self._capacity[cls]:
+            stats[3] += 1
+            return
+        stats[2] += 1
+        # drop the references into the old tree, __init__ resets the rest on reuse
+        widget._parent_ = widget._built_ = None
+        for spec in cls._attr_specs_.values():
+            delattr(widget, spec._private_id)
+        free.append(widget)
+
+    def clear(self) -> None:
+        for free in self._free.values():
+            free.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """:returns: the counters and free instances of each pooled class, by name"""
+        return {
+            cls.__name__: {
+                "created": created,
+                "reused": reused,
+                "released": released,
+                "dropped": dropped,
+                "free": len(self._free[cls]),
+                "capacity": self._capacity[cls],
+            }
+            for cls, (created, reused, released, dropped) in self._stats.items()
+        }
+
+
+cleanup_typing_artifacts(locals())
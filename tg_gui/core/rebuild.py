@@ -0,0 +1,146 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Incremental rebuilding of a widget tree. Setting an AttrDef value sets the widget's
+`state_modified` flag and flags its ancestors (see Widget.mark_modified), a rebuild then
+only re-evaluates `body` for the flagged widgets and leaves the rest of the tree, and
+its widget instances, untouched. The widgets a re-evaluated body returns are merged
+into the ones it returned before (see reconcile.py), and the readers of the States
+written since the last rebuild are flagged first (see state.py).
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import runtime_typing
+from .reconcile import reconcile
+from .state import flush_state, forget, pending, reading
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Iterator
+
+    __all__ = ("rebuild", "rebuild_steps")
+
+if TYPE_CHECKING:
+    from .widget import Widget
+
+
+def rebuild(widget: Widget, evaluated_widgets: list[Widget] | None = None) -> int:
+    """
+    re-evaluates the body of every modified widget in the tree under (and including)
+    `widget`, clearing their flags.
+    :param evaluated_widgets: if given, each re-evaluated widget is appended to it
+    :returns: the number of body evaluations done
+    """
+    if pending:
+        flush_state()
+    return _rebuild(widget, evaluated_widgets)
+
+
+def _rebuild(widget: Widget, evaluated_widgets: list[Widget] | None) -> int:
+    evaluated = 0
+
+    dropped: list[tuple[Widget, Widget | None]] | None = None
+    if widget.state_modified:
+        # the flag is cleared after so a body that sets attributes does not re-flag
+        # itself
+        built = _evaluate(widget)
+        if type(widget)._reconciles_:
+            dropped = []
+            built = _reconcile(widget._built_, built, dropped)
+        widget.state_modified = False
+        widget._built_ = built
+        evaluated += 1
+        if evaluated_widgets is not None:
+            evaluated_widgets.append(widget)
+
+        # the built widget, or a container's (possibly new) children, are attached here
+        for child in widget.subwidgets():
+            child._parent_ = widget
+    elif not widget._child_modified_:
+        return 0
+
+    widget._child_modified_ = False
+    for child in widget.subwidgets():
+        if child.state_modified or child._child_modified_:
+            evaluated += _rebuild(child, evaluated_widgets)
+
+    if dropped:
+        _forget_dropped(dropped)
+    return evaluated
+
+
+def rebuild_steps(
+    widget: Widget, evaluated_widgets: list[Widget] | None = None
+) -> Iterator[Widget]:
+    """
+    the same as `rebuild`, but resumable: yields each widget after its body is
+    re-evaluated so a rebuild can be paused between bodies (see FrameScheduler).
+    Widgets modified while paused are rebuilt by a later rebuild.
+    """
+    if pending:
+        flush_state()
+    return _rebuild_steps(widget, evaluated_widgets)
+
+
+def _rebuild_steps(
+    widget: Widget, evaluated_widgets: list[Widget] | None
+) -> Iterator[Widget]:
+    dropped: list[tuple[Widget, Widget | None]] | None = None
+    if widget.state_modified:
+        built = _evaluate(widget)
+        if type(widget)._reconciles_:
+            dropped = []
+            built = _reconcile(widget._built_, built, dropped)
+        widget.state_modified = False
+        widget._built_ = built
+        if evaluated_widgets is not None:
+            evaluated_widgets.append(widget)
+        for child in widget.subwidgets():
+            child._parent_ = widget
+        yield widget
+    elif not widget._child_modified_:
+        return
+
+    widget._child_modified_ = False
+    for child in widget.subwidgets():
+        if child.state_modified or child._child_modified_:
+            yield from _rebuild_steps(child, evaluated_widgets)
+
+    if dropped:
+        _forget_dropped(dropped)
+
+
+def _reconcile(
+    old: Widget | None, new: Widget, dropped: list[tuple[Widget, Widget | None]]
+) -> Widget:
+    built = reconcile(old, new, dropped)
+    if old is not None and built is not old:
+        dropped.append((old, old._parent_))
+    return built
+
+
+def _forget_dropped(dropped: list[tuple[Widget, Widget | None]]) -> None:
+    # the subtrees replaced by a re-evaluated body are forgotten once the widgets below
+    # it are rebuilt, a widget instance the new body uses again has been re-attached by
+    # then (to a new parent) and is kept
+    for widget, parent in dropped:
+        if widget._parent_ is parent:
+            forget(widget)
+
+
+def _evaluate(widget: Widget) -> Widget:
+    # the States read by the body record the widget as a reader (see state.py)
+    previous = reading[0]
+    reading[0] = widget
+    try:
+        return widget.body()
+    finally:
+        reading[0] = previous
+
+
+cleanup_typing_artifacts(locals())
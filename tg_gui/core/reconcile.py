@@ -0,0 +1,155 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Reconciliation of a re-evaluated body with the tree it built before. A body returns new
+widget instances each time it is evaluated, instead of replacing the previous ones the
+rebuild merges each new widget into the previous widget it matches, keeping the previous
+instance (and its uid, built subtree and cached layout) and copying over only the
+attribute values that changed. Only the widgets whose values changed are rebuilt.
+
+Widgets match when they are of the same type and have the same key, children in a
+tuple attribute (ex: a Group's children) are matched by key (see `Widget.keyed`) or,
+for unkeyed children, by position. Key the children of lists that have items inserted,
+removed or reordered.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import runtime_typing
+from .widget import Widget
+from .state import notify
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any
+
+    __all__ = ("reconcile", "reconcile_children")
+
+
+def reconcile(
+    old: Widget | None,
+    new: Widget,
+    dropped: list[tuple[Widget, Widget | None]] | None = None,
+) -> Widget:
+    """
+    merges `new` into `old` if they match, see the module docstring.
+    :param dropped: if given, the widgets below `old` that are replaced are appended to
+    it, with the parent they had (see rebuild)
+    :returns: the widget to use in place of `new`, either `old` or `new` itself
+    """
+    if (
+        old is None
+        or new is old
+        or type(old) is not type(new)
+        or old._key_ != new._key_
+        # only newly created widgets are merged, not ones already in a built tree, and
+        # only into ones that were built (ex: not released to a WidgetPool)
+        or new._built_ is not None
+        or old._built_ is None
+    ):
+        return new
+
+    changed = False
+    dirty = False
+    for spec in type(new)._attr_specs_.values():
+        private_id = spec._private_id
+        value = getattr(new, private_id)
+        prev = getattr(old, private_id)
+        if value is prev:
+            continue
+
+        widgets = None
+        if isinstance(value, Widget):
+            if isinstance(prev, Widget):
+                value = reconcile(prev, value, dropped)
+            widgets = (value,)
+        elif type(value) is tuple and type(prev) is tuple and _has_widgets(value):
+            value = widgets = reconcile_children(prev, value, dropped)
+
+        if value is not prev and value != prev:
+            setattr(old, private_id, value)
+            changed = True
+            # the values of States are read by other widgets too
+            if old._readers_ is not None:
+                notify(old, spec.name)
+            # replaced children are appended by reconcile_children
+            if dropped is not None and value is not widgets:
+                _drop(prev, dropped)
+        elif widgets is not None and not dirty:
+            # the same children, but some of them may have changed below
+            for child in widgets:
+                if child.state_modified or child._child_modified_:
+                    dirty = True
+                    break
+
+    if changed:
+        old.state_modified = True
+        old._layout_key_ = None
+    elif dirty:
+        old._child_modified_ = True
+        old._layout_key_ = None
+    return old
+
+
+def reconcile_children(
+    old: tuple[Widget, ...],
+    new: tuple[Widget, ...],
+    dropped: list[tuple[Widget, Widget | None]] | None = None,
+) -> tuple[Widget, ...]:
+    """
+    merges each widget in `new` into the matching widget of `old`, by key or, for
+    unkeyed widgets, by position.
+    :param dropped: if given, the widgets of `old` that are not kept are appended to it
+    :returns: `new` with the matched widgets replaced by the ones from `old`
+    """
+    by_key: dict[Any, Widget] = {}
+    for child in old:
+        if isinstance(child, Widget) and child._key_ is not None:
+            by_key[child._key_] = child
+
+    count = len(old)
+    result: list[Widget] = []
+    for index, child in enumerate(new):
+        if not isinstance(child, Widget):
+            result.append(child)
+            continue
+        key = child._key_
+        if key is not None:
+            match = by_key.pop(key, None)
+        elif index < count:
+            match = old[index]
+            if not isinstance(match, Widget) or match._key_ is not None:
+                match = None
+        else:
+            match = None
+        result.append(child if match is None else reconcile(match, child, dropped))
+
+    if dropped is not None:
+        kept = {child for child in result if isinstance(child, Widget)}
+        for child in old:
+            if isinstance(child, Widget) and child not in kept:
+                dropped.append((child, child._parent_))
+    return tuple(result)
+
+
+def _drop(value: Any, dropped: list[tuple[Widget, Widget | None]]) -> None:
+    if isinstance(value, Widget):
+        dropped.append((value, value._parent_))
+    elif type(value) is tuple:
+        for child in value:
+            if isinstance(child, Widget):
+                dropped.append((child, child._parent_))
+
+
+def _has_widgets(values: tuple[Any, ...]) -> bool:
+    for value in values:
+        if isinstance(value, Widget):
+            return True
+    return False
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,164 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Generates a specialized `__init__` for each Widget subclass, in the style of
+`dataclasses`. The generated constructor takes the class's `_arg_specs_` as direct
+positional/keyword parameters and inlines the default handling for each of them, so
+constructing a widget does not walk the spec table.
+
+A firmware image can ship the constructors precompiled (see tools/freeze_specs.py), a
+frozen constructor is used when its source matches the one generated for the class.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import uid, Missing, runtime_typing
+from .attrdef import AttrDef, InitKind
+from .frozen import frozen_inits, frozen_key
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any, Callable
+
+    __all__ = ("specialized_init", "init_source")
+
+if TYPE_CHECKING:
+    from .widget import Widget
+
+
+# all names injected into the generated function's namespace use this prefix so they
+# cannot be shadowed by a parameter (spec) name
+_PREFIX = "__tg_"
+
+
+def _raise_missing(inst: Widget, names: tuple[str, ...], values: tuple[Any, ...]):
+    missing = [name for name, value in zip(names, values) if value is Missing]
+    raise TypeError(
+        f"{inst.__class__.__name__}(...) missing argument(s) {', '.join(missing)}"
+    )
+
+
+def specialized_init(cls: type[Widget]) -> Callable[..., None] | None:
+    """
+    Compiles an `__init__` for `cls` from its (final) `_arg_specs_`, or takes the
+    frozen one.
+    :returns: the new `__init__` function or None if it cannot be compiled on this
+    runtime (ie the port does not include a compiler), in which case the generic
+    `Widget.__init__` should be used.
+    """
+    source, namespace = init_source(cls)
+
+    frozen = frozen_inits.get(frozen_key(cls)) if frozen_inits else None
+    if frozen is not None and frozen[0] == source:
+        init = frozen[1](**namespace)
+    else:
+        try:
+            exec(source, namespace)
+        except Exception:  # ports built without a compiler
+            return None
+        init = namespace["__init__"]
+
+    try:  # not all ports allow setting function attributes
+        init.__qualname__ = f"{cls.__qualname__}.__init__"
+    except AttributeError:
+        pass
+    return init
+
+
+def init_source(cls: type[Widget]) -> tuple[str, dict[str, Any]]:
+    """
+    :returns: the source of the specialized `__init__` for `cls` and the namespace of
+    the objects it refers to
+    """
+    specs = cls._arg_specs_
+
+    namespace: dict[str, Any] = {
+        _PREFIX + "uid": uid,
+        _PREFIX + "missing": Missing,
+        _PREFIX + "raise_missing": _raise_missing,
+    }
+    missing = _PREFIX + "missing"
+
+    params: list[str] = ["self"]
+    lines: list[str] = [
+        f"self.uid = {_PREFIX}uid()",
+        "self.state_modified = True",
+        "self._parent_ = self._built_ = self._rect_ = self._layout_key_ = None",
+        "self._key_ = self._readers_ = self._reads_ = None",
+        "self._child_modified_ = False",
+    ]
+
+    # the expression each attribute starts with, by position in `_attr_specs_`
+    index_of = {name: index for index, name in enumerate(cls._attr_specs_)}
+    values: dict[int, str] = {}
+
+    required: list[str] = []
+    body: list[str] = []
+    deferred: list[str] = []
+    for spec in specs:
+        name = spec.name
+        index = index_of[name]
+        assert (
+            not name.startswith(_PREFIX) and name != "self"
+        ), f"{cls.__name__}.{name} cannot be used as an argument name"
+        params.append(f"{name}={missing}")
+
+        # subclasses of AttrDef (like State) may customize init, defer to them
+        if type(spec).init is not AttrDef.init:
+            namespace[f"{_PREFIX}init{index}"] = spec.init
+            if spec.init_kind is InitKind.required:
+                required.append(name)
+            deferred.append(f"{_PREFIX}init{index}(self, {name})")
+            continue
+
+        kind = spec.init_kind
+        if kind is InitKind.required:
+            required.append(name)
+        elif kind is InitKind.default:
+            namespace[f"{_PREFIX}default{index}"] = spec._default
+            body.append(f"if {name} is {missing}: {name} = {_PREFIX}default{index}")
+        else:
+            assert kind is InitKind.default_factory
+            namespace[f"{_PREFIX}factory{index}"] = spec._default_factory
+            body.append(f"if {name} is {missing}: {name} = {_PREFIX}factory{index}()")
+
+        values[index] = name
+
+    # attributes not in the arguments still start with their default, if any
+    for index, spec in enumerate(cls._attr_specs_.values()):
+        if spec.in_init or spec.init_kind is InitKind.required:
+            continue
+        elif type(spec).init is not AttrDef.init:
+            namespace[f"{_PREFIX}init{index}"] = spec.init
+            deferred.append(f"{_PREFIX}init{index}(self, {missing})")
+        elif spec.init_kind is InitKind.default:
+            namespace[f"{_PREFIX}default{index}"] = spec._default
+            values[index] = f"{_PREFIX}default{index}"
+        else:
+            namespace[f"{_PREFIX}factory{index}"] = spec._default_factory
+            values[index] = f"{_PREFIX}factory{index}()"
+
+    # check all the required arguments at once, only building the message on failure
+    if required:
+        namespace[f"{_PREFIX}required"] = tuple(required)
+        lines.append(
+            "if "
+            + " or ".join(f"{name} is {missing}" for name in required)
+            + f": {_PREFIX}raise_missing(self, {_PREFIX}required, "
+            + f"({', '.join(required)},))"
+        )
+    lines += body
+    specs_in_order = tuple(cls._attr_specs_.values())
+    for index in sorted(values):
+        lines.append(f"self.{specs_in_order[index]._private_id} = {values[index]}")
+    lines += deferred
+
+    source = f"def __init__({', '.join(params)}):\n    " + "\n    ".join(lines)
+    return source, namespace
+
+
+cleanup_typing_artifacts(locals())
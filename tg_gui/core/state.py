@@ -0,0 +1,166 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Reactive attributes. A `State` is declared like an AttrDef, but instead of flagging its
+own widget when written it tracks which widgets read it: while a body is evaluated (see
+rebuild) every State it reads records the widget as a reader, and writing the State
+flags only those readers to be rebuilt. A widget holding shared state (a model, not in
+the tree) can then be read by any number of widgets and updating one of its values
+rebuilds only the widgets that used it.
+
+Notifications are batched, a write queues the readers and the next rebuild flags them
+all at once (see `flush_state`), so writing a State many times in a frame costs one
+rebuild of each reader. The readers are forgotten once notified, they record themselves
+again when their bodies are re-evaluated. A detached subtree (ex: a ListView row that
+scrolled out) is dropped from the readers of the States it read with `forget`, so the
+States do not keep it alive. Each reader keeps the widgets it read from in `_reads_`
+for this, micropython has no weak references.
+
+Reads outside of a body (ex: in `_layout_` or `_draw_`) are not tracked, a widget whose
+body returns itself is always notified of writes to its own States. Memoized bodies
+that read another widget's State are not cached (see memo.py), a cached subtree would
+not re-record its readers.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts
+
+from .shared import runtime_typing
+from .attrdef import AttrDef
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING or runtime_typing():
+    __all__ = (
+        "State",
+        "flush_state",
+        "drop_reader",
+        "forget",
+        "notify",
+        "pending",
+        "reading",
+        "record_read",
+        "tracked_reads",
+    )
+
+if TYPE_CHECKING:
+    from .widget import Widget
+
+T = TypeVar("T")
+
+# the widget whose body is being evaluated, if any, set by rebuild
+reading: list[Widget | None] = [None]
+
+# the readers to flag on the next rebuild, never re-assigned so it can be imported
+pending: set[Widget] = set()
+
+# the number of reads of another widget's State recorded so far, memo.py checks if a
+# body read one
+tracked_reads: list[int] = [0]
+
+
+class State(AttrDef[T]):
+    __slots__ = ()
+
+    def __get__(self, inst: Widget | None, iscls: type[Widget] | None) -> T:
+        if inst is None:
+            return self  # type: ignore
+        name = self.name
+        reader = reading[0]
+        if reader is not None:
+            if reader is not inst:
+                tracked_reads[0] += 1
+            record_read(inst, name, reader)
+
+        try:
+            return getattr(inst, self._private_id)
+        except AttributeError:
+            raise AttributeError(
+                f"{inst.__class__.__name__} widget has no value for {repr(name)}"
+            ) from None
+
+    def __set__(self, inst: Widget, value: T) -> None:
+        name = self.name
+        setattr(inst, self._private_id, value)
+        if inst._readers_ is not None:
+            notify(inst, name)
+        if inst._built_ is inst:
+            pending.add(inst)
+
+
+def record_read(inst: Widget, name: str, reader: Widget) -> None:
+    """records `reader` as a reader of `inst`'s State `name`"""
+    readers = inst._readers_
+    if readers is None:
+        inst._readers_ = {name: {reader}}
+    elif name in readers:
+        readers[name].add(reader)
+    else:
+        readers[name] = {reader}
+    reads = reader._reads_
+    if reads is None:
+        reader._reads_ = {inst}
+    else:
+        reads.add(inst)
+
+
+def notify(inst: Widget, name: str) -> None:
+    """queues the readers of `inst`'s State `name` to be flagged by the next flush"""
+    readers = inst._readers_
+    if readers is not None and name in readers:
+        pending.update(readers.pop(name))
+        if not readers:
+            inst._readers_ = None
+
+
+def flush_state() -> int:
+    """
+    flags the readers of the States written since the last flush to be rebuilt, this is
+    done at the start of each rebuild.
+    :returns: the number of widgets flagged
+    """
+    if not pending:
+        return 0
+    readers = tuple(pending)
+    pending.clear()
+    for widget in readers:
+        if not widget.state_modified:
+            widget.mark_modified()
+    return len(readers)
+
+
+def forget(widget: Widget) -> None:
+    """
+    drops the widgets in the subtree under `widget` from the readers of the States they
+    read and from `pending`, call this when the subtree is detached from the tree.
+    """
+    drop_reader(widget)
+    for child in widget.subwidgets():
+        # a child attached elsewhere since is still in the tree
+        if child._parent_ is widget:
+            forget(child)
+
+
+def drop_reader(widget: Widget) -> None:
+    """the same as `forget`, for `widget` alone"""
+    reads = widget._reads_
+    widget._reads_ = None
+    pending.discard(widget)
+    if reads is None:
+        return
+    for owner in reads:
+        readers = owner._readers_
+        if readers is None:
+            continue
+        for name in [name for name, names in readers.items() if widget in names]:
+            names = readers[name]
+            names.discard(widget)
+            if not names:
+                del readers[name]
+        if not readers:
+            owner._readers_ = None
+
+
+cleanup_typing_artifacts(locals())
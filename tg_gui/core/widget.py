@@ -7,6 +7,9 @@ from ..platform_support import typing_standin, cleanup_typing_artifacts
 from .shared import UID, uid, by_uid, runtime_typing, Missing, ismissing
 
 from .attrdef import InitKind, isattrdef
+from .specialize import specialized_init
+from .memo import MemoizedBody
+from .frozen import frozen_specs, frozen_key
 
 # pyright: reportImportCycles=false
 
@@ -22,8 +25,6 @@ if TYPE_CHECKING or runtime_typing():
 
     from .shared import Maybe
 
-    from abc import abstractproperty
-
     __all__ = ("Widget", "Body")
 
 
@@ -39,14 +40,9 @@ if TYPE_CHECKING:
     class _AttrDefAndSubclasses(Protocol):
         uid: UID
         name: str
-
-        @abstractproperty
-        def init_kind(self) -> InitKind:
-            ...
-
-        @abstractproperty
-        def in_init(self) -> bool:
-            ...
+        init_kind: InitKind
+        in_init: bool
+        _private_id: str
 
         def init(self, inst: Widget, value: Maybe[Any]):
             ...
@@ -76,6 +72,16 @@ class _BodyDef(Generic[Wco]):
         assert self is Body, "Body should be a singleton"
         return Body
 
+    def memoized(self, method: Callable[[Wco], Ws]) -> Callable[[Wco], Ws]:
+        """
+        like `Body[Self](...)` but opts into caching the built subtrees, keyed on the
+        widget's attribute values (see core/memo.py).
+        ```
+        body = Body[Self].memoized(lambda self: text...)
+        ```
+        """
+        return MemoizedBody(method)  # type: ignore
+
 
 Body: _BodyDef[Any] = _BodyDef()
 _BodyDef.__new__ = NotImplemented
@@ -89,7 +95,42 @@ del _BodyDef
     field_specifiers=(_AttrDefAndSubclasses,),
 )
 class Widget:
+    # the attribute values are kept in each instance's __dict__ (see AttrDef).
+    # micropython ignores __slots__, each of these is an entry in the instance's map
+    __slots__ = (
+        "uid",
+        "state_modified",
+        "__dict__",
+        "_parent_",
+        "_built_",
+        "_child_modified_",
+        "_rect_",
+        "_layout_key_",
+        "_key_",
+        "_readers_",
+        "_reads_",
+    )
+
     uid: UID
+    # set when this widget's body needs to be re-evaluated (see rebuild)
+    state_modified: bool
+    _parent_: Widget | None
+    # the widget returned by the last evaluation of body, None if never built
+    _built_: Widget | None
+    # set when a widget below this one in the tree has state_modified set
+    _child_modified_: bool
+    # (x, y, width, height) as placed by the last layout, None if never laid out
+    _rect_: tuple[int, int, int, int] | None
+    # the (width, height) space given to the last layout, None when its size and the
+    # placement of its subtree must be re-measured (see layout.py)
+    _layout_key_: tuple[int, int] | None
+    # matches this widget to the previous one with the same key when a body is
+    # re-evaluated, None to match by position (see reconcile.py)
+    _key_: Any
+    # the widgets that read each State of this widget, by name (see state.py)
+    _readers_: dict[str, set[Widget]] | None
+    # the widgets whose States this widget read, to drop it from their readers
+    _reads_: set[Widget] | None
 
     # body: ClassVar[Callable[[W], Ws]] = None  # type: ignore
     if not TYPE_CHECKING:
@@ -97,6 +138,11 @@ class Widget:
 
     _arg_specs_: ClassVar[tuple[_AttrDefAndSubclasses, ...]] = ()
     _attr_specs_: ClassVar[dict[str, _AttrDefAndSubclasses]] = {}
+    _specialized_init_: ClassVar[Callable[..., None] | None] = None
+    # if the children are only drawn within this widget's rect (see render.draw)
+    _clips_children_: ClassVar[bool] = False
+    # if a re-evaluated body's widgets are merged into the ones it built before
+    _reconciles_: ClassVar[bool] = True
 
     # def __matmul__(self, transform: Callable[[Self], Self]) -> Self:
     #     pass
@@ -104,6 +150,9 @@ class Widget:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.uid = uid()
         self.state_modified = True
+        self._parent_ = self._built_ = self._rect_ = self._layout_key_ = None
+        self._key_ = self._readers_ = self._reads_ = None
+        self._child_modified_ = False
         specs = self._arg_specs_
 
         assert Missing not in kwargs.values()
@@ -138,11 +187,16 @@ class Widget:
 
             arg = kwargs.pop(spec_name, Missing)
 
-            if ismissing(arg) and spec.init_kind == InitKind.required:
+            if ismissing(arg) and spec.init_kind is InitKind.required:
                 missing_args.add(spec_name)
             else:
                 spec.init(self, arg)
 
+        # attributes not in the arguments still start with their default, if any
+        for spec in self._attr_specs_.values():
+            if not spec.in_init and spec.init_kind is not InitKind.required:
+                spec.init(self, Missing)
+
         # cleanup and checking
         if missing_args:
             raise TypeError(
@@ -168,34 +222,104 @@ class Widget:
             getattr(cls, "body", None) is not None
         ), "body must be defined in the class declaration or a parent class"
 
+        # memoized bodies may return a cached subtree, which must not be merged into
+        body = cls.__dict__.get("body")
+        if body is not None:
+            cls._reconciles_ = not isinstance(body, MemoizedBody)
+
         # --- attributes and arguemnts ---
         # climb the base classes and determine arg order
 
-        attr_specs: dict[str, _AttrDefAndSubclasses] = {}
         new_specs: dict[str, _AttrDefAndSubclasses] = {
             name: spec for name, spec in cls.__dict__.items() if isattrdef(spec)
         }
+        bases = [base for base in cls.__bases__ if issubclass(base, Widget)]
+
+        # most subclasses only add a body, they share their base's spec tables and
+        # (specialized) __init__ through inheritance instead of copying them. the tables
+        # are never mutated in place, a subclass that changes them sets its own
+        if not new_specs and len(bases) == 1 and bases[0] is not Widget:
+            return
+
+        # a firmware image can ship the tables precomputed (see tools/freeze_specs.py)
+        if not (frozen_specs and _thaw_specs(cls, new_specs, bases)):
+            _resolve_specs(cls, new_specs, bases)
+
+        # --- constructor ---
+        # now that the argument order is final, install a constructor specialized to it
+        # (unless a class in the hierarchy has a hand-written __init__). it is compiled
+        # on first use, so classes that are never instantiated do not pay for it
+        if "__init__" not in cls.__dict__ and (
+            cls.__init__ is Widget.__init__ or cls.__init__ is cls._specialized_init_
+        ):
+            init = _lazy_specialized_init(cls)
+            setattr(cls, "__init__", init)
+            setattr(cls, "_specialized_init_", init)
+
+    def mark_modified(self) -> None:
+        """
+        flags this widget's body to be re-evaluated by the next rebuild and flags its
+        ancestors so the rebuild can find it. This also invalidates the cached layout of
+        the widget and its ancestors.
+        """
+        # an invalid layout implies its ancestors are invalid too, so stop at the first
+        widget: Widget | None = self
+        while widget is not None and widget._layout_key_ is not None:
+            widget._layout_key_ = None
+            widget = widget._parent_
 
-        for basecls in reversed(cls.__bases__):
-            if not issubclass(basecls, Widget):
-                continue
-            attr_specs.update(basecls._attr_specs_)
+        self.state_modified = True
+        parent = self._parent_
+        # stop early once reaching an already flagged part of the tree
+        while parent is not None and not parent._child_modified_:
+            parent._child_modified_ = True
+            parent = parent._parent_
+
+    def keyed(self, key: Any) -> Self:
+        """
+        sets the key used to match this widget to the one it replaces when its parent's
+        body is re-evaluated (see reconcile.py), keys must be unique among siblings.
+        ```
+        body = Body[Self](lambda self: Stack(tuple(Entry(e).keyed(e.id) for e in ...)))
+        ```
+        """
+        self._key_ = key
+        return self
+
+    def subwidgets(self) -> tuple[Widget, ...]:
+        """
+        the widgets directly below this one in the built tree, either the widget its
+        body returned or, when the body returns the widget itself, its `_children_()`.
+        """
+        built = self._built_
+        if built is None:
+            return ()
+        elif built is self:
+            return self._children_()
         else:
-            attr_specs.update(new_specs)
-
-        setattr(cls, "_attr_specs_", dict(attr_specs))
-
-        # the argument order, according to @dataclass_transform conventions, preserves
-        # previous optional(/default) arguments and adds new ones on the end in order of
-        # declaration where re-declared attributes do not change the argument order
-        prev_args = {spec.name for spec in cls._arg_specs_}
-        new_args = [
-            spec
-            for spec in attr_specs.values()
-            if spec.in_init and spec.name not in prev_args
-        ]
-        new_args.sort(key=by_uid)
-        setattr(cls, "_arg_specs_", cls._arg_specs_ + tuple(new_args))
+            return (built,)
+
+    def _children_(self) -> tuple[Widget, ...]:
+        """
+        the child widgets of a widget whose body returns itself (like Group), override
+        this in containers.
+        """
+        return ()
+
+    # --- primitive widget hooks ---
+    # widgets whose body returns itself (like Group and Text) implement these, other
+    # widgets are laid out and drawn as the widget their body returns
+
+    def _layout_(self, x: int, y: int, width: int, height: int) -> tuple[int, int]:
+        """
+        places this widget's children, if any, at `x, y` within `width` x `height`.
+        :returns: the size used by this widget
+        """
+        return (0, 0)
+
+    def _draw_(self, target: Any, clip: tuple[int, int, int, int] | None) -> None:
+        """draws this widget (not its children) onto `target`, within `clip` if given"""
+        pass
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} widget uid {self.uid}>"
@@ -209,4 +333,101 @@ class Widget:
             return object.__new__(cls)
 
 
+def _resolve_specs(
+    cls: type[Widget],
+    new_specs: dict[str, _AttrDefAndSubclasses],
+    bases: list[type[Widget]],
+) -> None:
+    # merges the spec tables of `bases` with the attributes `cls` declares
+    if len(bases) == 1:
+        attr_specs = dict(bases[0]._attr_specs_)
+    else:
+        attr_specs = {}
+        for basecls in reversed(bases):
+            attr_specs.update(basecls._attr_specs_)
+    attr_specs.update(new_specs)
+
+    setattr(cls, "_attr_specs_", attr_specs)
+
+    # the argument order, according to @dataclass_transform conventions, preserves
+    # previous optional(/default) arguments and adds new ones on the end in order of
+    # declaration where re-declared attributes do not change the argument order
+    # (re-declared attributes keep their position but use the newest declaration)
+    prev_args = cls._arg_specs_
+    if any(spec.name in new_specs for spec in prev_args):
+        prev_args = tuple(attr_specs[spec.name] for spec in prev_args)
+    prev_names = {spec.name for spec in prev_args}
+    # with one base its arguments already hold all its attributes in init, with more
+    # (ex: a mixin) the arguments of the other bases are new to this class
+    candidates = new_specs if len(bases) == 1 else attr_specs
+    new_args = [
+        spec
+        for spec in candidates.values()
+        if spec.in_init and spec.name not in prev_names
+    ]
+    if new_args:
+        # the class __dict__ is not ordered on all ports
+        new_args.sort(key=by_uid)
+        prev_args += tuple(new_args)
+    setattr(cls, "_arg_specs_", prev_args)
+
+
+def _thaw_specs(
+    cls: type[Widget],
+    new_specs: dict[str, _AttrDefAndSubclasses],
+    bases: list[type[Widget]],
+) -> bool:
+    # installs the tables recorded for `cls` by tools/freeze_specs.py, looking the specs
+    # up by name. returns False, to resolve them instead, when there are none or they
+    # no longer match the class
+    entry = frozen_specs.get(frozen_key(cls))
+    if entry is None:
+        return False
+    attr_names, arg_names = entry
+
+    attr_specs: dict[str, _AttrDefAndSubclasses] = {}
+    declared = 0
+    for name in attr_names:
+        spec = new_specs.get(name)
+        if spec is not None:
+            declared += 1
+        else:
+            for base in bases:
+                spec = base._attr_specs_.get(name)
+                if spec is not None:
+                    break
+            else:
+                return False
+        attr_specs[name] = spec
+    if declared != len(new_specs):
+        return False
+
+    # the arguments must be exactly the attributes in init (an attribute's init kind
+    # may have changed since), starting with the arguments of the first base
+    in_init = {name for name, spec in attr_specs.items() if spec.in_init}
+    if len(in_init) != len(arg_names) or not in_init.issuperset(arg_names):
+        return False
+    prev_names = tuple(spec.name for spec in cls._arg_specs_)
+    if tuple(arg_names[: len(prev_names)]) != prev_names:
+        return False
+    arg_specs = tuple(attr_specs[name] for name in arg_names)
+
+    setattr(cls, "_attr_specs_", attr_specs)
+    setattr(cls, "_arg_specs_", arg_specs)
+    return True
+
+
+def _lazy_specialized_init(cls: type[Widget]) -> Callable[..., None]:
+    # stands in for the specialized __init__ of `cls` until it is first called, then
+    # compiles it (see specialize.py) and replaces itself with it
+    def __init__(self: Widget, *args: Any, **kwargs: Any) -> None:
+        init = specialized_init(cls) or Widget.__init__
+        if cls.__dict__.get("__init__") is __init__:
+            setattr(cls, "__init__", init)
+            setattr(cls, "_specialized_init_", init)
+        init(self, *args, **kwargs)
+
+    return __init__
+
+
 cleanup_typing_artifacts(locals())
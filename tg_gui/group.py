@@ -5,14 +5,63 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Self
 
 from .core.widget import Widget, Body
+from .core.attrdef import AttrDef
+from .layout import layout
 
 
 class Group(Widget):
+    children: tuple[Widget, ...] = AttrDef(default=(), init=True)
+
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
 
     body = Body[Self](lambda self: self)
 
+    def _children_(self) -> tuple[Widget, ...]:
+        return self.children
+
+    def _layout_(self, x: int, y: int, width: int, height: int) -> tuple[int, int]:
+        # stack the children from top to bottom
+        used_width = 0
+        top = y
+        for child in self.children:
+            child_width, child_height = layout(child, x, top, width, y + height - top)
+            used_width = max(used_width, child_width)
+            top += child_height
+        return (used_width, top - y)
+
     def foo(self):
         x = self.body()
         print(x)
+
+
+class Stack(Group):
+    """stacks its children from top to bottom, `spacing` pixels apart"""
+
+    spacing: int = AttrDef(default=0, init=True)
+
+    def _layout_(self, x: int, y: int, width: int, height: int) -> tuple[int, int]:
+        spacing = self.spacing
+        used_width = 0
+        top = y
+        for child in self.children:
+            child_width, child_height = layout(child, x, top, width, y + height - top)
+            used_width = max(used_width, child_width)
+            top += child_height + spacing
+        return (used_width, max(0, top - y - spacing))
+
+
+class Row(Group):
+    """places its children from left to right, `spacing` pixels apart"""
+
+    spacing: int = AttrDef(default=0, init=True)
+
+    def _layout_(self, x: int, y: int, width: int, height: int) -> tuple[int, int]:
+        spacing = self.spacing
+        used_height = 0
+        left = x
+        for child in self.children:
+            child_width, child_height = layout(child, left, y, x + width - left, height)
+            used_height = max(used_height, child_height)
+            left += child_width + spacing
+        return (max(0, left - x - spacing), used_height)
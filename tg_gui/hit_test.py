@@ -0,0 +1,242 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Touch hit-testing. A HitIndex keeps the laid out rect of every widget in a uniform grid
+of `cell_size` pixel cells, keyed by uid, so finding the widgets under a point only
+looks at the widgets in one cell instead of walking the whole tree. Widgets spanning
+more than `max_cells` cells (ex: the root, or a tall list) are kept in a separate list
+checked on every query, there are few of them.
+
+The index is updated incrementally: install `moved` as the layout move listener (as
+done by HeadlessRenderer), it is called for every widget whose rect changed, and pass
+the widgets re-evaluated by each rebuild to `changed` so the children they dropped are
+removed. Widgets detached some other way (ex: a ListView dropping rows) are removed
+when a query finds them.
+"""
+
+from __future__ import annotations
+
+from .platform_support import cleanup_typing_artifacts, runtime_typing
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    __all__ = ("HitIndex",)
+
+if TYPE_CHECKING:
+    from .core.widget import Widget
+    from .core.shared import UID
+
+    Rect = tuple[int, int, int, int]
+
+# cell keys pack (column, row) into one int, columns must stay within +/- 32k cells
+_STRIDE = 1 << 16
+
+
+class HitIndex:
+    """
+    The laid out widgets under `root`, see the module docstring. `at(x, y)` returns the
+    widgets under a point.
+    """
+
+    def __init__(self, root: Widget, cell_size: int = 32, max_cells: int = 16) -> None:
+        self.root = root
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        # uid -> (widget, indexed rect, cell keys or None if in `_large`)
+        self._entries: dict[UID, tuple[Widget, Rect, tuple[int, ...] | None]] = {}
+        self._cells: dict[int, list[UID]] = {}
+        self._large: list[UID] = []
+        # the indexed children of each widget, to find the ones a rebuild dropped
+        self._children: dict[UID, set[UID]] = {}
+        self._parents: dict[UID, UID] = {}
+        if root._rect_ is not None:
+            self.sync()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync(self) -> None:
+        """indexes the whole laid out tree again, ex: if laid out without `moved`"""
+        self._entries.clear()
+        self._cells.clear()
+        self._large.clear()
+        self._children.clear()
+        self._parents.clear()
+        stack = [self.root]
+        while stack:
+            widget = stack.pop()
+            self._insert(widget)
+            stack.extend(widget.subwidgets())
+
+    # --- incremental updates ---
+
+    def moved(self, widget: Widget, old: Rect | None) -> None:
+        """the layout move listener, see `layout.set_move_listener`"""
+        uid = widget.uid
+        if uid in self._entries:
+            self._remove_rect(uid)
+        self._insert(widget)
+
+    def changed(self, widgets: list[Widget]) -> None:
+        """removes the children the re-evaluated `widgets` no longer have"""
+        children = self._children
+        for widget in widgets:
+            indexed = children.get(widget.uid)
+            if not indexed:
+                continue
+            current = {child.uid for child in widget.subwidgets()}
+            for uid in [uid for uid in indexed if uid not in current]:
+                self._remove(uid)
+
+    # --- queries ---
+
+    def at(self, x: int, y: int) -> list[Widget]:
+        """:returns: the widgets under `x, y`, the deepest (top-most drawn) first"""
+        size = self.cell_size
+        cell = self._cells.get((y // size) * _STRIDE + x // size)
+        entries = self._entries
+        found: list[tuple[int, Widget]] = []
+        stale: list[UID] = []
+        for uids in (cell, self._large):
+            if not uids:
+                continue
+            for uid in uids:
+                widget = entries[uid][0]
+                rect = widget._rect_
+                if (
+                    rect is None
+                    or not rect[0] <= x < rect[0] + rect[2]
+                    or not rect[1] <= y < rect[1] + rect[3]
+                ):
+                    continue
+                depth = self._depth(widget, x, y)
+                if depth >= 0:
+                    found.append((depth, widget))
+                elif depth == _DETACHED:
+                    stale.append(uid)
+        for uid in stale:
+            if uid in entries:
+                self._remove(uid)
+        found.sort(key=_by_depth)
+        return [widget for _, widget in found]
+
+    def top(self, x: int, y: int) -> Widget | None:
+        """:returns: the deepest widget under `x, y`, if any"""
+        found = self.at(x, y)
+        return found[0] if found else None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "widgets": len(self._entries),
+            "cells": len(self._cells),
+            "large": len(self._large),
+            "cell entries": sum(len(uids) for uids in self._cells.values()),
+        }
+
+    # --- internals ---
+
+    def _depth(self, widget: Widget, x: int, y: int) -> int:
+        # the depth of `widget` below the root, _DETACHED if no longer in the tree or
+        # _CLIPPED if an ancestor clips it away at this point
+        root = self.root
+        depth = 0
+        while widget is not root:
+            parent = widget._parent_
+            if parent is None:
+                return _DETACHED
+            if parent._clips_children_:
+                rect = parent._rect_
+                if (
+                    rect is None
+                    or not rect[0] <= x < rect[0] + rect[2]
+                    or not rect[1] <= y < rect[1] + rect[3]
+                ):
+                    return _CLIPPED
+            widget = parent
+            depth += 1
+        return depth
+
+    def _insert(self, widget: Widget) -> None:
+        rect = widget._rect_
+        if rect is None:
+            return
+        uid = widget.uid
+
+        parent = widget._parent_
+        if parent is not None and self._parents.get(uid) != parent.uid:
+            self._unlink(uid)
+            self._parents[uid] = parent.uid
+            siblings = self._children.get(parent.uid)
+            if siblings is None:
+                self._children[parent.uid] = {uid}
+            else:
+                siblings.add(uid)
+
+        x, y, width, height = rect
+        if width <= 0 or height <= 0:
+            self._entries[uid] = (widget, rect, ())
+            return
+        size = self.cell_size
+        left = x // size
+        right = (x + width - 1) // size
+        top = y // size
+        bottom = (y + height - 1) // size
+        if (right - left + 1) * (bottom - top + 1) > self.max_cells:
+            self._entries[uid] = (widget, rect, None)
+            self._large.append(uid)
+            return
+
+        cells = self._cells
+        keys = tuple(
+            row * _STRIDE + column
+            for row in range(top, bottom + 1)
+            for column in range(left, right + 1)
+        )
+        for key in keys:
+            uids = cells.get(key)
+            if uids is None:
+                cells[key] = [uid]
+            else:
+                uids.append(uid)
+        self._entries[uid] = (widget, rect, keys)
+
+    def _remove_rect(self, uid: UID) -> None:
+        _, _, keys = self._entries.pop(uid)
+        if keys is None:
+            self._large.remove(uid)
+            return
+        cells = self._cells
+        for key in keys:
+            uids = cells[key]
+            uids.remove(uid)
+            if not uids:
+                del cells[key]
+
+    def _remove(self, uid: UID) -> None:
+        # removes `uid` and its indexed subtree
+        if uid in self._entries:
+            self._remove_rect(uid)
+        for child in self._children.pop(uid, ()):
+            self._parents.pop(child, None)
+            self._remove(child)
+        self._unlink(uid)
+
+    def _unlink(self, uid: UID) -> None:
+        parent = self._parents.pop(uid, None)
+        if parent is not None:
+            siblings = self._children.get(parent)
+            if siblings is not None:
+                siblings.discard(uid)
+
+
+_DETACHED = -1
+_CLIPPED = -2
+
+
+def _by_depth(found: tuple[int, Widget]) -> int:
+    return -found[0]
+
+
+cleanup_typing_artifacts(locals())
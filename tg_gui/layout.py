@@ -0,0 +1,96 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Single pass layout. Each widget measures and places its children as it is placed (see
+Widget._layout_), and remembers the space it was given in `_layout_key_`. Setting any
+attribute clears the key of the widget and its ancestors (see Widget.mark_modified), so
+a widget laid out again in the same space re-uses its measured size and the placement
+of its whole subtree, moving it if only the position changed.
+"""
+
+from __future__ import annotations
+
+from .platform_support import cleanup_typing_artifacts, runtime_typing
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Callable
+
+    __all__ = ("layout", "set_move_listener", "invalidate_layout")
+
+if TYPE_CHECKING:
+    from .core.widget import Widget
+
+    Rect = tuple[int, int, int, int]
+
+# called with (widget, old rect) when layout changes a widget's rect (see damage.py)
+_move_listener: Callable[[Widget, Rect | None], None] | None = None
+
+
+def set_move_listener(listener: Callable[[Widget, Rect | None], None] | None) -> None:
+    global _move_listener
+    _move_listener = listener
+
+
+def layout(widget: Widget, x: int, y: int, width: int, height: int) -> tuple[int, int]:
+    """
+    places `widget`, and the tree under it, with its top left corner at `x, y` within
+    the given space, storing the result in each widget's `_rect_`.
+    :returns: the (width, height) used by `widget`
+    """
+    old = widget._rect_
+    key = widget._layout_key_
+
+    # unchanged since it was last laid out in the same space
+    if key is not None and key[0] == width and key[1] == height:
+        assert old is not None
+        if old[0] != x or old[1] != y:
+            _translate(widget, x - old[0], y - old[1])
+        return (old[2], old[3])
+
+    built = widget._built_
+    if built is not None and built is not widget:
+        size = layout(built, x, y, width, height)
+    else:
+        size = widget._layout_(x, y, width, height)
+    rect = (x, y, size[0], size[1])
+    widget._rect_ = rect
+    widget._layout_key_ = (width, height)
+    if _move_listener is not None and old != rect:
+        _move_listener(widget, old)
+    return size
+
+
+def invalidate_layout(widget: Widget) -> None:
+    """
+    drops the cached layout of the whole tree under `widget` (and its ancestors), ex:
+    after changing a font's metrics in place.
+    """
+    parent = widget._parent_
+    while parent is not None:
+        parent._layout_key_ = None
+        parent = parent._parent_
+    _invalidate_tree(widget)
+
+
+def _invalidate_tree(widget: Widget) -> None:
+    widget._layout_key_ = None
+    for child in widget.subwidgets():
+        _invalidate_tree(child)
+
+
+def _translate(widget: Widget, dx: int, dy: int) -> None:
+    # moves an already laid out subtree without measuring it again
+    listener = _move_listener
+    old = widget._rect_
+    if old is not None:
+        widget._rect_ = (old[0] + dx, old[1] + dy, old[2], old[3])
+        if listener is not None:
+            listener(widget, old)
+    for child in widget.subwidgets():
+        _translate(child, dx, dy)
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,145 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+A virtualized list. Only the rows that intersect the viewport, plus `overscan` rows on
+either side, exist as widgets: rows are built by `row(index)` when they scroll into the
+window and dropped (or released to a WidgetPool) when they scroll out, so the memory
+and the time to build a list do not depend on how many rows it has.
+
+The rows are built when the list's body is evaluated, for the height it was last laid
+out in. When layout gives it a height that needs other rows the list flags itself, and
+the renderer builds and lays out the frame again (see HeadlessRenderer.steps).
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Self
+
+from .core.widget import Widget, Body
+from .core.attrdef import AttrDef
+from .core.state import forget
+from .layout import layout
+
+if TYPE_CHECKING:
+    from typing import Callable
+    from .core.pool import WidgetPool
+
+
+class ListView(Widget):
+    """
+    `count` rows of `row_height` pixels, scrolled `offset` pixels down. The rows are
+    built with `row(index)` and are cached until they leave the window. Changing
+    `count`, `row_height` or the `row` builder (ex: the parent's body passes a new
+    lambda each time it is evaluated) rebuilds the rows, call `refresh()` after the
+    data shown by the built rows changes otherwise.
+    """
+
+    count: int = AttrDef(required=True)
+    row: Callable[[int], Widget] = AttrDef(required=True)
+    row_height: int = AttrDef(default=16, init=True)
+    offset: int = AttrDef(default=0, init=True)
+    # the extra rows built above and below the viewport, so short scrolls re-use rows
+    overscan: int = AttrDef(default=2, init=True)
+    # if given, the rows that leave the window are released to it
+    pool: WidgetPool | None = AttrDef(default=None, init=True)
+
+    _clips_children_ = True
+
+    # the built rows by index, their window, and the count, row height and builder they
+    # were built with
+    _rows_: dict[int, Widget] | None = None
+    _window_: tuple[int, int] = (0, 0)
+    _built_with_: tuple[int, int, Callable[[int], Widget]] | None = None
+    # the built rows in order, as returned by _children_
+    _visible_: tuple[Widget, ...] = ()
+    # the height the list was last laid out in, the window is built for it
+    _height_: int | None = None
+
+    body = Body[Self](lambda self: self._build_window())
+
+    def _children_(self) -> tuple[Widget, ...]:
+        return self._visible_
+
+    def refresh(self) -> None:
+        """drops all the built rows, they are built again by the next rebuild"""
+        self._drop_rows(self._window_[0], self._window_[0])
+        self.mark_modified()
+
+    def scroll_to(self, index: int) -> None:
+        """scrolls the row at `index` to the top of the list"""
+        self.offset = max(0, index) * self.row_height
+
+    def _build_window(self) -> Self:
+        count = self.count
+        row_height = self.row_height
+        builder = self.row
+        if self._built_with_ != (count, row_height, builder):
+            self._drop_rows(0, 0)
+            self._built_with_ = (count, row_height, builder)
+
+        height = self._height_
+        window = (0, 0) if height is None else self._window_for(height)
+        if window != self._window_:
+            first, last = window
+            self._drop_rows(first, last)
+            rows = self._rows_
+            assert rows is not None
+            for index in range(first, last):
+                if index not in rows:
+                    # attached and built by the rebuild evaluating this body
+                    rows[index] = builder(index)
+            self._window_ = window
+            self._visible_ = tuple(rows[index] for index in range(first, last))
+
+            # the list, and its ancestors if this was flagged by _layout_, are laid out
+            # again
+            widget: Widget | None = self
+            while widget is not None and widget._layout_key_ is not None:
+                widget._layout_key_ = None
+                widget = widget._parent_
+        return self
+
+    def _window_for(self, height: int) -> tuple[int, int]:
+        # the rows that intersect the viewport plus the overscan
+        count = self.count
+        row_height = self.row_height
+        offset = max(0, min(self.offset, count * row_height - height))
+        overscan = self.overscan
+        first = max(0, offset // row_height - overscan)
+        last = min(count, -(-(offset + height) // row_height) + overscan)
+        return (first, last) if first < last else (0, 0)
+
+    def _layout_(self, x: int, y: int, width: int, height: int) -> tuple[int, int]:
+        row_height = self.row_height
+        content = self.count * row_height
+        if height != self._height_:
+            self._height_ = height
+            if self._window_for(height) != self._window_:
+                # the rows for this height are built by the next rebuild
+                self.mark_modified()
+
+        offset = max(0, min(self.offset, content - height))
+        top = y - offset
+        first = self._window_[0]
+        for index, child in enumerate(self._visible_, first):
+            layout(child, x, top + index * row_height, width, row_height)
+        return (width, min(height, content))
+
+    def _drop_rows(self, first: int, last: int) -> None:
+        # drops the built rows outside of first..last
+        rows = self._rows_
+        if rows is None:
+            self._rows_ = {}
+            return
+        pool = self.pool
+        for index in [index for index in rows if not first <= index < last]:
+            child = rows.pop(index)
+            # the States its rows read must not keep them alive
+            if pool is not None:
+                pool.release(child)
+            else:
+                forget(child)
+            child._parent_ = None
+        if not rows:
+            self._window_ = (0, 0)
+            self._visible_ = ()
@@ -63,6 +63,9 @@ runtime_typing: "Callable[[], Literal[True]]"
 supports_warnings: "Callable[[], Literal[True]]"
 cleanup_typing_artifacts: "Callable[[dict[str, object]], set[str]]"
 typing_standin: type[object]
+# a microsecond timer for profiling, use ticks_diff(end, start) to handle wrap around
+ticks_us: "Callable[[], int]"
+ticks_diff: "Callable[[int, int], int]"
 
 if TYPE_CHECKING:
     __all__: tuple[str, ...] = (
@@ -71,6 +74,8 @@ if TYPE_CHECKING:
         "supports_warnings",
         "typing_standin",
         "cleanup_typing_artifacts",
+        "ticks_us",
+        "ticks_diff",
     )
 
 # --- [ implementing the exported objects ] ---
@@ -114,3 +119,15 @@ except:  # micropython
     del getrandbits
 finally:
     pass
+
+
+try:  # micropython
+    from time import ticks_us, ticks_diff  # type: ignore
+except ImportError:
+    try:  # cpython
+        from time import perf_counter_ns as _ticks_ns
+    except ImportError:  # circuitpython
+        from time import monotonic_ns as _ticks_ns  # type: ignore
+
+    ticks_us = lambda: _ticks_ns() // 1000
+    ticks_diff = lambda end, start: end - start
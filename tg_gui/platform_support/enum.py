@@ -1,66 +1,124 @@
 # Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
 # this file is licensed under the MIT License, see the project root.
 
+"""
+A minimal `enum` for circuitpython and micropython (see platform_support). Members are
+singletons compared and hashed by identity, so they can be used as dict keys and
+comparing them is as cheap as `is`. Each Enum subclass keeps its members in
+`_member_list_` (in declaration order), `_member_map_` (by name) and
+`_value2member_map_` (by value), `Cls(value)` looks a member up by value.
+"""
+
 import sys
-import gc
 
 if sys.implementation.name not in {"circuitpython", "micropython"}:
-    from typing import Any, Self
+    from typing import Any, Iterator, Self
 
 
-class Enum:
-    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
-        assert (
-            cls is not Enum
-        ), "subclass Enum to create enum instances, tried to init directly"
-        return object.__new__(cls)
+# iterating over the class (`for member in Cls`) needs a metaclass, which not every
+# port supports. the members are always available from `_member_list_`
+try:
 
-    def __init__(self, name: str, value: Any, from_auto: bool = False) -> None:
-        self._name: str = name
-        self._from_auto = from_auto
-        self.value = value
+    class _EnumType(type):
+        def __iter__(cls) -> "Iterator[Any]":
+            return iter(cls._member_list_)  # type: ignore
 
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}.{self._name}: {repr(self.value)}{' (auto)' if self._from_auto else ''}>"
+        def __len__(cls) -> int:
+            return len(cls._member_list_)  # type: ignore
 
-    def __init_subclass__(cls) -> None:
-        # increment so auto numbers are all greater than the value in the class body
-        # this is not standards complicant but should do the trick
-        int_values: tuple[int, ...] = tuple(
-            filter(lambda o: isinstance(o, int), cls.__dict__.values())  # type: ignore
-        )
-        auto_number: int = max(int_values) if len(int_values) else 0
+        def __contains__(cls, member: object) -> bool:
+            return member.__class__ is cls
+
+    _EnumBase = _EnumType("_EnumBase", (), {"__slots__": ()})
+except Exception:  # ports without metaclass support
+    _EnumBase = object
+
+
+class Enum(_EnumBase):  # type: ignore
+    __slots__ = ("name", "value", "_from_auto")
 
-        for name, attr in cls.__dict__.items():
-            from_auto = False
-            if isinstance(attr, auto):
-                from_auto = True
-                auto_number += 1
-                attr = auto_number
+    _member_list_: "tuple[Self, ...]" = ()
+    _member_map_: "dict[str, Self]" = {}
+    _value2member_map_: "dict[Any, Self]" = {}
 
-            setattr(cls, name, cls(name, attr, from_auto=from_auto))
+    def __new__(cls, value: "Any") -> "Self":
+        # Cls(value) looks up the existing member, members are only made on definition
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}")
 
-        # for now, disable creating more variants
-        if "__init__" not in cls.__dict__:
-            setattr(cls, "__init__", None)
+    def __init__(self, value: "Any") -> None:
+        pass
 
-        # cleanup the now referenceless auto() instances
-        if int_values:
-            gc.collect()
+    def __repr__(self) -> str:
+        auto_note = " (auto)" if self._from_auto else ""
+        return f"<{self.__class__.__name__}.{self.name}: {repr(self.value)}{auto_note}>"
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}.{self.name}"
 
-    def __eq__(self, other: Self) -> bool:
-        return other.__class__ is self.__class__ and self.value == other.value
+    def __init_subclass__(cls) -> None:
+        namespace = cls.__dict__
+        names = [name for name, attr in namespace.items() if _is_member(name, attr)]
+
+        # auto numbers are all greater than the int values in the class body, this is
+        # not standards compliant but should do the trick
+        auto_number = 0
+        for name in names:
+            attr = namespace[name]
+            if isinstance(attr, int) and attr > auto_number:
+                auto_number = attr
+
+        # number the auto() values in the order they were created, the class
+        # __dict__ is not ordered on all ports
+        autos = [name for name in names if isinstance(namespace[name], auto)]
+        autos.sort(key=lambda name: namespace[name]._stamp)
+        auto_values = {}
+        for name in autos:
+            auto_number += 1
+            auto_values[name] = auto_number
+
+        members = []
+        by_name = {}
+        by_value = {}
+        for name in names:
+            from_auto = name in auto_values
+            value = auto_values[name] if from_auto else namespace[name]
+
+            member = object.__new__(cls)
+            member.name = name
+            member.value = value
+            member._from_auto = from_auto
+            setattr(cls, name, member)
+            members.append(member)
+            by_name[name] = member
+            # like the standard enum, a repeated value looks up the first member
+            if value not in by_value:
+                by_value[value] = member
+
+        cls._member_list_ = tuple(members)
+        cls._member_map_ = by_name
+        cls._value2member_map_ = by_value
+
+
+def _is_member(name: str, attr: object) -> bool:
+    # dunders, _sunder_ and private names, methods and descriptors are not members
+    if name[:1] == "_":
+        return False
+    return not (
+        callable(attr) or isinstance(attr, (classmethod, staticmethod, property))
+    )
 
 
 class auto:
-    _next_stamp = 1
+    __slots__ = ("_stamp",)
 
-    value: None | int
+    _next_stamp = 1
 
     def __init__(self) -> None:
-        self.value = None
-        self._stamp = self._next_stamp
+        self._stamp = auto._next_stamp
         auto._next_stamp += 1
 
-    def __repr__(self):
-        return f"auto({self.value})"
+    def __repr__(self) -> str:
+        return "auto()"
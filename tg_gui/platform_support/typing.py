@@ -26,8 +26,13 @@ if TYPE_CHECKING: # always true at "type-time"
 
 locals()["TYPE_CHECKING"] = False
 
+import gc as _gc
+
 # here, const is just used a function that returns the called value
-from micropython import const as runtime_checkable  # type: ignore
+try:
+    from micropython import const as runtime_checkable  # type: ignore
+except ImportError:  # importing the shim on cpython, ex: to benchmark it
+    runtime_checkable = lambda o: o
 
 dataclass_transform = lambda *_, **__: (lambda o: o)  # type: ignore
 
@@ -48,6 +53,23 @@ Self = _GenericBase
 typing_standin = _GenericBase
 
 
+# the ids of the objects this module provides, see cleanup_typing_artifacts
+_artifact_ids: "set[int] | None" = None
+
+# (module, names removed, heap bytes freed or None) for each cleaned up module
+_records: "list[tuple[str, int, int | None]]" = []
+
+
+def _collect_artifact_ids() -> "set[int]":
+    global _artifact_ids
+    # by identity, TYPE_CHECKING's False would match every other False. the private
+    # names are this module's own helpers (ex: the gc module)
+    _artifact_ids = {
+        id(v) for k, v in globals().items() if k[:1] != "_" and v is not False
+    }
+    return _artifact_ids
+
+
 def cleanup_typing_artifacts(
     scope: dict[str, object], debug: bool = False
 ) -> frozenset[str]:
@@ -57,27 +79,51 @@ def cleanup_typing_artifacts(
     were imported that the scope's dictionary would shrink enough to trigger a resize,
     naturally ;-)]
 
+    Names are matched to this module's objects by identity, one set lookup per name.
+    See `cleanup_report()` for what was removed from each module, with `debug` the heap
+    freed is measured as well (this runs a garbage collection). To not pay for this at
+    all, strip the typing code before deploying with `python -m tools.strip_typing`.
+
     :param scope: the scope to clean up, generally `locals()`.
     :returns: a set of the keys that were removed.
     """
-
-    excluded_values = globals().values()
+    ids = _artifact_ids or _collect_artifact_ids()
 
     to_remove = frozenset(
         k
         for k, v in scope.items()
-        if v in excluded_values and k not in ("TYPE_CHECKING", "Self")
+        if id(v) in ids and k != "TYPE_CHECKING" and k != "Self"
     )
 
-    if debug and __debug__:
-        print(
-            f"cleaning typing data from the {scope.get('__name__', '??')} module, "
-            + f"initial size = {len(scope)},"
-            + f" final size = {len(scope) - len(to_remove)},"
-            + f" reduction = {(len(to_remove) / len(scope))*100}%"
-        )
+    measure = debug and __debug__ and hasattr(_gc, "mem_alloc")
+    if measure:
+        _gc.collect()
+        before = _gc.mem_alloc()  # type: ignore
 
     for k in to_remove:
         del scope[k]
 
+    freed = None
+    if measure:
+        _gc.collect()
+        freed = before - _gc.mem_alloc()  # type: ignore
+    name = scope.get("__name__", "??")
+    _records.append((name, len(to_remove), freed))  # type: ignore
+
+    if debug and __debug__:
+        print(
+            f"cleaning typing data from the {name} module, "
+            + f"initial size = {len(scope) + len(to_remove)},"
+            + f" final size = {len(scope)},"
+            + f" freed = {'?' if freed is None else freed} bytes"
+        )
+
     return to_remove
+
+
+def cleanup_report() -> "list[tuple[str, int, int | None]]":
+    """
+    :returns: (module, names removed, heap bytes freed) for each module cleaned up so
+    far, the bytes are only measured with `debug` and are None otherwise
+    """
+    return list(_records)
@@ -7,7 +7,7 @@ from __future__ import annotations
 # pyright: reportUnusedImport=false
 from typing import TYPE_CHECKING, Self
 
-from .core import Widget, AttrDef, Body
+from .core import Widget, AttrDef, State, Body
 from ._proto_main import main
 
 # --- end exports ---
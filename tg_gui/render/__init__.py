@@ -0,0 +1,67 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+# pyright: reportUnusedImport=false
+
+# the exports are imported on first use, like tg_gui's, so an app drawing Text does
+# not load the headless backend (or mmap for MappedFont)
+
+from typing import TYPE_CHECKING
+
+# imported eagerly since it shares its name with its submodule, importing the submodule
+# (ex: from headless) would set `draw` on this package to the module
+from .draw import draw
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .framebuffer import FrameBuffer, PixelFormat, intersect
+    from .font import Font, BuiltinFont, builtin_font, measure
+    from .atlas import (
+        GlyphAtlas,
+        ShapingCache,
+        glyph_atlas,
+        shaping_cache,
+        text_cache_stats,
+    )
+    from .mapped_font import MappedFont
+    from .headless import HeadlessRenderer
+    from .damage import DamageTracker, merge_overlapping, merge_within
+    from .display import HeadlessDisplay
+
+__module_exports: dict[str, str] = {
+    # "<the exported name>": "<the submodule it is imported from>"
+    "FrameBuffer": "framebuffer",
+    "PixelFormat": "framebuffer",
+    "intersect": "framebuffer",
+    "Font": "font",
+    "BuiltinFont": "font",
+    "builtin_font": "font",
+    "measure": "font",
+    "GlyphAtlas": "atlas",
+    "ShapingCache": "atlas",
+    "glyph_atlas": "atlas",
+    "shaping_cache": "atlas",
+    "text_cache_stats": "atlas",
+    "MappedFont": "mapped_font",
+    "HeadlessRenderer": "headless",
+    "DamageTracker": "damage",
+    "merge_overlapping": "damage",
+    "merge_within": "damage",
+    "HeadlessDisplay": "display",
+}
+
+
+def __getattr__(name: str) -> "Any":
+    try:
+        pack = __module_exports[name]
+    except KeyError as err:
+        args = err.args
+        raise AttributeError(*args)
+
+    module = __import__(pack, globals(), None, (name,), 1)
+
+    # cache the export in the module globals so later lookups skip __getattr__
+    obj = globals()[name] = getattr(module, name)
+    del __module_exports[name]
+    return obj
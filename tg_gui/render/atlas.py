@@ -0,0 +1,215 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Caches for drawing text. `glyph_atlas` rasterizes each (font, codepoint) once and packs
+the bitmap into a fixed size bytearray, `shaping_cache` keeps the measured size
+and glyph positions of recently drawn strings. Both evict the least recently used
+entries, see `text_cache_stats()` for their hit rates and memory use.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts, runtime_typing
+
+from ..core.cache import LRUCache
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any
+
+    # (font, codepoint), fonts are told apart by identity: names are not unique (ex:
+    # .tgf names are cut to 16 bytes). the cache keeps a font alive until evicted
+    GlyphKey = tuple["Font", int]
+    # (offset into the atlas, width, height, advance, bitmap size in bytes)
+    AtlasEntry = tuple[int, int, int, int, int]
+    # (font, text)
+    ShapeKey = tuple["Font", str]
+    # (width, height, (x, y, codepoint) of each glyph relative to the top left)
+    Shaped = tuple[int, int, tuple[tuple[int, int, int], ...]]
+
+    __all__ = (
+        "GlyphAtlas",
+        "ShapingCache",
+        "glyph_atlas",
+        "shaping_cache",
+        "text_cache_stats",
+    )
+
+if TYPE_CHECKING:
+    from .font import Font, Glyph
+
+
+class GlyphAtlas(LRUCache["GlyphKey", "AtlasEntry"]):
+    """
+    Rasterized glyph bitmaps packed into one bytearray of `capacity` bytes. When a new
+    glyph does not fit the least recently used glyphs are evicted until it does.
+    """
+
+    def __init__(self, capacity: int = 8192) -> None:
+        super().__init__(capacity)
+        self.buffer = bytearray(capacity)
+        self._view = memoryview(self.buffer)
+        # the unused (offset, size) regions of the buffer, sorted by offset
+        self._free: list[tuple[int, int]] = [(0, capacity)]
+        # glyphs larger than the whole atlas, these are never cached
+        self.uncacheable = 0
+
+    def glyph(self, font: Font, codepoint: int) -> Glyph:
+        """
+        :returns: the glyph for `codepoint`, rasterized by `font` only if it is not in
+        the atlas. The bitmap is a view of the atlas, valid until the next call.
+        """
+        key = (font, codepoint)
+        entry = self.get(key)
+        if entry is None:
+            glyph = font.glyph(codepoint)
+            entry = self._store(key, glyph)
+            if entry is None:
+                self.uncacheable += 1
+                return glyph
+        offset, width, height, advance, size = entry
+        return (width, height, advance, self._view[offset : offset + size])
+
+    def pop(self, key: GlyphKey) -> AtlasEntry | None:
+        entry = super().pop(key)
+        if entry is not None:
+            self._release(entry[0], entry[4])
+        return entry
+
+    def pop_oldest(self) -> tuple[GlyphKey, AtlasEntry] | None:
+        item = super().pop_oldest()
+        if item is not None:
+            self._release(item[1][0], item[1][4])
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._free = [(0, self.capacity)]
+
+    def resize(self, capacity: int) -> None:
+        # the glyphs are not re-packed, the atlas starts over empty
+        self.capacity = capacity
+        self.buffer = bytearray(capacity)
+        self._view = memoryview(self.buffer)
+        self.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "evictions": self.evictions,
+            "uncacheable": self.uncacheable,
+            "glyphs": len(self),
+            "bytes_used": self.weight,
+            "bytes_capacity": self.capacity,
+            "free_regions": len(self._free),
+        }
+
+    def _store(self, key: GlyphKey, glyph: Glyph) -> AtlasEntry | None:
+        width, height, advance, bitmap = glyph
+        size = len(bitmap)
+        if size > self.capacity:
+            return None
+
+        if size:
+            offset = self._allocate(size)
+            while offset is None:
+                # evicting everything frees the whole buffer, so this ends
+                self.pop_oldest()
+                offset = self._allocate(size)
+            self.buffer[offset : offset + size] = bitmap
+        else:
+            offset = 0
+
+        entry = (offset, width, height, advance, size)
+        self.put(key, entry, size)
+        return entry
+
+    def _allocate(self, size: int) -> int | None:
+        # first fit
+        free = self._free
+        for index, (offset, available) in enumerate(free):
+            if available >= size:
+                if available == size:
+                    free.pop(index)
+                else:
+                    free[index] = (offset + size, available - size)
+                return offset
+        return None
+
+    def _release(self, offset: int, size: int) -> None:
+        if not size:
+            return
+        free = self._free
+        index = 0
+        while index < len(free) and free[index][0] < offset:
+            index += 1
+        # merge with the free regions directly after and before it
+        if index < len(free) and offset + size == free[index][0]:
+            size += free.pop(index)[1]
+        if index and free[index - 1][0] + free[index - 1][1] == offset:
+            index -= 1
+            offset, before = free.pop(index)
+            size += before
+        free.insert(index, (offset, size))
+
+
+class ShapingCache(LRUCache["ShapeKey", "Shaped"]):
+    """
+    The measured size and glyph positions of strings, bounded by the total number of
+    characters cached (`capacity`). Glyph advances are looked up through `atlas`.
+    """
+
+    def __init__(self, capacity: int = 4096, atlas: GlyphAtlas | None = None) -> None:
+        super().__init__(capacity)
+        self.atlas = atlas
+
+    def shape(self, font: Font, text: str) -> Shaped:
+        """:returns: the (width, height, glyph positions) of `text` in `font`"""
+        key = (font, text)
+        shaped = self.get(key)
+        if shaped is None:
+            shaped = self._shape(font, text)
+            self.put(key, shaped, len(text) + 1)
+        return shaped
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "evictions": self.evictions,
+            "strings": len(self),
+            "chars": self.weight,
+        }
+
+    def _shape(self, font: Font, text: str) -> Shaped:
+        glyph = (glyph_atlas if self.atlas is None else self.atlas).glyph
+        line_height = font.line_height
+        positions: list[tuple[int, int, int]] = []
+        width = 0
+        top = 0
+        for line in text.split("\n"):
+            pen = 0
+            for char in line:
+                codepoint = ord(char)
+                positions.append((pen, top, codepoint))
+                pen += glyph(font, codepoint)[2]
+            width = max(width, pen)
+            top += line_height
+        return (width, top, tuple(positions))
+
+
+glyph_atlas = GlyphAtlas()
+shaping_cache = ShapingCache()
+
+
+def text_cache_stats() -> dict[str, dict[str, Any]]:
+    """:returns: the hit rates and memory use of the default text caches"""
+    return {"glyphs": glyph_atlas.stats(), "shaping": shaping_cache.stats()}
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,151 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Dirty-rectangle damage tracking. Widgets re-evaluated by a rebuild or moved by a layout
+are collected by uid, then both their old and new rects are added to the damage list
+so only those regions are redrawn and pushed to the display.
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts, runtime_typing
+
+from ..core.widget import Widget
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Callable
+
+    from ..core.shared import UID
+
+    __all__ = (
+        "DamageTracker",
+        "union",
+        "merge_overlapping",
+        "merge_within",
+    )
+
+if TYPE_CHECKING:
+    from .framebuffer import Rect
+
+    MergeHeuristic = Callable[[Rect, Rect, Rect], bool]
+
+
+def union(a: Rect, b: Rect) -> Rect:
+    """:returns: the bounding box of two rects"""
+    x = min(a[0], b[0])
+    y = min(a[1], b[1])
+    right = max(a[0] + a[2], b[0] + b[2])
+    bottom = max(a[1] + a[3], b[1] + b[3])
+    return (x, y, right - x, bottom - y)
+
+
+# --- merge heuristics ---
+# called with (a, b, union(a, b)), return True to replace a and b with their union
+
+
+def merge_overlapping(a: Rect, b: Rect, merged: Rect) -> bool:
+    """only merge rects that overlap (or touch)"""
+    # touching edges count on every side, so the result does not depend on the order
+    return (
+        a[0] <= b[0] + b[2]
+        and b[0] <= a[0] + a[2]
+        and a[1] <= b[1] + b[3]
+        and b[1] <= a[1] + a[3]
+    )
+
+
+def merge_within(waste: float) -> MergeHeuristic:
+    """
+    merge when the union's area is at most `waste` times the area of the two rects,
+    ex: merge_within(1.5) accepts redrawing up to 50% more pixels to save a push.
+    """
+
+    def heuristic(a: Rect, b: Rect, merged: Rect) -> bool:
+        return merged[2] * merged[3] <= waste * (a[2] * a[3] + b[2] * b[3])
+
+    return heuristic
+
+
+class DamageTracker:
+    """
+    Collects damaged regions between frames. Hook it into a frame with `changed(...)`
+    after the rebuild (with the re-evaluated widgets), install `moved` as the layout
+    move listener, and call `collect()` after the layout to get the merged regions.
+    """
+
+    def __init__(
+        self,
+        merge: MergeHeuristic = merge_within(1.5),
+        max_rects: int = 8,
+    ) -> None:
+        self.merge = merge
+        # past this many regions everything is merged into one bounding box
+        self.max_rects = max_rects
+        # widgets changed this frame by uid, with the rect they had before the change
+        self._pending: dict[UID, tuple[Widget, Rect | None]] = {}
+        self._extra: list[Rect] = []
+
+    def add(self, rect: Rect) -> None:
+        """damage a region directly, ex: the whole screen on the first frame"""
+        self._extra.append(rect)
+
+    def changed(self, widgets: list[Widget]) -> None:
+        pending = self._pending
+        for widget in widgets:
+            if widget.uid not in pending:
+                pending[widget.uid] = (widget, widget._rect_)
+
+    def moved(self, widget: Widget, old: Rect | None) -> None:
+        # moving a widget that draws nothing itself (ex: a Group) does not change any
+        # pixels, its children report their own moves
+        if type(widget)._draw_ is Widget._draw_:
+            return
+        pending = self._pending
+        if widget.uid not in pending:
+            pending[widget.uid] = (widget, old)
+
+    def collect(self) -> list[Rect]:
+        """
+        :returns: the merged damage since the last collect, then resets the tracker
+        """
+        rects = self._extra
+        for widget, old in self._pending.values():
+            if old is not None and old[2] and old[3]:
+                rects.append(old)
+            new = widget._rect_
+            if new is not None and new != old and new[2] and new[3]:
+                rects.append(new)
+        self._pending = {}
+        self._extra = []
+        return self._merge_all(rects)
+
+    def _merge_all(self, rects: list[Rect]) -> list[Rect]:
+        merge = self.merge
+        merged: list[Rect] = []
+        for rect in rects:
+            # fold the rect into any region the heuristic accepts, repeating since the
+            # grown region may now accept others
+            index = 0
+            while index < len(merged):
+                other = merged[index]
+                candidate = union(rect, other)
+                if candidate == other or merge(rect, other, candidate):
+                    rect = candidate
+                    merged.pop(index)
+                    index = 0
+                else:
+                    index += 1
+            merged.append(rect)
+
+        if len(merged) > self.max_rects:
+            bounds = merged[0]
+            for rect in merged:
+                bounds = union(bounds, rect)
+            merged = [bounds]
+        return merged
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,51 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts, runtime_typing
+
+from .framebuffer import FrameBuffer, intersect
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    __all__ = ("HeadlessDisplay",)
+
+if TYPE_CHECKING:
+    from .framebuffer import Rect
+
+
+class HeadlessDisplay:
+    """
+    Stands in for a (SPI) display: regions pushed to it are copied into its own pixel
+    memory, like a display controller's, and the bytes transferred are counted.
+    """
+
+    def __init__(self, framebuffer: FrameBuffer) -> None:
+        self.pixels = FrameBuffer(
+            framebuffer.width, framebuffer.height, framebuffer.format
+        )
+        self.bytes_pushed = 0
+        self.pushes = 0
+
+    def push(self, source: FrameBuffer, rect: Rect) -> None:
+        clipped = intersect(rect, source.bounds)
+        if clipped is None:
+            return
+        data = source.region(clipped)
+        self.bytes_pushed += len(data)
+        self.pushes += 1
+
+        x, y, width, height = clipped
+        pixels = self.pixels
+        row_bytes = width * pixels.bytes_per_pixel
+        start = y * pixels.stride + x * pixels.bytes_per_pixel
+        for row in range(height):
+            offset = start + row * pixels.stride
+            pixels.buffer[offset : offset + row_bytes] = data[
+                row * row_bytes : (row + 1) * row_bytes
+            ]
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,38 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts, runtime_typing
+
+from .framebuffer import intersect
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    __all__ = ("draw",)
+
+if TYPE_CHECKING:
+    from ..core.widget import Widget
+    from .framebuffer import FrameBuffer, Rect
+
+
+def draw(widget: Widget, target: FrameBuffer, clip: Rect | None = None) -> None:
+    """
+    draws the laid out tree under `widget` onto `target`. When `clip` is given only the
+    pixels inside it are drawn, subtrees outside of it (or the target) are skipped.
+    """
+    rect = widget._rect_
+    if rect is None or intersect(rect, target.bounds if clip is None else clip) is None:
+        return
+    widget._draw_(target, clip)
+    # containers that scroll (ex: ListView) keep their children inside their rect
+    if widget._clips_children_:
+        clip = intersect(rect, target.bounds if clip is None else clip)
+        if clip is None:
+            return
+    for child in widget.subwidgets():
+        draw(child, target, clip)
+
+
+cleanup_typing_artifacts(locals())
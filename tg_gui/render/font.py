@@ -0,0 +1,116 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts, runtime_typing
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any
+
+    # (width, height, advance, 1 bit per pixel row-major bitmap, rows padded to bytes)
+    Glyph = tuple[int, int, int, Any]
+
+    __all__ = ("Font", "BuiltinFont", "builtin_font")
+
+
+class Font(Protocol):
+    """what Text needs from a font"""
+
+    name: str
+    size: int
+    line_height: int
+
+    def glyph(self, codepoint: int) -> Glyph: ...
+
+
+# 5x7 glyphs for " " through "~", 7 rows each, the 5 columns left aligned in a byte
+_ascii_glyphs = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x20\x20\x20\x20\x20\x00\x20"
+    b"\x50\x50\x50\x00\x00\x00\x00\x50\x50\xf8\x50\xf8\x50\x50"
+    b"\x20\x78\xa0\x70\x28\xf0\x20\xc0\xc8\x10\x20\x40\x98\x18"
+    b"\x60\x90\xa0\x40\xa8\x90\x68\x20\x20\x20\x00\x00\x00\x00"
+    b"\x10\x20\x40\x40\x40\x20\x10\x40\x20\x10\x10\x10\x20\x40"
+    b"\x00\x20\xa8\x70\xa8\x20\x00\x00\x20\x20\xf8\x20\x20\x00"
+    b"\x00\x00\x00\x00\x60\x20\x40\x00\x00\x00\xf8\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x60\x60\x00\x08\x10\x20\x40\x80\x00"
+    b"\x70\x88\x98\xa8\xc8\x88\x70\x20\x60\x20\x20\x20\x20\x70"
+    b"\x70\x88\x08\x10\x20\x40\xf8\xf8\x10\x20\x10\x08\x88\x70"
+    b"\x10\x30\x50\x90\xf8\x10\x10\xf8\x80\xf0\x08\x08\x88\x70"
+    b"\x30\x40\x80\xf0\x88\x88\x70\xf8\x08\x10\x20\x40\x40\x40"
+    b"\x70\x88\x88\x70\x88\x88\x70\x70\x88\x88\x78\x08\x10\x60"
+    b"\x00\x60\x60\x00\x60\x60\x00\x00\x60\x60\x00\x60\x20\x40"
+    b"\x10\x20\x40\x80\x40\x20\x10\x00\x00\xf8\x00\xf8\x00\x00"
+    b"\x40\x20\x10\x08\x10\x20\x40\x70\x88\x08\x10\x20\x00\x20"
+    b"\x70\x88\x08\x68\xa8\xa8\x70\x70\x88\x88\xf8\x88\x88\x88"
+    b"\xf0\x88\x88\xf0\x88\x88\xf0\x70\x88\x80\x80\x80\x88\x70"
+    b"\xe0\x90\x88\x88\x88\x90\xe0\xf8\x80\x80\xf0\x80\x80\xf8"
+    b"\xf8\x80\x80\xf0\x80\x80\x80\x70\x88\x80\xb8\x88\x88\x78"
+    b"\x88\x88\x88\xf8\x88\x88\x88\x70\x20\x20\x20\x20\x20\x70"
+    b"\x38\x10\x10\x10\x10\x90\x60\x88\x90\xa0\xc0\xa0\x90\x88"
+    b"\x80\x80\x80\x80\x80\x80\xf8\x88\xd8\xa8\xa8\x88\x88\x88"
+    b"\x88\x88\xc8\xa8\x98\x88\x88\x70\x88\x88\x88\x88\x88\x70"
+    b"\xf0\x88\x88\xf0\x80\x80\x80\x70\x88\x88\x88\xa8\x90\x68"
+    b"\xf0\x88\x88\xf0\xa0\x90\x88\x78\x80\x80\x70\x08\x08\xf0"
+    b"\xf8\x20\x20\x20\x20\x20\x20\x88\x88\x88\x88\x88\x88\x70"
+    b"\x88\x88\x88\x88\x88\x50\x20\x88\x88\x88\xa8\xa8\xa8\x50"
+    b"\x88\x88\x50\x20\x50\x88\x88\x88\x88\x50\x20\x20\x20\x20"
+    b"\xf8\x08\x10\x20\x40\x80\xf8\x70\x40\x40\x40\x40\x40\x70"
+    b"\x00\x80\x40\x20\x10\x08\x00\x70\x10\x10\x10\x10\x10\x70"
+    b"\x20\x50\x88\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8"
+    b"\x40\x20\x10\x00\x00\x00\x00\x00\x00\x70\x08\x78\x88\x78"
+    b"\x80\x80\xb0\xc8\x88\x88\xf0\x00\x00\x70\x80\x80\x88\x70"
+    b"\x08\x08\x68\x98\x88\x88\x78\x00\x00\x70\x88\xf8\x80\x70"
+    b"\x30\x48\x40\xe0\x40\x40\x40\x00\x78\x88\x88\x78\x08\x70"
+    b"\x80\x80\xb0\xc8\x88\x88\x88\x20\x00\x60\x20\x20\x20\x70"
+    b"\x10\x00\x30\x10\x10\x90\x60\x80\x80\x90\xa0\xc0\xa0\x90"
+    b"\x60\x20\x20\x20\x20\x20\x70\x00\x00\xd0\xa8\xa8\x88\x88"
+    b"\x00\x00\xb0\xc8\x88\x88\x88\x00\x00\x70\x88\x88\x88\x70"
+    b"\x00\x00\xf0\x88\xf0\x80\x80\x00\x00\x68\x98\x78\x08\x08"
+    b"\x00\x00\xb0\xc8\x80\x80\x80\x00\x00\x70\x80\x70\x08\xf0"
+    b"\x40\x40\xe0\x40\x40\x48\x30\x00\x00\x88\x88\x88\x98\x68"
+    b"\x00\x00\x88\x88\x88\x50\x20\x00\x00\x88\x88\xa8\xa8\x50"
+    b"\x00\x00\x88\x50\x20\x50\x88\x00\x00\x88\x88\x78\x08\x70"
+    b"\x00\x00\xf8\x10\x20\x40\xf8\x10\x20\x20\x40\x20\x20\x10"
+    b"\x20\x20\x20\x20\x20\x20\x20\x40\x20\x20\x10\x20\x20\x40"
+    b"\x00\x00\x40\xa8\x10\x00\x00"
+)
+# drawn for codepoints the font has no glyph for
+_missing_glyph = b"\xf8\x88\x88\x88\x88\x88\xf8"
+
+
+class BuiltinFont:
+    """
+    A dependency free, fixed 6x8 cell bitmap font for printable ascii, so Text can draw
+    without a font file. Other codepoints draw as an empty box.
+    """
+
+    name = "builtin"
+    size = 8
+    line_height = 8
+
+    _cell_width = 6
+
+    def glyph(self, codepoint: int) -> Glyph:
+        if 0x20 <= codepoint < 0x7F:
+            start = (codepoint - 0x20) * 7
+            return (5, 7, self._cell_width, _ascii_glyphs[start : start + 7])
+        elif codepoint < 0x20:
+            # control characters take a blank cell
+            return (5, 7, self._cell_width, _ascii_glyphs[0:7])
+        return (5, 7, self._cell_width, _missing_glyph)
+
+
+builtin_font = BuiltinFont()
+
+
+def measure(font: Font, text: str) -> tuple[int, int]:
+    """:returns: the (width, height) of `text` in `font`, lines split on newlines"""
+    lines = text.split("\n")
+    width = max(sum(font.glyph(ord(char))[2] for char in line) for line in lines)
+    return (width, font.line_height * len(lines))
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,144 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts, runtime_typing
+
+from enum import Enum
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any
+
+    Rect = tuple[int, int, int, int]
+
+    __all__ = ("PixelFormat", "FrameBuffer", "intersect")
+
+
+class PixelFormat(Enum):
+    # the values are the bytes per pixel
+    RGB565 = 2
+    RGB888 = 3
+
+
+def intersect(a: Rect, b: Rect) -> Rect | None:
+    """:returns: the overlap of two (x, y, width, height) rects, None if they do not"""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    x = max(ax, bx)
+    y = max(ay, by)
+    right = min(ax + aw, bx + bw)
+    bottom = min(ay + ah, by + bh)
+    if right <= x or bottom <= y:
+        return None
+    return (x, y, right - x, bottom - y)
+
+
+class FrameBuffer:
+    """
+    A pure python RGB565 (big endian, as sent to most SPI displays) or RGB888 frame
+    buffer backed by a bytearray. Colors are given as 0xRRGGBB ints.
+    """
+
+    def __init__(
+        self, width: int, height: int, format: PixelFormat = PixelFormat.RGB565
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.format = format
+        self.bytes_per_pixel: int = format.value
+        self.stride = width * self.bytes_per_pixel
+        self.buffer = bytearray(self.stride * height)
+        self.view = memoryview(self.buffer)
+        self.bounds: Rect = (0, 0, width, height)
+
+    def pixel(self, color: int) -> bytes:
+        """:returns: the bytes for one pixel of `color` in this buffer's format"""
+        r, g, b = (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+        if self.format is PixelFormat.RGB888:
+            return bytes((r, g, b))
+        packed = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return bytes((packed >> 8, packed & 0xFF))
+
+    def fill(self, color: int) -> None:
+        self.fill_rect(self.bounds, color)
+
+    def fill_rect(self, rect: Rect, color: int) -> None:
+        clipped = intersect(rect, self.bounds)
+        if clipped is None:
+            return
+        x, y, width, _ = clipped
+        bpp = self.bytes_per_pixel
+        stride = self.stride
+        row = self.pixel(color) * width
+        start = y * stride + x * bpp
+        for offset in range(start, start + clipped[3] * stride, stride):
+            self.buffer[offset : offset + len(row)] = row
+
+    def blit_mask(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        mask: Any,
+        color: int,
+        clip: Rect | None = None,
+    ) -> None:
+        """
+        draws the set bits of a 1 bit per pixel, row-major `mask` (each row padded to
+        whole bytes, most significant bit first) in `color` with its top left at `x, y`.
+        """
+        area = intersect((x, y, width, height), self.bounds)
+        if area is not None and clip is not None:
+            area = intersect(area, clip)
+        if area is None:
+            return
+
+        left, top, area_width, area_height = area
+        buffer = self.buffer
+        bpp = self.bytes_per_pixel
+        stride = self.stride
+        pixel = self.pixel(color)
+        mask_stride = (width + 7) // 8
+        first_col = left - x
+        end_col = first_col + area_width
+
+        for row in range(top - y, top - y + area_height):
+            mask_row = row * mask_stride
+            dest_row = (y + row) * stride + x * bpp
+            # write runs of set bits with one slice assignment each
+            col = first_col
+            while col < end_col:
+                if not (mask[mask_row + (col >> 3)] >> (7 - (col & 7))) & 1:
+                    col += 1
+                    continue
+                run = col
+                while (
+                    run < end_col
+                    and (mask[mask_row + (run >> 3)] >> (7 - (run & 7))) & 1
+                ):
+                    run += 1
+                start = dest_row + col * bpp
+                buffer[start : start + (run - col) * bpp] = pixel * (run - col)
+                col = run
+
+    def region(self, rect: Rect) -> bytes:
+        """
+        :returns: a copy of the pixels in `rect`, row by row (ex: to push to a display)
+        """
+        clipped = intersect(rect, self.bounds)
+        if clipped is None:
+            return b""
+        x, y, width, height = clipped
+        bpp = self.bytes_per_pixel
+        start = y * self.stride + x * bpp
+        return b"".join(
+            self.view[offset : offset + width * bpp]
+            for offset in range(start, start + height * self.stride, self.stride)
+        )
+
+
+cleanup_typing_artifacts(locals())
@@ -0,0 +1,162 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+from __future__ import annotations
+
+from ..platform_support import (
+    cleanup_typing_artifacts,
+    runtime_typing,
+    ticks_us,
+    ticks_diff,
+)
+
+from ..core.rebuild import rebuild_steps
+from ..layout import layout, set_move_listener
+from .framebuffer import FrameBuffer, PixelFormat
+from .draw import draw
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Iterator, Callable
+
+    __all__ = ("HeadlessRenderer",)
+
+if TYPE_CHECKING:
+    from ..core.widget import Widget
+    from .framebuffer import Rect
+    from .damage import DamageTracker
+    from .display import HeadlessDisplay
+    from ..hit_test import HitIndex
+
+    MoveListener = Callable[[Widget, Rect | None], None]
+
+
+class HeadlessRenderer:
+    """
+    Renders a widget tree into an in-memory FrameBuffer, timing each phase of a frame:
+    body build, layout and rasterize. `phase_us` holds the totals in microseconds across
+    all frames rendered.
+
+    With a DamageTracker only the damaged regions are redrawn, and with a display only
+    those regions are pushed to it (the whole frame otherwise). A HitIndex is kept up
+    to date with each frame's rebuild and layout.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        format: PixelFormat = PixelFormat.RGB565,
+        background: int = 0x000000,
+        damage: DamageTracker | None = None,
+        display: HeadlessDisplay | None = None,
+        hit_index: HitIndex | None = None,
+    ) -> None:
+        self.framebuffer = FrameBuffer(width, height, format)
+        self.background = background
+        self.damage = damage
+        self.display = display
+        self.hit_index = hit_index
+        self.frames = 0
+        self.phase_us = {"build": 0, "layout": 0, "raster": 0}
+        # the regions drawn by the last frame
+        self.regions: list[Rect] = []
+
+    def frame(self, root: Widget) -> tuple[int, int, int]:
+        """
+        renders one frame of `root`.
+        :returns: the microseconds spent building, laying out and rasterizing
+        """
+        times = {"build": 0, "layout": 0, "raster": 0}
+        last = ticks_us()
+        phase = "build"
+        for phase_next in self.steps(root):
+            now = ticks_us()
+            times[phase] += ticks_diff(now, last)
+            phase = phase_next
+            last = now
+        times[phase] += ticks_diff(ticks_us(), last)
+
+        phase_us = self.phase_us
+        for name, spent in times.items():
+            phase_us[name] += spent
+        return (times["build"], times["layout"], times["raster"])
+
+    def steps(self, root: Widget, band_rows: int | None = None) -> Iterator[str]:
+        """
+        renders one frame of `root` in resumable chunks: before each chunk it yields the
+        phase the chunk belongs to ("build", "layout" or "raster"), the frame is done
+        when the iterator is exhausted. Building is split between bodies, rasterizing
+        between regions and, with `band_rows`, into bands of at most that many rows.
+        Layout is a single chunk, unless it flags a widget (see below).
+        """
+        framebuffer = self.framebuffer
+        damage = self.damage
+        hit_index = self.hit_index
+
+        # a widget whose children depend on the space it is given (ex: ListView) flags
+        # itself while it is laid out, the frame is then built and laid out again
+        for _ in range(2):
+            yield "build"
+            if damage is None and hit_index is None:
+                for _ in rebuild_steps(root):
+                    yield "build"
+            else:
+                evaluated: list[Widget] = []
+                for _ in rebuild_steps(root, evaluated):
+                    yield "build"
+                if damage is not None:
+                    damage.changed(evaluated)
+                    if not self.frames:
+                        damage.add(framebuffer.bounds)
+                if hit_index is not None:
+                    hit_index.changed(evaluated)
+
+            yield "layout"
+            if hit_index is None:
+                set_move_listener(None if damage is None else damage.moved)
+            elif damage is None:
+                set_move_listener(hit_index.moved)
+            else:
+                set_move_listener(_both(damage.moved, hit_index.moved))
+            try:
+                layout(root, 0, 0, framebuffer.width, framebuffer.height)
+            finally:
+                set_move_listener(None)
+
+            if not (root.state_modified or root._child_modified_):
+                break
+
+        regions = [framebuffer.bounds] if damage is None else damage.collect()
+        self.regions = regions
+        display = self.display
+        for region in regions:
+            for band in _bands(region, band_rows):
+                yield "raster"
+                framebuffer.fill_rect(band, self.background)
+                # the whole frame is drawn without clipping
+                draw(root, framebuffer, None if band == framebuffer.bounds else band)
+                if display is not None:
+                    display.push(framebuffer, band)
+        self.frames += 1
+
+
+def _both(first: MoveListener, second: MoveListener) -> MoveListener:
+    def moved(widget: Widget, old: Rect | None) -> None:
+        first(widget, old)
+        second(widget, old)
+
+    return moved
+
+
+def _bands(region: Rect, rows: int | None) -> Iterator[Rect]:
+    x, y, width, height = region
+    if rows is None or height <= rows:
+        yield region
+        return
+    for top in range(y, y + height, rows):
+        yield (x, top, width, min(rows, y + height - top))
+
+
+cleanup_typing_artifacts(locals())
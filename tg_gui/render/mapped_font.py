@@ -0,0 +1,127 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Bitmap fonts memory mapped from .tgf files (convert BDF fonts with tools/bdf2tgf.py).
+Only the header is read when a font is opened, glyphs are looked up in the file's index
+and returned as memoryview slices of the mapping so large (ex: CJK) fonts cost neither
+load time nor memory for the glyphs that are never drawn.
+
+The file layout, all little endian:
+    header: magic b"TGF1", size u16, line height u16, glyph count u32,
+            default codepoint u32, name (utf-8, zero padded) 16 bytes
+    index:  per glyph, sorted by codepoint:
+            codepoint u32, width u8, height u8, advance u8, (pad) u8, bitmap offset u32
+    bitmaps: 1 bit per pixel, row-major, rows padded to whole bytes, msb first
+"""
+
+from __future__ import annotations
+
+from ..platform_support import cleanup_typing_artifacts, runtime_typing
+
+from struct import unpack_from, calcsize
+
+try:
+    from mmap import mmap, ACCESS_READ
+except ImportError:  # micropython and circuitpython, the file is read instead
+    mmap = None  # type: ignore
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING or runtime_typing():
+    from typing import Any
+
+    __all__ = ("MappedFont", "MAGIC", "HEADER", "ENTRY")
+
+if TYPE_CHECKING:
+    from .font import Glyph
+
+MAGIC = b"TGF1"
+HEADER = "<4sHHII16s"
+ENTRY = "<IBBBxI"
+
+_HEADER_SIZE = calcsize(HEADER)
+_ENTRY_SIZE = calcsize(ENTRY)
+
+
+class MappedFont:
+    """
+    A font backed by a .tgf file, see the module docstring for the format. Codepoints
+    missing from the font are drawn as the font's default glyph.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            if mmap is not None:
+                # the mapping stays valid after the file is closed
+                data: Any = mmap(file.fileno(), 0, access=ACCESS_READ)
+            else:
+                data = file.read()
+
+        magic, size, line_height, count, default, name = unpack_from(HEADER, data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path!r} is not a tg_gui font (.tgf) file")
+
+        self.name: str = _decode_name(name.rstrip(b"\0"))
+        self.size: int = size
+        self.line_height: int = line_height
+        self.count: int = count
+        self._data = data
+        self._view = memoryview(data)
+        self._default = self._find(default)
+
+    def __contains__(self, codepoint: int) -> bool:
+        return self._find(codepoint) >= 0
+
+    def glyph(self, codepoint: int) -> Glyph:
+        index = self._find(codepoint)
+        if index < 0:
+            index = self._default
+            if index < 0:
+                return (0, 0, 0, b"")
+        _, width, height, advance, offset = unpack_from(
+            ENTRY, self._data, _HEADER_SIZE + _ENTRY_SIZE * index
+        )
+        size = (width + 7) // 8 * height
+        return (width, height, advance, self._view[offset : offset + size])
+
+    def close(self) -> None:
+        """unmaps the file, glyphs returned earlier must not be used after this"""
+        view = self._view
+        if hasattr(view, "release"):
+            view.release()
+        if mmap is not None:
+            try:
+                self._data.close()
+            except BufferError:
+                # glyph views are still referenced, it is unmapped once they are freed
+                pass
+
+    def _find(self, codepoint: int) -> int:
+        # binary search of the index, :returns: the glyph's index or -1
+        data = self._data
+        low = 0
+        high = self.count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            found = unpack_from("<I", data, _HEADER_SIZE + _ENTRY_SIZE * middle)[0]
+            if found < codepoint:
+                low = middle + 1
+            elif found > codepoint:
+                high = middle - 1
+            else:
+                return middle
+        return -1
+
+
+def _decode_name(name: bytes) -> str:
+    # older converters cut the name to 16 bytes, possibly inside a utf-8 character
+    while name:
+        try:
+            return name.decode()
+        except UnicodeError:
+            name = name[:-1]
+    return ""
+
+
+cleanup_typing_artifacts(locals())
@@ -1,4 +1,36 @@
 # Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
 # this file is licensed under the MIT License, see the project root.
 
-Text = NotImplemented
+from __future__ import annotations
+from typing import TYPE_CHECKING, Self
+
+from .core.widget import Widget, Body
+from .core.attrdef import AttrDef
+from .render.font import builtin_font
+from .render.atlas import glyph_atlas, shaping_cache
+
+if TYPE_CHECKING:
+    from .render.font import Font
+    from .render.framebuffer import FrameBuffer, Rect
+
+
+class Text(Widget):
+    label: str = AttrDef(required=True)
+    font: Font = AttrDef(default=builtin_font, init=True)
+    color: int = AttrDef(default=0xFFFFFF, init=True)
+
+    body = Body[Self](lambda self: self)
+
+    def _layout_(self, x: int, y: int, width: int, height: int) -> tuple[int, int]:
+        shaped = shaping_cache.shape(self.font, self.label)
+        return (shaped[0], shaped[1])
+
+    def _draw_(self, target: FrameBuffer, clip: Rect | None) -> None:
+        assert self._rect_ is not None
+        font = self.font
+        color = self.color
+        glyph = glyph_atlas.glyph
+        left, top, _, _ = self._rect_
+        for x, y, codepoint in shaping_cache.shape(font, self.label)[2]:
+            width, height, _, bitmap = glyph(font, codepoint)
+            target.blit_mask(left + x, top + y, width, height, bitmap, color, clip)
@@ -0,0 +1,168 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Converts a BDF bitmap font into the .tgf format read by tg_gui.render.MappedFont.
+PCF fonts can be converted to BDF first with `pcf2bdf`.
+
+usage: python -m tools.bdf2tgf <font.bdf> <font.tgf> [--name NAME]
+
+Each glyph is stored as a bitmap one line tall (the font's ascent plus descent) with its
+bounding box offsets applied, so glyphs can be drawn at the top of the line without
+any per glyph offsets.
+"""
+
+from __future__ import annotations
+
+import sys
+from struct import pack, calcsize
+
+from tg_gui.render.mapped_font import MAGIC, HEADER, ENTRY
+
+# (width, height, advance, bitmap)
+Glyph = tuple[int, int, int, bytes]
+
+
+class BDFFont:
+    def __init__(self) -> None:
+        self.name = ""
+        self.size = 0
+        self.ascent = 0
+        self.descent = 0
+        self.default = 0x3F  # "?"
+        self.glyphs: dict[int, Glyph] = {}
+
+    @property
+    def line_height(self) -> int:
+        return self.ascent + self.descent
+
+
+def parse_bdf(path: str) -> BDFFont:
+    """parses a BDF font into python objects, every glyph is decoded up front"""
+    font = BDFFont()
+    bounds = (0, 0, 0, 0)
+    with open(path, "r", encoding="latin-1") as file:
+        lines = iter(file)
+        for line in lines:
+            keyword, _, rest = line.strip().partition(" ")
+            if keyword == "FONT":
+                font.name = rest
+            elif keyword == "SIZE":
+                font.size = int(rest.split()[0])
+            elif keyword == "FONTBOUNDINGBOX":
+                bounds = tuple(map(int, rest.split()))  # type: ignore
+            elif keyword == "FONT_ASCENT":
+                font.ascent = int(rest)
+            elif keyword == "FONT_DESCENT":
+                font.descent = int(rest)
+            elif keyword == "DEFAULT_CHAR":
+                font.default = int(rest)
+            elif keyword == "STARTCHAR":
+                if not font.ascent and not font.descent:
+                    font.ascent = bounds[1] + bounds[3]
+                    font.descent = -bounds[3]
+                codepoint, glyph = _parse_char(lines, font)
+                if codepoint >= 0:
+                    font.glyphs[codepoint] = glyph
+    return font
+
+
+def _parse_char(lines: object, font: BDFFont) -> tuple[int, Glyph]:
+    codepoint = -1
+    advance = 0
+    box_width = box_height = x_offset = y_offset = 0
+    rows: list[int] = []
+    for line in lines:  # type: ignore
+        keyword, _, rest = line.strip().partition(" ")
+        if keyword == "ENCODING":
+            codepoint = int(rest.split()[0])
+        elif keyword == "DWIDTH":
+            advance = int(rest.split()[0])
+        elif keyword == "BBX":
+            box_width, box_height, x_offset, y_offset = map(int, rest.split())
+        elif keyword == "BITMAP":
+            for row in lines:  # type: ignore
+                row = row.strip()
+                if row == "ENDCHAR":
+                    break
+                # keep the leftmost `box_width` bits of the (byte padded) hex row
+                rows.append(int(row, 16) >> (len(row) * 4 - box_width))
+            break
+
+    # place the bounding box on a full line tall bitmap, relative to the baseline
+    x_offset = max(0, x_offset)
+    width = x_offset + box_width
+    height = font.line_height
+    stride = (width + 7) // 8
+    bitmap = bytearray(stride * height)
+    top = font.ascent - y_offset - box_height
+    for index, bits in enumerate(rows):
+        row = top + index
+        if not 0 <= row < height:
+            continue
+        shifted = bits << (stride * 8 - width)
+        bitmap[row * stride : (row + 1) * stride] = shifted.to_bytes(stride, "big")
+    return codepoint, (width, height, advance, bytes(bitmap))
+
+
+def _truncate(text: str, size: int) -> bytes:
+    # cuts the utf-8 encoding of `text` to `size` bytes without splitting a character
+    encoded = text.encode()
+    while len(encoded) > size:
+        text = text[:-1]
+        encoded = text.encode()
+    return encoded
+
+
+def write_tgf(path: str, font: BDFFont, name: str | None = None) -> int:
+    """writes `font` as a .tgf file, :returns: the file size in bytes"""
+    codepoints = sorted(font.glyphs)
+    offset = calcsize(HEADER) + calcsize(ENTRY) * len(codepoints)
+    index: list[bytes] = []
+    bitmaps: list[bytes] = []
+    for codepoint in codepoints:
+        width, height, advance, bitmap = font.glyphs[codepoint]
+        if width > 255 or height > 255 or advance > 255:
+            raise ValueError(f"glyph {codepoint:#x} is too large for the .tgf format")
+        index.append(pack(ENTRY, codepoint, width, height, advance, offset))
+        bitmaps.append(bitmap)
+        offset += len(bitmap)
+
+    encoded_name = _truncate((font.name if name is None else name), 16)
+    header = pack(
+        HEADER,
+        MAGIC,
+        font.size,
+        font.line_height,
+        len(codepoints),
+        font.default,
+        encoded_name,
+    )
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(b"".join(index))
+        file.write(b"".join(bitmaps))
+    return offset
+
+
+def convert(source: str, destination: str, name: str | None = None) -> int:
+    return write_tgf(destination, parse_bdf(source), name)
+
+
+def main(argv: list[str]) -> int:
+    name = None
+    if "--name" in argv:
+        at = argv.index("--name")
+        name = argv[at + 1]
+        del argv[at : at + 2]
+    if len(argv) != 2:
+        print(__doc__.strip().splitlines()[3], file=sys.stderr)
+        return 2
+
+    size = convert(argv[0], argv[1], name)
+    print(f"wrote {argv[1]} ({size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
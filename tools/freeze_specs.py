@@ -0,0 +1,141 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Precomputes the attribute and argument tables and the specialized constructor of every
+widget class of an application, so the device reads them instead of resolving the
+tables and compiling the constructors on every boot (see Widget.__init_subclass__ and
+core/specialize.py).
+
+usage: python -m tools.freeze_specs <out file> <module> [<module> ...]
+
+Imports tg_gui and the given application modules on cpython and writes a module with
+each widget class's attribute names (in `_attr_specs_` order), argument names (in
+argument order) and constructor, as code. Deploy it as `tg_gui/_frozen_specs.py`,
+compiled with mpy-cross or frozen into the firmware so the constructors are not
+compiled on the device either. This also gives ports without a compiler specialized
+constructors.
+
+Classes are matched by module and name, classes in the script run as `__main__` are
+not matched. A frozen constructor is only used if its source is the one the device
+generates and a class the tables no longer fit (ex: an attribute was added) resolves
+its own, but reordering attributes is not detected: regenerate the module whenever a
+widget class changes.
+"""
+
+from __future__ import annotations
+
+import sys
+import pkgutil
+import importlib
+
+# the tables are resolved from scratch, not read from a previous freeze
+sys.modules["tg_gui._frozen_specs"] = None  # type: ignore
+
+import tg_gui
+from tg_gui.core.widget import Widget
+from tg_gui.core.frozen import frozen_key
+from tg_gui.core.specialize import init_source
+
+# (attribute names, argument names, constructor source and namespace names if the class
+# uses a specialized constructor)
+Entry = tuple[tuple[str, ...], tuple[str, ...], "tuple[str, tuple[str, ...]] | None"]
+
+
+def import_all(modules: list[str]) -> None:
+    """imports every tg_gui module and then `modules`"""
+    for info in pkgutil.walk_packages(tg_gui.__path__, "tg_gui."):
+        importlib.import_module(info.name)
+    for module in modules:
+        importlib.import_module(module)
+
+
+def widget_classes() -> list[type[Widget]]:
+    found: list[type[Widget]] = []
+    stack = [Widget]
+    while stack:
+        cls = stack.pop()
+        for subclass in cls.__subclasses__():
+            if subclass not in found:
+                found.append(subclass)
+                stack.append(subclass)
+    return found
+
+
+def freeze() -> dict[str, Entry]:
+    """
+    :returns: the tables of the imported widget classes that resolve their own, by
+    "module.Class". Classes that cannot be told apart by module and name (ex: defined
+    in a function) are left out and resolve their tables on the device
+    """
+    specs: dict[str, Entry] = {}
+    clashes: set[str] = set()
+    for cls in widget_classes():
+        if "_attr_specs_" not in cls.__dict__:
+            continue  # shares its base's tables
+        key = frozen_key(cls)
+        if key in specs or "<locals>" in cls.__qualname__:
+            clashes.add(key)
+        init = None
+        if "_specialized_init_" in cls.__dict__:
+            source, namespace = init_source(cls)
+            init = (source, tuple(sorted(namespace)))
+        specs[key] = (
+            tuple(cls._attr_specs_),
+            tuple(spec.name for spec in cls._arg_specs_),
+            init,
+        )
+    for key in clashes:
+        specs.pop(key, None)
+    return specs
+
+
+def render(specs: dict[str, Entry], modules: list[str]) -> str:
+    lines = [
+        f"# generated by `python -m tools.freeze_specs ... {' '.join(modules)}`, do not"
+        + " edit. see tg_gui/core/frozen.py",
+        "",
+    ]
+    keys = sorted(specs)
+    with_init = [key for key in keys if specs[key][2] is not None]
+
+    # each constructor is made by a function taking the objects it refers to
+    for index, key in enumerate(with_init):
+        source, names = specs[key][2]  # type: ignore
+        lines.append(f"def _init{index}({', '.join(names)}):")
+        lines.extend("    " + line for line in source.splitlines())
+        lines.append("    return __init__")
+        lines.append("")
+
+    lines.append("# (attribute names, argument names) of each widget class")
+    lines.append("specs = {")
+    for key in keys:
+        attr_names, arg_names, _ = specs[key]
+        lines.append(f"    {key!r}: ({attr_names!r}, {arg_names!r}),")
+    lines.append("}")
+    lines.append("")
+    lines.append("# (constructor source, constructor maker) of each widget class")
+    lines.append("inits = {")
+    for index, key in enumerate(with_init):
+        source = specs[key][2][0]  # type: ignore
+        lines.append(f"    {key!r}: ({source!r}, _init{index}),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) < 1:
+        print(__doc__.strip().splitlines()[5], file=sys.stderr)
+        return 2
+    out, modules = argv[0], argv[1:]
+    import_all(modules)
+    specs = freeze()
+    with open(out, "w", encoding="utf-8") as handle:
+        handle.write(render(specs, modules))
+    inits = sum(entry[2] is not None for entry in specs.values())
+    print(f"froze {len(specs)} widget classes ({inits} constructors) to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,300 @@
+# Copyright (C) 2023 Jonah 'Jay' Yolles-Murphy (@TG-Techie)
+# this file is licensed under the MIT License, see the project root.
+
+"""
+Strips the typing code out of a source tree before it is deployed to a device, so the
+device neither loads nor cleans up after it (see cleanup_typing_artifacts).
+
+usage: python -m tools.strip_typing <src dir> [<out dir>]
+
+Removes `if TYPE_CHECKING:` blocks (keeping their `else:`), including the
+`TYPE_CHECKING or runtime_typing()` blocks that are false on the device,
+`cleanup_typing_artifacts(...)` calls, annotations, `@dataclass_transform(...)`
+decorators and then the `X = TypeVar(...)` definitions and typing imports left unused
+(`Self` is kept). `Generic[...]` and `Protocol` bases are kept, subclasses may
+subscript the class at runtime.
+
+Without an output directory only the report is printed: the source and bytecode bytes
+saved per module. The source is re-generated from the syntax tree, the "typing" column
+compares it before and after stripping so comments and formatting do not count.
+"""
+
+from __future__ import annotations
+
+import ast
+import marshal
+import os
+import sys
+
+# the modules and helpers the typing code comes from
+TYPING_MODULES = ("typing", "__future__")
+TYPING_HELPERS = ("cleanup_typing_artifacts", "runtime_typing", "typing_standin")
+# decorators that only inform the type checker
+STRIPPED_DECORATORS = ("dataclass_transform",)
+# used at runtime by `Body[Self]` and re-exported by the prelude, never removed
+KEPT_NAMES = ("Self",)
+
+
+class TypingStripper(ast.NodeTransformer):
+    def __init__(self) -> None:
+        # local name -> the typing name it is bound to
+        self.typing_names: dict[str, str] = {}
+
+    # --- imports ---
+
+    def collect_imports(self, tree: ast.Module) -> None:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and _is_typing_import(node):
+                for alias in node.names:
+                    self.typing_names[alias.asname or alias.name] = alias.name
+
+    def _is_typing_name(self, node: ast.expr, *names: str) -> bool:
+        if isinstance(node, ast.Subscript):
+            node = node.value
+        if isinstance(node, ast.Name):
+            return self.typing_names.get(node.id) in names
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            return node.value.id == "typing" and node.attr in names
+        return False
+
+    def _is_typing_only(self, test: ast.expr) -> bool | None:
+        # True for conditions only true when type checking, False for their negation
+        if self._is_typing_name(test, "TYPE_CHECKING"):
+            return True
+        if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+            inner = self._is_typing_only(test.operand)
+            return None if inner is None else not inner
+        if isinstance(test, ast.BoolOp) and isinstance(test.op, ast.Or):
+            if all(
+                self._is_typing_only(value) or _is_helper_call(value)
+                for value in test.values
+            ):
+                return True
+        return None
+
+    # --- statements ---
+
+    def visit_If(self, node: ast.If) -> ast.AST | list[ast.stmt] | None:
+        typing_only = self._is_typing_only(node.test)
+        if typing_only is None:
+            return self.generic_visit(node)
+        kept: list[ast.stmt] = []
+        for stmt in node.orelse if typing_only else node.body:
+            new = self.visit(stmt)
+            if isinstance(new, list):
+                kept += new
+            elif new is not None:
+                kept.append(new)
+        return kept or None
+
+    def visit_Expr(self, node: ast.Expr) -> ast.AST | None:
+        value = node.value
+        if isinstance(value, ast.Call) and _is_helper_call(value):
+            return None
+        return self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> ast.AST | None:
+        if node.value is None:
+            return None
+        assign = ast.Assign(targets=[node.target], value=node.value)
+        return self.visit(ast.copy_location(assign, node))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> ast.AST | None:
+        # `from __future__ import annotations` is only needed for the annotations
+        if node.module == "__future__":
+            return None
+        return node
+
+    def _strip_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> ast.AST:
+        node.returns = None
+        arguments = node.args
+        for arg in arguments.posonlyargs + arguments.args + arguments.kwonlyargs:
+            arg.annotation = None
+        for arg in (arguments.vararg, arguments.kwarg):
+            if arg is not None:
+                arg.annotation = None
+        node.decorator_list = [
+            decorator
+            for decorator in node.decorator_list
+            if not self._is_typing_name(_callee(decorator), *STRIPPED_DECORATORS)
+        ]
+        self.generic_visit(node)
+        if not node.body:
+            node.body = [ast.Pass()]
+        return node
+
+    visit_FunctionDef = _strip_function
+    visit_AsyncFunctionDef = _strip_function
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:
+        # Generic and Protocol bases are kept, subclasses may subscript the class
+        node.decorator_list = [
+            decorator
+            for decorator in node.decorator_list
+            if not self._is_typing_name(_callee(decorator), *STRIPPED_DECORATORS)
+        ]
+        self.generic_visit(node)
+        if not node.body:
+            node.body = [ast.Pass()]
+        return node
+
+
+def _callee(node: ast.expr) -> ast.expr:
+    return node.func if isinstance(node, ast.Call) else node
+
+
+def _is_helper_call(node: ast.expr) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+    return name is not None and name.lstrip("_") in TYPING_HELPERS
+
+
+def _is_typing_import(node: ast.ImportFrom) -> bool:
+    return node.module in TYPING_MODULES
+
+
+def _used_names(tree: ast.Module) -> set[str]:
+    used = {
+        node.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Store)
+    }
+    # names listed in strings (ex: __all__) count as used
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            used.add(node.value)
+    return used
+
+
+def _remove_unused(tree: ast.Module, typing_names: dict[str, str]) -> None:
+    # drops the TypeVars only the annotations used, then the typing names (and
+    # helpers) that are no longer referenced
+    used = _used_names(tree)
+    tree.body = [
+        node
+        for node in tree.body
+        if not (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Name)
+            and typing_names.get(node.value.func.id) == "TypeVar"
+            and all(
+                isinstance(target, ast.Name) and target.id not in used
+                for target in node.targets
+            )
+        )
+    ]
+    used = _used_names(tree)
+
+    class Remover(ast.NodeTransformer):
+        def visit_ImportFrom(self, node: ast.ImportFrom) -> ast.AST | None:
+            typing = _is_typing_import(node)
+            names = [
+                alias
+                for alias in node.names
+                if (alias.asname or alias.name) in used
+                or alias.name in KEPT_NAMES
+                or not (typing or alias.name in TYPING_HELPERS)
+            ]
+            if not names:
+                return None
+            node.names = names
+            return node
+
+        def visit_Import(self, node: ast.Import) -> ast.AST | None:
+            names = [
+                alias
+                for alias in node.names
+                if alias.name != "typing" or (alias.asname or alias.name) in used
+            ]
+            if not names:
+                return None
+            node.names = names
+            return node
+
+    Remover().visit(tree)
+    _fill_empty_bodies(tree)
+
+
+def _fill_empty_bodies(tree: ast.AST) -> None:
+    for node in ast.walk(tree):
+        for field in ("body", "orelse", "finalbody"):
+            body = getattr(node, field, None)
+            if body == [] and field == "body" and not isinstance(node, ast.Module):
+                setattr(node, field, [ast.Pass()])
+
+
+def strip_source(source: str, filename: str = "<module>") -> str:
+    """:returns: `source` with its typing code removed, see the module docstring"""
+    tree = ast.parse(source, filename)
+    stripper = TypingStripper()
+    stripper.collect_imports(tree)
+    tree = stripper.visit(tree)
+    _remove_unused(tree, stripper.typing_names)
+    ast.fix_missing_locations(tree)
+    return ast.unparse(tree) + "\n"
+
+
+def bytecode_size(source: str, filename: str) -> int:
+    return len(marshal.dumps(compile(source, filename, "exec")))
+
+
+def strip_tree(src: str, out: str | None) -> list[tuple[object, ...]]:
+    """
+    strips every .py module under `src`, writing them under `out` if given.
+    :returns: (module, source bytes, stripped bytes, typing bytes saved, bytecode
+    bytes, stripped bytecode bytes) per module
+    """
+    rows: list[tuple[object, ...]] = []
+    for folder, dirs, files in os.walk(src):
+        dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+        for file in sorted(files):
+            if not file.endswith(".py"):
+                continue
+            path = os.path.join(folder, file)
+            with open(path, encoding="utf-8") as handle:
+                source = handle.read()
+            stripped = strip_source(source, path)
+            regenerated = ast.unparse(ast.parse(source, path)) + "\n"
+            rows.append(
+                (
+                    os.path.relpath(path, src),
+                    len(source.encode()),
+                    len(stripped.encode()),
+                    len(regenerated.encode()) - len(stripped.encode()),
+                    bytecode_size(source, path),
+                    bytecode_size(stripped, path),
+                )
+            )
+            if out is not None:
+                target = os.path.join(out, os.path.relpath(path, src))
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, "w", encoding="utf-8") as handle:
+                    handle.write(stripped)
+    return rows
+
+
+def report(rows: list[tuple[object, ...]]) -> None:
+    headers = ("module", "source", "stripped", "typing saved", "bytecode", "stripped")
+    totals = ("total", *(sum(row[col] for row in rows) for col in range(1, 6)))
+    cells = [headers] + [tuple(map(str, row)) for row in rows + [totals]]
+    widths = [max(len(row[col]) for row in cells) for col in range(len(headers))]
+    for index, row in enumerate(cells):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) not in (1, 2):
+        print(__doc__.strip().splitlines()[3], file=sys.stderr)
+        return 2
+    rows = strip_tree(argv[0], argv[1] if len(argv) == 2 else None)
+    report(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))